@@ -0,0 +1,2992 @@
+"""The Tk user interface of RandPyPwGen. Started by main.py"""
+
+import sys
+import functools
+import logging
+import time
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Tuple, Dict, Any, Callable
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog, colorchooser
+from datetime import datetime
+import re
+import bisect
+from vault import (DatabaseManager, GroupExistsError, OperationCancelled, PasswordGenerator, Record,
+                   RecordChanges, VaultError, VaultNotFound, export_records_csv, iter_import_rows)
+from vault import instrument
+from themes import THEMES
+
+logger = logging.getLogger(__name__)
+
+
+class MasterPasswordSetup:
+    """Window that asks for the first master password"""
+    
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self.success = False
+        self.password_entry = None
+        self.window = tk.Tk()
+        self.window.title('RandPyPwGen Setup')
+        self.window.geometry('400x200')
+        self.window.resizable(True, True)
+        
+        self.window.update_idletasks()
+        x = (self.window.winfo_screenwidth() // 2) - (400 // 2)
+        y = (self.window.winfo_screenheight() // 2) - (200 // 2)
+        self.window.geometry(f'400x200+{x}+{y}')
+        
+        self._create_widgets()
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
+    
+    def _create_widgets(self):
+        main_frame = tk.Frame(self.window, padx=20, pady=20)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        title_label = tk.Label(main_frame, text="Welcome to RandPyPwGen Setup", 
+                             font=("Arial", 12, "bold"))
+        title_label.pack(pady=(0, 20))
+        
+        instruction_label = tk.Label(main_frame, text="Enter master password:")
+        instruction_label.pack(pady=(0, 10))
+        
+        self.password_entry = tk.Entry(main_frame, show='*', width=30, font=("Arial", 10))
+        self.password_entry.pack(pady=(0, 20))
+        self.password_entry.focus_set()
+        
+        button_frame = tk.Frame(main_frame)
+        button_frame.pack()
+        
+        setup_btn = tk.Button(button_frame, text="Setup", command=self._setup_password,
+                            font=("Arial", 10), padx=20)
+        setup_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        exit_btn = tk.Button(button_frame, text="Exit", command=self._on_close,
+                           font=("Arial", 10), padx=20)
+        exit_btn.pack(side=tk.LEFT)
+        
+        self.window.bind('<Return>', lambda e: self._setup_password())
+        self.password_entry.bind('<Return>', lambda e: self._setup_password())
+    
+    def _setup_password(self):
+        if self.password_entry is None:
+            messagebox.showerror("Error", "Internal error: password entry not found")
+            return
+        
+        try:
+            password = self.password_entry.get()
+            
+            if not password:
+                messagebox.showerror("Error", "Password cannot be empty!")
+                self.password_entry.focus_set()
+                return
+            
+            password = password.strip()
+            
+            if not password:
+                messagebox.showerror("Error", "Password cannot be empty!")
+                self.password_entry.focus_set()
+                return
+            
+            if len(password) < 4:
+                messagebox.showerror("Error", "Password must be at least 4 characters long!")
+                self.password_entry.focus_set()
+                return
+            
+            self.db_manager._create_master_password(password)
+            
+            messagebox.showinfo("Success", "Master password set successfully!")
+            self.success = True
+            self.window.quit()
+            self.window.destroy()
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to set master password: {str(e)}")
+    
+    def _on_close(self):
+        self.window.quit()
+        self.window.destroy()
+    
+    def run(self):
+        self.window.mainloop()
+        return self.success
+
+
+def _shows_errors(method, failed=None, title: str = "Database Error"):
+    """Wrap a DatabaseManager method to show a VaultError in a message box and return failed
+    instead (called first if it's callable, so each failure gets a fresh list)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except GroupExistsError as e:
+            messagebox.showerror("Error", str(e))
+        except VaultError as e:
+            messagebox.showerror(title, str(e))
+        return failed() if callable(failed) else failed
+    return wrapper
+
+
+class TkDatabaseManager(DatabaseManager):
+    """DatabaseManager as the Tk code uses it: errors are shown in message boxes and the method
+    returns a failure value, and the first master password is asked for in a window"""
+    
+    INTERACTIVE_SETUP = True
+    
+    save_custom_theme = _shows_errors(DatabaseManager.save_custom_theme, False)
+    delete_custom_theme = _shows_errors(DatabaseManager.delete_custom_theme, False)
+    get_all_records = _shows_errors(DatabaseManager.get_all_records, list)
+    get_records_page = _shows_errors(DatabaseManager.get_records_page, list)
+    get_records_by_ids = _shows_errors(DatabaseManager.get_records_by_ids, list)
+    get_record_by_id = _shows_errors(DatabaseManager.get_record_by_id)
+    search_records = _shows_errors(DatabaseManager.search_records, list, "Search Error")
+    add_group = _shows_errors(DatabaseManager.add_group, False)
+    delete_group = _shows_errors(DatabaseManager.delete_group, False)
+    rename_group = _shows_errors(DatabaseManager.rename_group, False)
+    add_record = _shows_errors(DatabaseManager.add_record)
+    update_record = _shows_errors(DatabaseManager.update_record, False)
+    delete_record = _shows_errors(DatabaseManager.delete_record, False)
+    
+    def _setup_master_password(self) -> bool:
+        """Create initial master password"""
+        return MasterPasswordSetup(self).run()
+
+
+class BackgroundTask:
+    """Handle for work submitted to a TaskRunner"""
+    
+    def __init__(self, runner: 'TaskRunner', on_progress: Optional[Callable] = None):
+        self._runner = runner
+        self._on_progress = on_progress
+        self._cancelled = threading.Event()
+    
+    def cancel(self):
+        """Ask the work to stop. It stops at its next check of is_cancelled()"""
+        self._cancelled.set()
+    
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+    
+    def report(self, value):
+        """Pass progress from the worker to the on_progress callback"""
+        if self._on_progress and not self.is_cancelled():
+            self._runner._post(self._on_progress, value)
+
+
+class TaskRunner:
+    """Runs slow database, crypto and file work on a thread pool so the window stays responsive.
+    
+    Tk may only be used from the thread running mainloop, so workers queue their callbacks
+    and a short after() loop on the Tk thread delivers them.
+    """
+    
+    POLL_MS = 50
+    
+    def __init__(self, root: tk.Misc, max_workers: int = 2):
+        self.root = root
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task")
+        self._callbacks: queue.SimpleQueue = queue.SimpleQueue()
+        self._active: set = set()
+        self._poll_job = None
+    
+    def submit(self, work: Callable[[BackgroundTask], Any], on_done: Optional[Callable] = None,
+               on_error: Optional[Callable] = None, on_progress: Optional[Callable] = None) -> BackgroundTask:
+        """Run work(task) on a worker thread.
+        
+        on_done(result), on_error(exception) and on_progress(value) are called on the Tk thread.
+        A cancelled task that stops early reports OperationCancelled to on_error.
+        """
+        task = BackgroundTask(self, on_progress)
+        self._active.add(task)
+        
+        def run():
+            try:
+                result = work(task)
+            except Exception as e:
+                self._post(self._finish, task, on_error or self._report_error, e)
+            else:
+                self._post(self._finish, task, on_done, result)
+        
+        self._executor.submit(run)
+        if self._poll_job is None:
+            self._poll()
+        return task
+    
+    def cancel_all(self):
+        for task in self._active:
+            task.cancel()
+    
+    def shutdown(self):
+        """Cancel running work and wait for the workers to stop"""
+        self.cancel_all()
+        self._executor.shutdown(wait=True)
+        if self._poll_job:
+            self.root.after_cancel(self._poll_job)
+            self._poll_job = None
+    
+    def _post(self, callback: Callable, *args):
+        self._callbacks.put((callback, args))
+    
+    def _finish(self, task: BackgroundTask, callback: Optional[Callable], value):
+        self._active.discard(task)
+        if callback:
+            callback(value)
+    
+    def _report_error(self, error: Exception):
+        if not isinstance(error, OperationCancelled):
+            logger.error("Background task failed", exc_info=error)
+    
+    def _poll(self):
+        """Deliver queued callbacks, and keep polling while work is running"""
+        self._poll_job = None
+        while True:
+            try:
+                callback, args = self._callbacks.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception:
+                logger.exception("Error in background task callback")
+        
+        if self._active:
+            self._poll_job = self.root.after(self.POLL_MS, self._poll)
+
+
+class ThemedWidget:
+    """Class for theme widgets"""
+    
+    def apply_theme(self, theme_name: str):
+        """Apply theme to widget"""
+        pass
+    
+
+def _copy_to_clipboard(text: str):
+    """Copy text to the clipboard. pyperclip is loaded on first use rather than at startup"""
+    import pyperclip
+    pyperclip.copy(text)
+
+
+def _get_all_themes(db_manager) -> dict:
+    """Return dict of stock themes + custom themes"""
+    merged = dict(THEMES)
+    merged.update(db_manager.get_custom_themes())
+    return merged
+
+class LoginFrame(ttk.Frame, ThemedWidget):
+    """Frame for master password authentication"""
+    
+    def __init__(self, parent, db_manager, on_success_callback, tasks):
+        super().__init__(parent, padding="20")
+        self.db_manager = db_manager
+        self.on_success_callback = on_success_callback
+        self.tasks = tasks
+        self._unlocking = False
+        self._create_widgets()
+        self._apply_current_theme()
+    
+    def _create_widgets(self):
+            self.grid_columnconfigure(0, weight=1)
+            self.grid_columnconfigure(1, weight=1)
+            
+            self.title_label = ttk.Label(self, text="RandPyPwGen", font=("Arial", 16, "bold"))
+            self.title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
+            
+            self.password_label = ttk.Label(self, text="Master Password:")
+            self.password_label.grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=5)
+            
+            self.password_var = tk.StringVar()
+            self.password_entry = ttk.Entry(self, textvariable=self.password_var, show='*', width=30)
+            self.password_entry.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
+            self.password_entry.focus()
+            
+            button_frame = ttk.Frame(self)
+            button_frame.grid(row=3, column=0, columnspan=2, pady=(20, 0))
+            
+            self.unlock_button = ttk.Button(button_frame, text="Unlock", command=self._authenticate)
+            self.unlock_button.pack(side=tk.LEFT, padx=(0, 10))
+            ttk.Button(button_frame, text="Exit", command=self.quit).pack(side=tk.LEFT)
+            
+            self.status_var = tk.StringVar()
+            self.status_label = ttk.Label(self, textvariable=self.status_var, font=("Arial", 8))
+            self.status_label.grid(row=4, column=0, columnspan=2, pady=(10, 0))
+            
+            self.password_entry.bind('<Return>', lambda e: self._authenticate())
+    
+    def _authenticate(self):
+        """Check the password on a worker, then load the main window's data on the same worker"""
+        if self._unlocking:
+            return
+        
+        password = self.password_var.get()
+        self._set_busy(True)
+        self.tasks.submit(lambda task: self._unlock_and_warm_up(password), on_done=self._unlock_done,
+                          on_error=self._unlock_failed)
+    
+    def _unlock_and_warm_up(self, password: str) -> bool:
+        """Runs on a worker. Warming up after unlock() rather than alongside it means the two
+        never fill the caches at the same time, and nothing is loaded for a wrong password"""
+        if not self.db_manager.unlock(password):
+            return False
+        
+        try:
+            self.db_manager.warm_up()
+        except Exception:
+            logger.exception("Could not preload the vault")
+        return True
+    
+    def _unlock_done(self, unlocked: bool):
+        self._set_busy(False)
+        if unlocked:
+            self.on_success_callback()
+            return
+        
+        messagebox.showerror("Authentication Failed", "Incorrect master password.")
+        self.password_var.set("")
+        self.password_entry.focus()
+    
+    def _unlock_failed(self, error: Exception):
+        self._set_busy(False)
+        self.db_manager.lock()
+        messagebox.showerror("Encryption Error", f"Failed to unlock the vault: {str(error)}")
+    
+    def _set_busy(self, busy: bool):
+        """Block input and show progress while the password is being checked"""
+        self._unlocking = busy
+        state = 'disabled' if busy else 'normal'
+        self.password_entry.config(state=state)
+        self.unlock_button.config(state=state)
+        self.status_var.set("Unlocking..." if busy else "")
+        self.winfo_toplevel().config(cursor='watch' if busy else '')
+    
+    def _apply_current_theme(self):
+        """Apply the saved theme"""
+        theme_name = self.db_manager.get_setting('theme', 'Light')
+        self.apply_theme(theme_name)
+    
+    def apply_theme(self, theme_name: str):
+        """Apply theme to login frame"""
+        all_themes = _get_all_themes(self.db_manager)
+        if theme_name not in all_themes:
+            theme_name = 'Light'
+        theme = all_themes[theme_name]
+        
+        # Configure ttk styles with unique style names for login
+        style = ttk.Style()
+        style.theme_use('clam')
+        
+        # Frame styles
+        style.configure('Login.TFrame', background=theme['bg'])
+        
+        # Label styles  
+        style.configure('Login.TLabel', background=theme['bg'], foreground=theme['fg'])
+        style.configure('LoginTitle.TLabel', background=theme['bg'], foreground=theme['accent'], 
+                       font=("Arial", 16, "bold"))
+        
+        # Entry styles
+        style.configure('Login.TEntry', fieldbackground=theme['entry_bg'], foreground=theme['entry_fg'],
+                       insertcolor=theme['fg'])
+        
+        # Button styles
+        style.configure('Login.TButton', background=theme['button_bg'], foreground=theme['button_fg'])
+        style.map('Login.TButton',
+                 background=[('active', theme['accent']), ('pressed', theme['accent'])],
+                 foreground=[('active', theme['button_fg']), ('pressed', theme['button_fg'])])
+        
+        # Apply styles to widgets
+        self.configure(style='Login.TFrame')
+        self.title_label.configure(style='LoginTitle.TLabel')
+        self.password_label.configure(style='Login.TLabel')
+        self.password_entry.configure(style='Login.TEntry')
+        self.status_label.configure(style='Login.TLabel')
+        
+        # Apply to root window
+        self.master.configure(bg=theme['bg'])
+
+
+class MainFrame(ttk.Frame, ThemedWidget):
+    """Main app frame"""
+    
+    PAGE_SIZE = 200
+    SEARCH_DELAY_MS = 150
+    # Input anywhere in the app, dialogs included, that counts as activity for auto-lock
+    ACTIVITY_EVENTS = ('<KeyPress>', '<ButtonPress>', '<Motion>', '<MouseWheel>')
+    # Seen by a watched widget when the pointer or focus moves on, maybe to a widget created since
+    RETAG_EVENTS = ('<Leave>', '<FocusOut>')
+    
+    def __init__(self, parent, db_manager, lock_callback, tasks):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.lock_callback = lock_callback
+        self.tasks = tasks
+        self.password_generator = PasswordGenerator()
+        self.passwords_visible = False # Set to False; Fixes issue #155 @KirillZhosul
+        self.revealed_passwords: Dict[int, str] = {}
+        self._reveal_job = None
+        self.current_group = "All"
+        self.search_term: Optional[str] = None
+        self._search_ids: Optional[List[int]] = None
+        self._search_key: Optional[Tuple[str, str]] = None
+        self._search_job = None
+        self._current_generated_password = ''
+        
+        self._last_loaded_id = 0
+        self._more_rows = False
+        self._page_job = None
+        
+        self.auto_lock_timer = None
+        self.last_activity_time = None
+        self._auto_lock_seconds: Optional[int] = None
+        # Bind tag of our own that every widget gets, so the activity bindings don't touch
+        # those of 'all' or any window, and destroy() can remove them whole
+        self._activity_tag = f"Activity{id(self)}"
+        self._activity_funcids: List[str] = []
+        
+        self._create_widgets()
+        self.db_manager.take_changes()
+        self._populate_treeview()
+        self._start_activity_monitoring()
+        self._apply_current_theme()
+        self.db_manager.settings.subscribe('theme', self.apply_theme)
+    
+    def destroy(self):
+        self.db_manager.settings.unsubscribe('theme', self.apply_theme)
+        self.db_manager.settings.unsubscribe('auto_lock_enabled', self._on_auto_lock_setting)
+        self.db_manager.settings.unsubscribe('auto_lock_minutes', self._on_auto_lock_setting)
+        for sequence in self.ACTIVITY_EVENTS + self.RETAG_EVENTS:
+            self.unbind_class(self._activity_tag, sequence)
+        # bind_class() registers the callbacks with the root window
+        for funcid in self._activity_funcids:
+            self._root().deletecommand(funcid)
+        self._activity_funcids = []
+        self._tag_widgets(False)
+        super().destroy()
+    
+    def _create_widgets(self):
+        self.grid_rowconfigure(3, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_columnconfigure(1, weight=1)
+        self.grid_columnconfigure(2, weight=1)
+        self.grid_columnconfigure(3, weight=1)
+        
+        self._create_password_generation_section()
+        self._create_group_filter_section()
+        self._create_search_section()
+        self._create_treeview_section()
+        self._create_button_section()
+        self._create_menu()
+    
+    def _create_password_generation_section(self):
+        """Create password generation section. This is the top frame"""
+        gen_frame = ttk.LabelFrame(self, text="Password Generation", padding="10")
+        gen_frame.grid(row=0, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=(0, 10))
+        gen_frame.grid_columnconfigure(1, weight=1)
+        
+        ttk.Label(gen_frame, text="Password Length:").grid(row=0, column=0, sticky=tk.W, padx=(0, 10))
+        
+        self.length_var = tk.StringVar()
+        length_entry = ttk.Entry(gen_frame, textvariable=self.length_var, width=10)
+        length_entry.grid(row=0, column=1, sticky=tk.W, padx=(0, 10))
+        
+        ttk.Button(gen_frame, text="Generate", command=self._generate_password).grid(
+            row=0, column=2, padx=(0, 10))
+        ttk.Button(gen_frame, text="Add to DB", command=self._show_add_dialog).grid(
+            row=0, column=3, padx=(0, 10))
+        ttk.Button(gen_frame, text="Copy", command=self._copy_generated_password).grid(
+                    row=0, column=4, padx=(0, 10))
+        ttk.Button(gen_frame, text="Clear", command=self._clear_password).grid(
+            row=0, column=5)
+        self.use_special_flag = tk.BooleanVar(value=True)
+        ttk.Checkbutton(gen_frame, text="Use special characters", variable=self.use_special_flag).grid(row=2, column=2, padx=(10, 0))
+        
+        self.generated_password_var = tk.StringVar()
+        self.password_label = ttk.Label(gen_frame, textvariable=self.generated_password_var,
+                                       font=("Courier", 10), foreground="blue")
+        self.password_label.grid(row=1, column=0, columnspan=5, sticky=(tk.W, tk.E), pady=(10, 0))
+    
+    def _create_group_filter_section(self):
+        """Create group filter section. This is the second frame from top, below password generation"""
+        group_frame = ttk.LabelFrame(self, text="Group Filter", padding="10")
+        group_frame.grid(row=1, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=(0, 10))
+        group_frame.grid_columnconfigure(1, weight=1)
+        
+        ttk.Label(group_frame, text="Group:").grid(row=0, column=0, sticky=tk.W, padx=(0, 10))
+        
+        self.group_var = tk.StringVar(value="All")
+        self.group_combo = ttk.Combobox(group_frame, textvariable=self.group_var, state='readonly', width=25)
+        self.group_combo.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(0, 10))
+        self.group_combo.bind('<<ComboboxSelected>>', lambda e: self._on_group_change())
+        
+        ttk.Button(group_frame, text="New Group", command=self._show_new_group_dialog).grid(row=0, column=2, padx=(0, 5))
+        ttk.Button(group_frame, text="Manage Groups", command=self._show_manage_groups_dialog).grid(row=0, column=3)
+        
+        self._refresh_groups()
+    
+    def _create_search_section(self):
+        """Create search section. This is the third frame from top, and is below group filter"""
+        search_frame = ttk.LabelFrame(self, text="Search", padding="10")
+        search_frame.grid(row=2, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=(0, 10))
+        search_frame.grid_columnconfigure(1, weight=1)
+        
+        ttk.Label(search_frame, text="Search:").grid(row=0, column=0, sticky=tk.W, padx=(0, 10))
+        
+        self.search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
+        search_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(0, 10))
+        search_entry.bind('<Return>', lambda e: self._search())
+        self.search_var.trace_add('write', self._on_search_typed)
+        
+        self.fuzzy_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(search_frame, text="Fuzzy", variable=self.fuzzy_var,
+                        command=self._search).grid(row=0, column=2, padx=(0, 10))
+        
+        ttk.Button(search_frame, text="Search", command=self._search).grid(row=0, column=3, padx=(0, 10))
+        ttk.Button(search_frame, text="Clear", command=self._clear_search).grid(row=0, column=4)
+    
+    def _create_treeview_section(self):
+        """Create treeview section and its scrollbar. This is the fourth from the top. This is below search"""
+        tree_frame = ttk.Frame(self)
+        tree_frame.grid(row=3, column=0, columnspan=4, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
+        tree_frame.grid_rowconfigure(0, weight=1)
+        tree_frame.grid_columnconfigure(0, weight=1)
+        
+        columns = ('ID', 'Site', 'Username', 'Password', 'Group')
+        self.tree = ttk.Treeview(tree_frame, columns=columns, show='headings')
+        
+        self.tree.heading('ID', text='ID')
+        self.tree.heading('Site', text='Site Name')
+        self.tree.heading('Username', text='Username')
+        self.tree.heading('Password', text='Password')
+        self.tree.heading('Group', text='Group')
+        
+        self.tree.column('ID', width=50, minwidth=50)
+        self.tree.column('Site', width=200, minwidth=100)
+        self.tree.column('Username', width=150, minwidth=100)
+        self.tree.column('Password', width=150, minwidth=100)
+        self.tree.column('Group', width=100, minwidth=80)
+        
+        self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        self.tree_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.tree.configure(yscrollcommand=self._on_tree_scroll)
+        
+        self.tree.bind('<Configure>', lambda e: self._schedule_reveal())
+        self.tree.bind('<Double-1>', self._on_double_click)
+        self.tree.bind('<Delete>', self._delete_selected)
+    
+    def _on_double_click(self, event):
+        """Double click event, calls edit function"""
+        region = self.tree.identify_region(event.x, event.y)
+        
+        if region == "cell":
+            self._show_edit_dialog()
+    
+    def _create_button_section(self):
+        """Create buttons. This is the fifth from the top, and is the bottom most section/frame. This is below the treeview."""
+        button_frame = ttk.Frame(self)
+        button_frame.grid(row=4, column=0, columnspan=4, sticky=(tk.W, tk.E))
+        
+        buttons = [
+            ("Add", self._show_add_dialog),
+            ("Edit", self._show_edit_dialog),
+            ("Delete", self._delete_selected),
+            ("Copy Password", self._copy_password),
+            ("Toggle Visibility", self._toggle_password_visibility)
+        ]
+        
+        for i, (text, command) in enumerate(buttons):
+            ttk.Button(button_frame, text=text, command=command).grid(
+                row=0, column=i, padx=5, sticky=(tk.W, tk.E))
+            button_frame.grid_columnconfigure(i, weight=1)
+    
+    def _create_menu(self):
+        """Create toolbar menus"""
+        menubar = tk.Menu(self.master)
+        self.master.config(menu=menubar)
+        
+        file_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="File", menu=file_menu)
+        file_menu.add_command(label="Import Passwords...", command=self._show_import_dialog)
+        file_menu.add_command(label="Export Passwords...", command=self._show_export_dialog)
+        file_menu.add_command(label="Change Master Password...", command=self._change_master_password)
+        file_menu.add_separator()
+        file_menu.add_command(label="Exit", command=self.master.quit)
+        
+        options_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Options", menu=options_menu)
+        options_menu.add_command(label="Auto-Lock Settings...", command=self._show_autolock_settings)
+        options_menu.add_command(label="Theme Settings...", command=self._show_theme_settings)
+        
+        help_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Help", menu=help_menu)
+        help_menu.add_command(label="About", command=self._show_about)
+        help_menu.add_command(label="Help", command=self._open_help)
+        help_menu.add_command(label="Diagnostics...", command=self._show_diagnostics)
+    
+    def _start_activity_monitoring(self):
+        """Begin to monitor activity.
+        
+        Input events only record the time. A single timer waits for the auto-lock deadline, and
+        when it fires early because of activity it is rearmed for the new deadline.
+        """
+        for sequence in self.ACTIVITY_EVENTS:
+            self._activity_funcids.append(self.bind_class(self._activity_tag, sequence, self._register_activity))
+        for sequence in self.RETAG_EVENTS:
+            self._activity_funcids.append(self.bind_class(self._activity_tag, sequence, self._watch_activity))
+        self._watch_activity()
+        
+        self.db_manager.settings.subscribe('auto_lock_enabled', self._on_auto_lock_setting)
+        self.db_manager.settings.subscribe('auto_lock_minutes', self._on_auto_lock_setting)
+        
+        self._register_activity()
+        self._on_auto_lock_setting()
+    
+    def _register_activity(self, event=None):
+        """Register an activity event"""
+        self.last_activity_time = time.monotonic()
+    
+    def _watch_activity(self, event=None):
+        """Tag widgets created since the last call"""
+        self._tag_widgets(True)
+    
+    def _tag_widgets(self, tagged: bool):
+        """Add the activity tag to every widget of the app, dialogs included, or remove it.
+        
+        It goes first, so no other binding can stop an event before it is seen.
+        """
+        stack = [self.winfo_toplevel()]
+        while stack:
+            widget = stack.pop()
+            try:
+                tags = widget.bindtags()
+                if tagged and self._activity_tag not in tags:
+                    widget.bindtags((self._activity_tag,) + tags)
+                elif not tagged and self._activity_tag in tags:
+                    widget.bindtags(tuple(tag for tag in tags if tag != self._activity_tag))
+                stack.extend(widget.winfo_children())
+            except tk.TclError:
+                # Destroyed meanwhile
+                pass
+    
+    def _on_auto_lock_setting(self, value=None):
+        """Pick up the auto-lock settings when they change"""
+        if self.db_manager.settings.get_bool('auto_lock_enabled', True):
+            self._auto_lock_seconds = self.db_manager.settings.get_int('auto_lock_minutes', 5) * 60
+        else:
+            self._auto_lock_seconds = None
+        self._schedule_auto_lock()
+    
+    def _schedule_auto_lock(self):
+        """Arm the auto-lock timer for the current deadline"""
+        if self.auto_lock_timer:
+            self.after_cancel(self.auto_lock_timer)
+            self.auto_lock_timer = None
+        
+        if self._auto_lock_seconds is None:
+            return
+        
+        remaining = self.last_activity_time + self._auto_lock_seconds - time.monotonic()
+        self.auto_lock_timer = self.after(max(int(remaining * 1000), 0) + 1, self._check_auto_lock)
+    
+    def _check_auto_lock(self):
+        """Lock if there was no activity since the deadline was set, otherwise wait for the new one"""
+        self.auto_lock_timer = None
+        if self._auto_lock_seconds is None:
+            return
+        
+        if time.monotonic() - self.last_activity_time >= self._auto_lock_seconds:
+            self._lock_application()
+        else:
+            self._schedule_auto_lock()
+    
+    def _lock_application(self):
+        """Lock the application and return to login screen"""
+        if self.auto_lock_timer:
+            self.after_cancel(self.auto_lock_timer)
+        if self._reveal_job:
+            self.after_cancel(self._reveal_job)
+        if self._page_job:
+            self.after_cancel(self._page_job)
+        if self._search_job:
+            self.after_cancel(self._search_job)
+        
+        # Imports and exports stop before the key is forgotten
+        self.tasks.cancel_all()
+        self.lock_callback()
+    
+    def _show_autolock_settings(self):
+        """Show auto-lock settings"""
+        self._register_activity()
+        AutoLockSettingsDialog(self, self.db_manager)
+    
+    def _show_theme_settings(self):
+        """Show theme settings"""
+        self._register_activity()
+        ThemeSettingsDialog(self, self.db_manager)
+    
+    def _apply_current_theme(self):
+        """Apply the saved theme"""
+        theme_name = self.db_manager.get_setting('theme', 'Light')
+        self.apply_theme(theme_name)
+    
+    def apply_theme(self, theme_name: str):
+        """Apply theme to main frame"""
+        all_themes = _get_all_themes(self.db_manager)
+        if theme_name not in all_themes:
+            theme_name = 'Light'
+        theme = all_themes[theme_name]
+        
+        # Configure ttk styles
+        style = ttk.Style()
+        style.theme_use('clam')
+        
+        # Frame styles
+        style.configure('TFrame', background=theme['bg'])
+        style.configure('TLabelframe', background=theme['bg'], foreground=theme['fg'])
+        style.configure('TLabelframe.Label', background=theme['bg'], foreground=theme['fg'])
+        
+        # Label styles
+        style.configure('TLabel', background=theme['bg'], foreground=theme['fg'])
+        
+        # Entry styles
+        style.configure('TEntry', fieldbackground=theme['entry_bg'], foreground=theme['entry_fg'], 
+                       insertcolor=theme['fg'])
+        style.map('TEntry',
+                 fieldbackground=[('readonly', theme['active_bg'])],
+                 foreground=[('readonly', theme['active_fg'])])
+        
+        # Button styles
+        style.configure('TButton', background=theme['button_bg'], foreground=theme['button_fg'])
+        style.map('TButton',
+                 background=[('active', theme['accent']), ('pressed', theme['accent'])],
+                 foreground=[('active', theme['button_fg']), ('pressed', theme['button_fg'])])
+
+        # Checkbutton styles
+        style.configure('TCheckbutton', background=theme['bg'], foreground=theme['fg'])
+        style.map('TCheckbutton',
+                  background=[('active', theme['bg'])],
+                  foreground=[('active', theme['fg'])])
+        
+        # Combobox styles
+        style.configure('TCombobox', fieldbackground=theme['entry_bg'], background=theme['button_bg'],
+                       foreground=theme['entry_fg'], arrowcolor=theme['fg'])
+        style.map('TCombobox',
+                 fieldbackground=[('readonly', theme['entry_bg'])],
+                 selectbackground=[('readonly', theme['entry_bg'])],
+                 selectforeground=[('readonly', theme['entry_fg'])])
+        
+        # Treeview styles
+        style.configure('Treeview', background=theme['tree_bg'], foreground=theme['tree_fg'],
+                       fieldbackground=theme['tree_bg'])
+        style.map('Treeview',
+                 background=[('selected', theme['tree_sel_bg'])],
+                 foreground=[('selected', theme['tree_sel_fg'])])
+        
+        # Treeview Header styles
+        style.configure('Treeview.Heading', background=theme['button_bg'], foreground=theme['button_fg'])
+        style.map('Treeview.Heading',
+                 background=[('active', theme['accent'])],
+                 foreground=[('active', theme['bg'])])
+        
+        # Scrollbar styles
+        style.configure('Vertical.TScrollbar', background=theme['button_bg'], 
+                       troughcolor=theme['bg'], arrowcolor=theme['fg'])
+        
+        # Apply to root window and menu
+        self.master.configure(bg=theme['bg'])
+        
+        # Update password label color
+        if hasattr(self, 'password_label'):
+            self.password_label.configure(foreground=theme['accent'])
+        
+        # Try to update menu colors
+        try:
+            menubar = self.master.nametowidget(self.master.cget('menu'))
+            menubar.configure(bg=theme['accent'], fg=theme['bg'],
+                            activebackground=theme['active_bg'], activeforeground=theme['active_fg'])
+            
+            for i in range(menubar.index('end') + 1):
+                try:
+                    submenu = menubar.nametowidget(menubar.entrycget(i, 'menu'))
+                    submenu.configure(bg=theme['menu_bg'], fg=theme['menu_fg'],
+                                    activebackground=theme['accent'], activeforeground=theme['bg'])
+                except:
+                    pass
+        except:
+            pass
+    
+    def _refresh_groups(self):
+        """Refresh the list of groups in the dropdown"""
+        groups = self.db_manager.get_all_groups()
+        self.group_combo['values'] = groups
+        
+        if self.current_group not in groups:
+            self.current_group = "All"
+            self.group_var.set("All")
+    
+    def _on_group_change(self):
+        """Handle group selection change"""
+        self._register_activity()
+        self.current_group = self.group_var.get()
+        self._populate_treeview()
+    
+    def _show_new_group_dialog(self):
+        """Show window to create a new group"""
+        self._register_activity()
+        NewGroupDialog(self, self.db_manager, callback=self._on_data_changed)
+    
+    def _show_manage_groups_dialog(self):
+        """Show window to manage existing groups"""
+        self._register_activity()
+        ManageGroupsDialog(self, self.db_manager, callback=self._on_data_changed)
+    
+    def _generate_password(self):
+        """Generate a new password"""
+        self._register_activity()
+        try:
+            length = int(self.length_var.get())
+            password = self.password_generator.generate(length, self.use_special_flag.get())
+            self.generated_password_var.set(f"Generated: {password}")
+            self._current_generated_password = password
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Please enter a valid password length.")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to generate password: {str(e)}")
+
+    def _copy_generated_password(self):
+        """Copy the currently generated password to clipboard"""
+        self._register_activity()
+        password = getattr(self, '_current_generated_password', '')
+        if not password:
+            messagebox.showwarning("No Password", "Please generate a password first.")
+            return
+        _copy_to_clipboard(password)
+        messagebox.showinfo("Copied", "Password copied to clipboard!")
+    
+    def _clear_password(self):
+        """Clear generated password"""
+        self._register_activity()
+        self.generated_password_var.set("")
+        self._current_generated_password = ""
+    
+    def _show_add_dialog(self):
+        """Show add password window"""
+        self._register_activity()
+        default_group = None if self.current_group == "All" else self.current_group
+        AddEditDialog(self, self.db_manager, callback=self._on_data_changed,
+                     initial_password=getattr(self, '_current_generated_password', ''),
+                     default_group=default_group)
+    
+    def _show_edit_dialog(self):
+        """Show edit password window"""
+        self._register_activity()
+        selection = self.tree.selection()
+        if not selection:
+            messagebox.showwarning("No Selection", "Please select a record to edit.")
+            return
+        
+        item = self.tree.item(selection[0])
+        values = item['values']
+        record_id = values[0]
+        
+        # Get full record from database
+        record = self.db_manager.get_record_by_id(record_id)
+        
+        if not record:
+            messagebox.showerror("Error", "Failed to retrieve record details.")
+            return
+        
+        # Decrypt password
+        password = self.db_manager.decrypt_password(record.encrypted_password)
+        
+        AddEditDialog(self, self.db_manager, callback=self._on_data_changed,
+                     record_id=record_id, site=record.site, username=record.username, 
+                     password=password, group=record.group_name, 
+                     date_added=record.date_added, date_modified=record.date_modified)
+    
+    def _delete_selected(self, event=None):
+        """Delete selected records"""
+        self._register_activity()
+        selection = self.tree.selection()
+        if not selection:
+            messagebox.showwarning("No Selection", "Please select record(s) to delete.")
+            return
+        
+        count = len(selection)
+        message = f"Are you sure you want to delete {count} record(s)?"
+        if not messagebox.askyesno("Confirm Deletion", message):
+            return
+        
+        for item in selection:
+            values = self.tree.item(item)['values']
+            record_id = values[0]
+            self.db_manager.delete_record(record_id)
+            self.revealed_passwords.pop(record_id, None)
+        
+        self._on_data_changed()
+    
+    def _copy_password(self):
+        """Copy selected password to clipboard"""
+        self._register_activity()
+        selection = self.tree.selection()
+        if not selection:
+            messagebox.showwarning("No Selection", "Please select a record to copy password.")
+            return
+        
+        record_id = self.tree.item(selection[0])['values'][0]
+        
+        try:
+            password = self._get_password(record_id)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to decrypt password: {str(e)}")
+            return
+        
+        _copy_to_clipboard(password)
+        messagebox.showinfo("Copied", "Password copied to clipboard!")
+    
+    def _toggle_password_visibility(self):
+        """Toggle password visibility in treeview"""
+        self._register_activity()
+        self.passwords_visible = not self.passwords_visible
+        
+        if self.passwords_visible:
+            self._reveal_visible_rows()
+        else:
+            for record_id, password in self.revealed_passwords.items():
+                if self.tree.exists(record_id):
+                    self.tree.set(record_id, 'Password', self._mask(len(password)))
+            self.revealed_passwords.clear()
+    
+    def _get_password(self, record_id: int) -> str:
+        """Decrypt one password, only when it is actually needed"""
+        password = self.revealed_passwords.get(record_id)
+        if password is None:
+            password = self.db_manager.get_password(record_id) or ''
+        return password
+    
+    def _mask(self, password_length: Optional[int]) -> str:
+        """Mask for a password of the given length"""
+        return '*' * min(password_length if password_length is not None else 12, 12)
+    
+    def _on_tree_scroll(self, first, last):
+        """Keep the scrollbar in sync, load more rows near the bottom and reveal rows scrolled into view"""
+        self.tree_scrollbar.set(first, last)
+        
+        if self._more_rows and float(last) > 0.9 and self._page_job is None:
+            self._page_job = self.after_idle(self._load_next_page)
+        
+        self._schedule_reveal()
+    
+    def _schedule_reveal(self):
+        """Reveal visible rows once the treeview settles"""
+        if self.passwords_visible and self._reveal_job is None:
+            self._reveal_job = self.after_idle(self._reveal_visible_rows)
+    
+    def _visible_items(self) -> Tuple[str, ...]:
+        """Return the treeview items currently in view"""
+        items = self.tree.get_children()
+        if not items:
+            return ()
+        
+        first = int(float(self.tree.yview()[0]) * len(items))
+        row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+        rows = max(self.tree.winfo_height() // row_height, int(self.tree.cget('height')))
+        return items[first:first + rows + 1]
+    
+    def _reveal_visible_rows(self):
+        """Decrypt and show passwords for rows in view only"""
+        self._reveal_job = None
+        if not self.passwords_visible:
+            return
+        
+        hidden = [int(item) for item in self._visible_items() if int(item) not in self.revealed_passwords]
+        if not hidden:
+            return
+        
+        for record_id, encrypted_password in self.db_manager.get_encrypted_passwords(hidden).items():
+            try:
+                password = self.db_manager.decrypt_password(encrypted_password)
+            except Exception:
+                logger.exception("Error decrypting record %s", record_id)
+                continue
+            self.revealed_passwords[record_id] = password
+            self.tree.set(record_id, 'Password', password)
+    
+    def _on_search_typed(self, *args):
+        """Search once typing pauses for SEARCH_DELAY_MS"""
+        if self._search_job:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(self.SEARCH_DELAY_MS, self._search)
+    
+    def _search(self):
+        """Search for records"""
+        if self._search_job:
+            self.after_cancel(self._search_job)
+            self._search_job = None
+        
+        self._register_activity()
+        self.search_term = self.search_var.get().strip() or None
+        self._populate_treeview()
+    
+    def _clear_search(self):
+        """Clear search and show all records"""
+        self._register_activity()
+        self.search_var.set("")
+        if self._search_job:
+            self.after_cancel(self._search_job)
+            self._search_job = None
+        self.search_term = None
+        self._populate_treeview()
+    
+    def _update_search_results(self, narrow: bool = True):
+        """Find the ids matching the current search in the in-memory index.
+        
+        When the search only extends the previous one, in the same group, just the previous
+        matches are rechecked.
+        """
+        if not self.search_term:
+            self._search_ids = None
+            self._search_key = None
+            return
+        
+        if self.fuzzy_var.get():
+            # Fuzzy results are ranked and loaded in one go by _load_next_page
+            self._search_ids = None
+            self._search_key = None
+            return
+        
+        term = self.search_term.lower()
+        within = None
+        if (narrow and self._search_key is not None and self._search_key[1] == self.current_group
+                and term.startswith(self._search_key[0])):
+            within = self._search_ids
+        
+        self._search_ids = self.db_manager.get_search_index().search(term, self.current_group, within)
+        self._search_key = (term, self.current_group)
+    
+    def _on_data_changed(self):
+        """Called when data is added, edited, or deleted"""
+        group_before = self.current_group
+        self._refresh_groups()
+        
+        changes = self.db_manager.take_changes()
+        # Earlier matches may no longer be valid, so search every record again
+        self._search_key = None
+        if changes.reset or self.current_group != group_before or self._fuzzy_listing():
+            self._populate_treeview()
+        else:
+            self._update_search_results(narrow=False)
+            self._apply_changes(changes)
+    
+    def _apply_changes(self, changes: RecordChanges):
+        """Update only the rows that changed instead of reloading the whole list"""
+        for record_id in changes.deleted:
+            if self.tree.exists(record_id):
+                self.tree.delete(record_id)
+            self.revealed_passwords.pop(record_id, None)
+        
+        updated = {record.id: record for record in self.db_manager.get_records_by_ids(sorted(changes.updated))}
+        for record_id in changes.updated:
+            self.revealed_passwords.pop(record_id, None)
+            record = updated.get(record_id)
+            
+            if record is None or not self._matches_listing(record):
+                if self.tree.exists(record_id):
+                    self.tree.delete(record_id)
+            elif self.tree.exists(record_id):
+                self.tree.item(record_id, values=self._row_values(record))
+            elif record_id <= self._last_loaded_id:
+                # Edited into the current group/search; put it back in id order
+                loaded_ids = [int(item) for item in self.tree.get_children()]
+                self.tree.insert('', bisect.bisect(loaded_ids, record_id), iid=record_id,
+                                 values=self._row_values(record))
+        
+        # New records have the highest ids, so unless every page is loaded they arrive with a later page
+        if not self._more_rows:
+            for record in self.db_manager.get_records_by_ids(sorted(changes.added)):
+                if self._matches_listing(record) and not self.tree.exists(record.id):
+                    self.tree.insert('', 'end', iid=record.id, values=self._row_values(record))
+                    self._last_loaded_id = max(self._last_loaded_id, record.id)
+        
+        self._schedule_reveal()
+    
+    def _fuzzy_listing(self) -> bool:
+        """Whether the list shows ranked fuzzy search results, which can't be updated row by row"""
+        return bool(self.search_term) and self.fuzzy_var.get()
+    
+    def _matches_listing(self, record: Record) -> bool:
+        """Check a record against the current group filter and search"""
+        if self.current_group != "All" and record.group_name != self.current_group:
+            return False
+        
+        if self.search_term:
+            term = self.search_term.lower()
+            return term in record.site.lower() or term in record.username.lower()
+        
+        return True
+    
+    def _row_values(self, record: Record) -> tuple:
+        """Treeview values for a record, with the password masked"""
+        display_group = record.group_name if record.group_name else ""
+        
+        return (record.id, record.site, record.username, self._mask(record.password_length), display_group)
+    
+    def _populate_treeview(self):
+        """Populate treeview with the first page of records. Later pages load while scrolling"""
+        with instrument.timed("Treeview clear"):
+            for item in self.tree.get_children():
+                self.tree.delete(item)
+        
+        self.revealed_passwords.clear()
+        self._last_loaded_id = 0
+        self._more_rows = True
+        self._update_search_results()
+        self._load_next_page()
+    
+    def _load_next_page(self):
+        """Append the next page of records for the current group and search. Passwords stay masked"""
+        self._page_job = None
+        if not self._more_rows:
+            return
+        
+        if self._fuzzy_listing():
+            records = self.db_manager.search_records(self.search_term, self.current_group, fuzzy=True)
+            self._more_rows = False
+        elif self._search_ids is not None:
+            start = bisect.bisect(self._search_ids, self._last_loaded_id)
+            records = self.db_manager.get_records_by_ids(self._search_ids[start:start + self.PAGE_SIZE])
+            self._more_rows = start + self.PAGE_SIZE < len(self._search_ids)
+        else:
+            records = self.db_manager.get_records_page(self.current_group, after_id=self._last_loaded_id,
+                                                       limit=self.PAGE_SIZE)
+            self._more_rows = len(records) == self.PAGE_SIZE
+        
+        with instrument.timed("Treeview insert", rows=len(records)):
+            for record in records:
+                self.tree.insert('', 'end', iid=record.id, values=self._row_values(record))
+                self._last_loaded_id = record.id
+        
+        self._schedule_reveal()
+    
+    def _show_import_dialog(self):
+        """Show import window"""
+        self._register_activity()
+        default_group = None if self.current_group == "All" else self.current_group
+        ImportDialog(self, self.db_manager, self.tasks, callback=self._on_data_changed, current_group=default_group)
+
+    def _show_export_dialog(self):
+        """Show export window"""
+        self._register_activity()
+        ExportDialog(self, self.db_manager, self.tasks, current_group=self.current_group)
+    
+    def _change_master_password(self):
+        """Change master password"""
+        self._register_activity()
+        ChangeMasterPasswordDialog(self, self.db_manager, self.tasks)
+    
+    def _show_about(self):
+        """Show about window"""
+        self._register_activity()
+        messagebox.showinfo("About", "RandPyPwGen v2.0.3\nA secure password manager\n\nBy Hayden Hildreth")
+    
+    def _open_help(self):
+        """Open help in browser"""
+        self._register_activity()
+        import webbrowser
+        webbrowser.open("https://github.com/HaydenHildreth/RandPyPwMan")
+    
+    def _show_diagnostics(self):
+        """Show timing diagnostics window"""
+        self._register_activity()
+        DiagnosticsDialog(self, self.db_manager)
+
+
+# The refresh paths, so Diagnostics can split a slow refresh into SQLite, crypto and Treeview time
+instrument.register(MainFrame, '_populate_treeview', '_load_next_page', '_update_search_results',
+                    '_apply_changes', '_reveal_visible_rows')
+
+class ThemeSettingsDialog:
+    """Dialog for configuring theme settings"""
+    def __init__(self, parent, db_manager):
+        self.db_manager = db_manager
+
+        self.window = tk.Toplevel(parent)
+        self.window.title("Theme Settings")
+        self.window.geometry("450x600")
+        self.window.resizable(True, True)
+        self.window.minsize(400, 520)
+
+        self.window.update_idletasks()
+        parent_x = parent.winfo_rootx()
+        parent_y = parent.winfo_rooty()
+        self.window.geometry(f"450x600+{parent_x + 100}+{parent_y + 100}")
+
+        self._apply_window_theme()
+        self._create_widgets()
+        self.window.transient(parent)
+        self.window.grab_set()
+
+    def _apply_window_theme(self):
+        theme_name = self.db_manager.get_setting('theme', 'Light')
+        all_themes = _get_all_themes(self.db_manager)
+        if theme_name in all_themes:
+            self.window.configure(bg=all_themes[theme_name]['bg'])
+
+    def _build_sorted_list(self, all_themes: dict) -> list:
+        priority = [n for n in ('Light', 'Dark') if n in all_themes]
+        rest = sorted(k for k in all_themes if k not in priority and not k.startswith('__'))
+        return priority + rest
+
+    def _create_widgets(self):
+        main_frame = ttk.Frame(self.window, padding="20")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.window.grid_rowconfigure(0, weight=1)
+        self.window.grid_columnconfigure(0, weight=1)
+        main_frame.grid_rowconfigure(2, weight=1)
+        main_frame.grid_columnconfigure(0, weight=1)
+
+        ttk.Label(main_frame, text="Theme Configuration",
+                  font=("Arial", 11, "bold")).grid(row=0, column=0, pady=(0, 20), sticky=tk.W)
+
+        ttk.Label(main_frame, text="Select Theme:",
+                  font=("Arial", 10)).grid(row=1, column=0, sticky=tk.W, pady=(0, 10))
+
+        current_theme = self.db_manager.get_setting('theme', 'Light')
+        self.theme_var = tk.StringVar(value=current_theme)
+
+        list_frame = ttk.Frame(main_frame)
+        list_frame.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
+        list_frame.grid_rowconfigure(0, weight=1)
+        list_frame.grid_columnconfigure(0, weight=1)
+
+        self.theme_listbox = tk.Listbox(list_frame, height=12, exportselection=False)
+        self.theme_listbox.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.theme_listbox.yview)
+        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.theme_listbox.configure(yscrollcommand=scrollbar.set)
+
+        self._populate_listbox(current_theme)
+
+        self.theme_listbox.bind('<<ListboxSelect>>', self._on_theme_select)
+        self.theme_listbox.bind('<Double-Button-1>', lambda e: self._apply_theme())
+
+        preview_frame = ttk.LabelFrame(main_frame, text="Preview", padding="10")
+        preview_frame.grid(row=3, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
+
+        self.preview_label = ttk.Label(preview_frame, text="Preview colors will appear here")
+        self.preview_label.pack()
+
+        self.preview_canvas = tk.Canvas(preview_frame, width=356, height=65)
+        self.preview_canvas.pack(pady=(10, 0))
+
+        self._preview_theme()
+
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=4, column=0, pady=(0, 0))
+
+        ttk.Button(button_frame, text="Apply",
+                   command=self._apply_theme).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(button_frame, text="New Custom Theme",
+                   command=self._open_creator).pack(side=tk.LEFT, padx=(0, 5))
+        self.edit_btn = ttk.Button(button_frame, text="Edit",
+                                   command=self._edit_custom_theme)
+        self.edit_btn.pack(side=tk.LEFT, padx=(0, 5))
+        self.delete_btn = ttk.Button(button_frame, text="Delete",
+                                     command=self._delete_custom_theme)
+        self.delete_btn.pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(button_frame, text="Cancel",
+                   command=self.window.destroy).pack(side=tk.LEFT)
+
+        self._update_button_states()
+
+    def _populate_listbox(self, select_name=None):
+        self.theme_listbox.delete(0, tk.END)
+        self._custom_theme_names = set(self.db_manager.get_custom_themes().keys())
+        all_themes = _get_all_themes(self.db_manager)
+        self._sorted_list = self._build_sorted_list(all_themes)
+
+        for theme_name in self._sorted_list:
+            label = f"{theme_name} ★" if theme_name in self._custom_theme_names else theme_name
+            self.theme_listbox.insert(tk.END, label)
+
+        target = select_name or self.theme_var.get()
+        try:
+            idx = self._sorted_list.index(target)
+            self.theme_listbox.selection_set(idx)
+            self.theme_listbox.see(idx)
+        except ValueError:
+            self.theme_listbox.selection_set(0)
+
+    def _selected_theme_name(self):
+        sel = self.theme_listbox.curselection()
+        if not sel:
+            return self.theme_var.get()
+        return self._sorted_list[sel[0]]
+
+    def _on_theme_select(self, event=None):
+        name = self._selected_theme_name()
+        self.theme_var.set(name)
+        self._preview_theme()
+        self._update_button_states()
+
+    def _update_button_states(self):
+        is_custom = self._selected_theme_name() in getattr(self, '_custom_theme_names', set())
+        state = 'normal' if is_custom else 'disabled'
+        self.edit_btn.config(state=state)
+        self.delete_btn.config(state=state)
+
+    def _preview_theme(self):
+        name = self.theme_var.get()
+        all_themes = _get_all_themes(self.db_manager)
+        if name not in all_themes:
+            return
+        theme = all_themes[name]
+        self.preview_canvas.delete('all')
+        x_start, y, width, height = 10, 10, 60, 40
+        colors = [
+            ('BG',     theme['bg']),
+            ('Text',   theme['fg']),
+            ('Accent', theme['accent']),
+            ('Button', theme['button_bg']),
+            ('Entry',  theme['entry_bg']),
+        ]
+        for i, (label, color) in enumerate(colors):
+            x = x_start + i * (width + 10)
+            self.preview_canvas.create_rectangle(x, y, x + width, y + height,
+                                                 fill=color, outline='gray')
+            self.preview_canvas.create_text(x + width // 2, y + height + 10,
+                                            text=label, font=('Arial', 8))
+
+    def _apply_theme(self):
+        theme_name = self._selected_theme_name()
+        # Forced, so the main window re-applies the theme even if it is already the active one
+        if self.db_manager.set_setting('theme', theme_name, force=True):
+            messagebox.showinfo("Success", f"Theme '{theme_name}' applied successfully!")
+            self.window.destroy()
+        else:
+            messagebox.showerror("Error", "Failed to save theme setting.")
+
+    def _open_creator(self, existing_name=None, existing_colors=None):
+        self.window.grab_release()
+        def on_saved(name):
+            self._populate_listbox(select_name=name)
+            self._preview_theme()
+            self._update_button_states()
+        CustomThemeCreatorDialog(self.window, self.db_manager, on_saved,
+                                 existing_name=existing_name,
+                                 existing_colors=existing_colors)
+        self.window.grab_set()
+
+    def _edit_custom_theme(self):
+        name = self._selected_theme_name()
+        custom = self.db_manager.get_custom_themes()
+        if name not in custom:
+            messagebox.showwarning("Not Editable", "Only custom themes can be edited.")
+            return
+        self._open_creator(existing_name=name, existing_colors=custom[name])
+
+    def _delete_custom_theme(self):
+        name = self._selected_theme_name()
+        custom = self.db_manager.get_custom_themes()
+        if name not in custom:
+            messagebox.showwarning("Not Deletable", "Only custom themes can be deleted.")
+            return
+        if not messagebox.askyesno("Confirm Delete", f"Delete custom theme '{name}'?"):
+            return
+        if self.db_manager.delete_custom_theme(name):
+            if self.db_manager.get_setting('theme') == name:
+                self.db_manager.set_setting('theme', 'Light')
+            messagebox.showinfo("Deleted", f"Theme '{name}' deleted.")
+            self._populate_listbox(select_name='Light')
+            self._preview_theme()
+            self._update_button_states()
+
+class CustomThemeCreatorDialog:
+    """Dialog for creating or editing a custom theme via color pickers"""
+
+    COLOR_KEYS = [
+        ('bg',           'Background'),
+        ('fg',           'Foreground (text)'),
+        ('accent',       'Accent'),
+        ('button_bg',    'Button Background'),
+        ('button_fg',    'Button Text'),
+        ('entry_bg',     'Entry Background'),
+        ('entry_fg',     'Entry Text'),
+        ('active_bg',    'Active / Hover Background'),
+        ('active_fg',    'Active / Hover Text'),
+        ('tree_bg',      'Treeview Background'),
+        ('tree_fg',      'Treeview Text'),
+        ('tree_sel_bg',  'Treeview Selected Background'),
+        ('tree_sel_fg',  'Treeview Selected Text'),
+        ('menu_bg',      'Menu Background'),
+        ('menu_fg',      'Menu Text'),
+    ]
+
+    DEFAULTS = {
+        'bg':          '#FFFFFF',
+        'fg':          '#1F2937',
+        'accent':      '#2563EB',
+        'button_bg':   '#F3F4F6',
+        'button_fg':   '#1F2937',
+        'entry_bg':    '#FFFFFF',
+        'entry_fg':    '#1F2937',
+        'active_bg':   '#E5E7EB',
+        'active_fg':   '#111827',
+        'tree_bg':     '#FFFFFF',
+        'tree_fg':     '#111827',
+        'tree_sel_bg': '#2563EB',
+        'tree_sel_fg': '#FFFFFF',
+        'menu_bg':     '#FFFFFF',
+        'menu_fg':     '#111827',
+    }
+
+    def __init__(self, parent, db_manager, on_saved_callback,
+                 existing_name=None, existing_colors=None):
+        self.db_manager = db_manager
+        self.on_saved_callback = on_saved_callback
+        self.existing_name = existing_name
+        self.color_vars: Dict[str, tk.StringVar] = {}
+        self._preview_previous_theme = None
+        self._preview_btn_ref = None
+
+        self.window = tk.Toplevel(parent)
+        self.window.title("Edit Custom Theme" if existing_name else "Create Custom Theme")
+        self.window.geometry("560x620")
+        self.window.resizable(True, True)
+        self.window.minsize(480, 560)
+
+        self.window.update_idletasks()
+        px, py = parent.winfo_rootx(), parent.winfo_rooty()
+        self.window.geometry(f"560x620+{px + 60}+{py + 40}")
+
+        base = existing_colors if existing_colors else self.DEFAULTS
+        for key, _ in self.COLOR_KEYS:
+            self.color_vars[key] = tk.StringVar(
+                value=base.get(key, self.DEFAULTS.get(key, '#000000')))
+
+        theme_name = db_manager.get_setting('theme', 'Light')
+        all_themes = _get_all_themes(db_manager)
+        if theme_name in all_themes:
+            self.window.configure(bg=all_themes[theme_name]['bg'])
+
+        self._create_widgets(existing_name or '')
+        self.window.transient(parent)
+        self.window.grab_set()
+
+    def _create_widgets(self, initial_name: str):
+        outer = ttk.Frame(self.window, padding="15")
+        outer.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.window.grid_rowconfigure(0, weight=1)
+        self.window.grid_columnconfigure(0, weight=1)
+        outer.grid_rowconfigure(0, weight=0)
+        outer.grid_rowconfigure(1, weight=1)
+        outer.grid_rowconfigure(2, weight=0)
+        outer.grid_columnconfigure(0, weight=1)
+
+        # Theme name
+        name_frame = ttk.Frame(outer)
+        name_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 12))
+        name_frame.grid_columnconfigure(1, weight=1)
+
+        ttk.Label(name_frame, text="Theme Name:",
+                  font=('Arial', 10, 'bold')).grid(row=0, column=0, sticky=tk.W, padx=(0, 10))
+        self.name_var = tk.StringVar(value=initial_name)
+        name_entry = ttk.Entry(name_frame, textvariable=self.name_var)
+        name_entry.grid(row=0, column=1, sticky=(tk.W, tk.E))
+        if not initial_name:
+            name_entry.focus()
+
+        # Scrollable color rows
+        canvas = tk.Canvas(outer, borderwidth=0, highlightthickness=0,
+                   bg=self.window.cget('bg'))
+        scrollbar = ttk.Scrollbar(outer, orient=tk.VERTICAL, command=canvas.yview)
+        canvas.configure(yscrollcommand=scrollbar.set)
+        canvas.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
+
+        scroll_frame = ttk.Frame(canvas)
+        scroll_frame.bind('<Configure>',
+            lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
+
+        def _on_canvas_resize(event):
+            canvas.itemconfig(_canvas_window, width=event.width)
+
+        _canvas_window = canvas.create_window((0, 0), window=scroll_frame, anchor='nw')
+        canvas.bind('<Configure>', _on_canvas_resize)
+
+        def _on_mousewheel(event):
+            try:
+                canvas.yview_scroll(int(-1 * (event.delta / 120)), 'units')
+            except Exception:
+                pass
+        canvas.bind_all('<MouseWheel>', _on_mousewheel)
+        canvas.bind('<Destroy>', lambda e: canvas.unbind_all('<MouseWheel>'))
+
+        scroll_frame.grid_columnconfigure(0, weight=0)
+        scroll_frame.grid_columnconfigure(1, weight=0)
+        scroll_frame.grid_columnconfigure(2, weight=1)
+        self._swatch_buttons: Dict[str, tk.Button] = {}
+
+        for row_i, (key, label) in enumerate(self.COLOR_KEYS):
+            ttk.Label(scroll_frame, text=label, width=28,
+                      anchor=tk.W).grid(row=row_i, column=0, sticky=tk.W,
+                                        pady=4, padx=(0, 10))
+
+            color_var = self.color_vars[key]
+            hex_entry = ttk.Entry(scroll_frame, textvariable=color_var, width=10)
+            hex_entry.grid(row=row_i, column=1, sticky=tk.W, padx=(0, 8))
+            hex_entry.bind('<FocusOut>', lambda e, k=key: self._on_hex_typed(k))
+            hex_entry.bind('<Return>',   lambda e, k=key: self._on_hex_typed(k))
+
+            swatch = tk.Button(
+                scroll_frame, text="   ", width=4,
+                bg=color_var.get(), relief=tk.RAISED, bd=2,
+                command=lambda k=key: self._pick_color(k)
+            )
+            swatch.grid(row=row_i, column=2, padx=(0, 4), pady=2)
+            self._swatch_buttons[key] = swatch
+
+        # Preview + buttons
+        bottom = ttk.Frame(outer)
+        bottom.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(12, 0))
+        bottom.grid_columnconfigure(0, weight=1)
+
+        preview_frame = ttk.LabelFrame(bottom, text="Preview", padding="8")
+        preview_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
+        self.preview_canvas = tk.Canvas(preview_frame, height=80)
+        self.preview_canvas.bind('<Configure>', lambda e: self._draw_preview())
+        self.preview_canvas.pack(fill=tk.X)
+        self._draw_preview()
+
+        btn_frame = ttk.Frame(bottom)
+        btn_frame.grid(row=1, column=0)
+        self._preview_btn_ref = ttk.Button(btn_frame, text="Preview in App",
+                   command=self._preview_in_app)
+        self._preview_btn_ref.pack(side=tk.LEFT, padx=(0, 8))
+        ttk.Button(btn_frame, text="Save Theme",
+                   command=self._save).pack(side=tk.LEFT, padx=(0, 8))
+        ttk.Button(btn_frame, text="Cancel",
+                   command=self._close).pack(side=tk.LEFT)
+
+    def _pick_color(self, key: str):
+        current = self.color_vars[key].get()
+        try:
+            result = colorchooser.askcolor(color=current,
+                                           title=f"Choose color — {key}",
+                                           parent=self.window)
+        except Exception:
+            result = colorchooser.askcolor(title=f"Choose color — {key}",
+                                           parent=self.window)
+        if result and result[1]:
+            hex_color = result[1].upper()
+            self.color_vars[key].set(hex_color)
+            self._swatch_buttons[key].configure(bg=hex_color)
+            self._draw_preview()
+
+    def _on_hex_typed(self, key: str):
+        value = self.color_vars[key].get().strip()
+        if not value.startswith('#'):
+            value = '#' + value
+        if re.match(r'^#[0-9A-Fa-f]{6}$', value):
+            value = value.upper()
+            self.color_vars[key].set(value)
+            try:
+                self._swatch_buttons[key].configure(bg=value)
+            except Exception:
+                pass
+            self._draw_preview()
+
+    def _current_colors(self) -> dict:
+        return {key: self.color_vars[key].get() for key, _ in self.COLOR_KEYS}
+
+    def _draw_preview(self):
+        colors = self._current_colors()
+        self.preview_canvas.update_idletasks()
+        self.preview_canvas.delete('all')
+
+        canvas_width = self.preview_canvas.winfo_width()
+        canvas_height = self.preview_canvas.winfo_height()
+
+        # This should fix the issue where preview was made before screen drawn
+        if canvas_width <= 1:
+            return
+
+        swatches = [
+            ('BG',     colors['bg']),
+            ('Text',   colors['fg']),
+            ('Accent', colors['accent']),
+            ('Button', colors['button_bg']),
+            ('Entry',  colors['entry_bg']),
+        ]
+        n = len(swatches)
+        margin = 8
+        label_height = 16
+        swatch_height = canvas_height - label_height - (margin * 2)
+        total_margin = margin * (n + 1)
+        w = max(1, (canvas_width - total_margin) // n)
+
+        for i, (label, color) in enumerate(swatches):
+            x = margin + i * (w + margin)
+            y_top = margin
+            y_bot = margin + swatch_height
+            try:
+                self.preview_canvas.create_rectangle(
+                    x, y_top, x + w, y_bot,
+                    fill=color, outline='#888888', width=1)
+                self.preview_canvas.create_text(
+                    x + w // 2, y_bot + (label_height // 2) + 2,
+                    text=label, font=('Arial', 8),
+                    fill=self.preview_canvas.cget('bg') and '#000000')
+            except Exception:
+                pass
+
+    def _save(self):
+        name = self.name_var.get().strip()
+        if not name:
+            messagebox.showerror("Validation", "Theme name cannot be empty.",
+                                 parent=self.window)
+            return
+        if name.lower() == 'all':
+            messagebox.showerror("Validation", "'All' is a reserved name.",
+                                 parent=self.window)
+            return
+        if name in THEMES:
+            messagebox.showerror("Validation",
+                f"A built-in theme named '{name}' already exists. Choose a different name.",
+                parent=self.window)
+            return
+
+        colors = self._current_colors()
+        for key, val in colors.items():
+            if not re.match(r'^#[0-9A-Fa-f]{6}$', val):
+                messagebox.showerror("Validation",
+                    f"Invalid color for '{key}': {val}\nMust be a 6-digit hex code like #AABBCC.",
+                    parent=self.window)
+                return
+
+        if self.existing_name and self.existing_name != name:
+            self.db_manager.delete_custom_theme(self.existing_name)
+
+        if self.db_manager.save_custom_theme(name, colors):
+            messagebox.showinfo("Saved", f"Custom theme '{name}' saved!",
+                                parent=self.window)
+            self.on_saved_callback(name)
+            self._close()
+
+    def _close(self):
+        # If closed while open go back
+        if getattr(self, '_preview_previous_theme', None) is not None:
+            self._revert_preview()
+        try:
+            self.window.unbind_all('<MouseWheel>')
+        except Exception:
+            pass
+        self.window.destroy()
+
+    def _preview_in_app(self):
+        """Live preview of theme"""
+        colors = self._current_colors()
+
+        # Check hex values
+        for key, val in colors.items():
+            if not re.match(r'^#[0-9A-Fa-f]{6}$', val):
+                messagebox.showwarning(
+                    "Invalid Color",
+                    f"Cannot preview — invalid color for '{key}': {val}\n"
+                    "Must be a 6-digit hex code like #AABBCC.",
+                    parent=self.window)
+                return
+
+        # Save the current active theme
+        _PREVIEW_KEY = '__preview__'
+        current = self.db_manager.get_setting('theme', 'Light')
+        if current != _PREVIEW_KEY:
+            self._preview_previous_theme = current
+
+        # Temporarily make preview colors/theme. The main frame re-applies the theme when
+        # the setting changes, or when the preview theme it already shows is saved again
+        self.db_manager.save_custom_theme(_PREVIEW_KEY, colors)
+        self.db_manager.set_setting('theme', _PREVIEW_KEY)
+
+        messagebox.showinfo(
+            "Preview Active",
+            "You are now previewing this theme on the main window.\n"
+            "Click 'Revert Preview' to go back to your previous theme.",
+            parent=self.window)
+
+        # Change button
+        self._swap_preview_button(reverting=True)
+
+    def _revert_preview(self):
+        """Restore the theme that was active before previewing"""
+        _PREVIEW_KEY = '__preview__'
+
+        previous = getattr(self, '_preview_previous_theme', 'Light')
+        self.db_manager.set_setting('theme', previous)
+        self.db_manager.delete_custom_theme(_PREVIEW_KEY)
+
+        self._swap_preview_button(reverting=False)
+
+    def _swap_preview_button(self, reverting: bool):
+        """Toggle between Preview in App and Revert Preview buttons"""
+        if not hasattr(self, '_preview_btn_ref'):
+            return
+        if reverting:
+            self._preview_btn_ref.config(text="Revert Preview",
+                                        command=self._revert_preview)
+        else:
+            self._preview_btn_ref.config(text="Preview in App",
+                                        command=self._preview_in_app)
+
+class NewGroupDialog:
+    """Dialog for creating a new group"""
+    
+    def __init__(self, parent, db_manager, callback):
+        self.db_manager = db_manager
+        self.callback = callback
+        
+        self.window = tk.Toplevel(parent)
+        self.window.title("New Group")
+        self.window.geometry("350x160")
+        self.window.resizable(True, True)
+        
+        self.window.update_idletasks()
+        parent_x = parent.winfo_rootx()
+        parent_y = parent.winfo_rooty()
+        x = parent_x + 100
+        y = parent_y + 100
+        self.window.geometry(f"350x160+{x}+{y}")
+        
+        self._apply_window_theme() # Apply theme at top level and not just frames, need to get root window
+        self._create_widgets()
+        self.window.transient(parent)
+        self.window.grab_set()
+        
+    def _apply_window_theme(self):  
+        """Apply theme colors to the dialog window"""
+        theme_name = self.db_manager.get_setting('theme', 'Light')
+        if theme_name in THEMES:
+            theme = THEMES[theme_name]
+            self.window.configure(bg=theme['bg'])
+    
+    def _create_widgets(self):
+        main_frame = ttk.Frame(self.window, padding="20")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        main_frame.grid_columnconfigure(1, weight=1)
+        
+        ttk.Label(main_frame, text="Create New Group", 
+                 font=("Arial", 11, "bold")).grid(row=0, column=0, columnspan=2, pady=(0, 15))
+        
+        ttk.Label(main_frame, text="Group Name:").grid(row=1, column=0, sticky=tk.W, pady=5)
+        self.group_var = tk.StringVar()
+        group_entry = ttk.Entry(main_frame, textvariable=self.group_var, width=25)
+        group_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=5)
+        group_entry.focus()
+        
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=2, column=0, columnspan=2, pady=(15, 0))
+        
+        ttk.Button(button_frame, text="Create", command=self._create_group).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="Cancel", command=self.window.destroy).pack(side=tk.LEFT)
+        
+        self.window.bind('<Return>', lambda e: self._create_group())
+        self.window.bind('<Escape>', lambda e: self.window.destroy())
+    
+    def _create_group(self):
+        """Create the new group"""
+        group_name = self.group_var.get().strip()
+        
+        if not group_name:
+            messagebox.showerror("Error", "Group name cannot be empty!")
+            return
+        
+        if group_name.lower() == "all":
+            messagebox.showerror("Error", "'All' is a reserved group name!")
+            return
+
+        # Limit character length, see issue #131
+        if len(group_name) > 20:
+            messagebox.showerror("Error", "Group name must be 20 characters or fewer.")
+            return
+        
+        if self.db_manager.add_group(group_name):
+            messagebox.showinfo("Success", f"Group '{group_name}' created successfully!")
+            self.callback()
+            self.window.destroy()
+        else:
+            messagebox.showerror("Error", f"Group '{group_name}' already exists!")
+
+
+class ManageGroupsDialog:
+    """Dialog for managing existing groups"""
+    
+    def __init__(self, parent, db_manager, callback):
+        self.db_manager = db_manager
+        self.callback = callback
+        
+        self.window = tk.Toplevel(parent)
+        self.window.title("Manage Groups")
+        self.window.geometry("400x350")
+        self.window.resizable(True, True)
+        
+        self.window.update_idletasks()
+        parent_x = parent.winfo_rootx()
+        parent_y = parent.winfo_rooty()
+        x = parent_x + 75
+        y = parent_y + 75
+        self.window.geometry(f"400x350+{x}+{y}")
+        
+        self._apply_window_theme() # Apply theme at top level and not just frames, need to get root window
+        self._create_widgets()
+        self.window.transient(parent)
+        self.window.grab_set()
+        
+    def _apply_window_theme(self):  
+        """Apply theme colors to the dialog window"""
+        theme_name = self.db_manager.get_setting('theme', 'Light')
+        if theme_name in THEMES:
+            theme = THEMES[theme_name]
+            self.window.configure(bg=theme['bg'])
+    
+    def _create_widgets(self):
+        main_frame = ttk.Frame(self.window, padding="20")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        main_frame.grid_columnconfigure(0, weight=1)
+        main_frame.grid_rowconfigure(1, weight=1)
+        
+        ttk.Label(main_frame, text="Manage Groups", 
+                 font=("Arial", 11, "bold")).grid(row=0, column=0, pady=(0, 15))
+        
+        list_frame = ttk.Frame(main_frame)
+        list_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 15))
+        list_frame.grid_columnconfigure(0, weight=1)
+        list_frame.grid_rowconfigure(0, weight=1)
+        
+        self.groups_listbox = tk.Listbox(list_frame, height=10)
+        self.groups_listbox.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.groups_listbox.yview)
+        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.groups_listbox.configure(yscrollcommand=scrollbar.set)
+        
+        # Set double-click to open the group clicked for manage groups
+        self.groups_listbox.bind('<Double-Button-1>', lambda e: self._rename_group())
+        
+        # Add delete to delete selected group
+        self.groups_listbox.bind('<Delete>', lambda e: self._delete_group())
+        
+        self._populate_groups()
+        
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=2, column=0, pady=(0, 10))
+        
+        ttk.Button(button_frame, text="Rename Group", command=self._rename_group).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="Delete Group", command=self._delete_group).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="Close", command=self.window.destroy).pack(side=tk.LEFT)
+        
+    
+    def _populate_groups(self):
+        """Populate the listbox with groups"""
+        self.groups_listbox.delete(0, tk.END)
+        groups = self.db_manager.get_all_groups()
+        
+        if 'All' in groups:
+            groups.remove('All')
+        
+        if not groups:
+            self.groups_listbox.insert(tk.END, "(No groups created yet)")
+        else:
+            for group in groups:
+                self.groups_listbox.insert(tk.END, group)
+    
+    def _rename_group(self):
+        """Rename selected group"""
+        selection = self.groups_listbox.curselection()
+        if not selection:
+            messagebox.showwarning("No Selection", "Please select a group to rename.")
+            return
+        
+        old_name = self.groups_listbox.get(selection[0])
+        
+        if old_name == "(No groups created yet)":
+            return
+        
+        RenameGroupDialog(self.window, self.db_manager, old_name, self._on_change_complete)
+    
+    def _delete_group(self):
+        """Delete selected group"""
+        selection = self.groups_listbox.curselection()
+        if not selection:
+            messagebox.showwarning("No Selection", "Please select a group to delete.")
+            return
+        
+        group_name = self.groups_listbox.get(selection[0])
+        
+        if group_name == "(No groups created yet)":
+            return
+        
+        if not messagebox.askyesno("Confirm Deletion", 
+                                   f"Are you sure you want to delete the group '{group_name}'?\n\n"
+                                   "Passwords in this group will not be deleted, but will have no group assigned."):
+            return
+        
+        if self.db_manager.delete_group(group_name):
+            messagebox.showinfo("Success", f"Group '{group_name}' deleted successfully!")
+            self._on_change_complete()
+    
+    def _on_change_complete(self):
+        """Called after a group is renamed or deleted"""
+        self._populate_groups()
+        self.callback()
+
+
+class RenameGroupDialog:
+    """Dialog for renaming a group"""
+    
+    def __init__(self, parent, db_manager, old_name, callback):
+        self.db_manager = db_manager
+        self.old_name = old_name
+        self.callback = callback
+        
+        self.window = tk.Toplevel(parent)
+        self.window.title("Rename Group")
+        self.window.geometry("350x150")
+        self.window.resizable(True, True)
+        
+        self.window.update_idletasks()
+        parent_x = parent.winfo_rootx()
+        parent_y = parent.winfo_rooty()
+        x = parent_x + 50
+        y = parent_y + 50
+        self.window.geometry(f"350x150+{x}+{y}")
+        
+        self._apply_window_theme() # Apply theme at top level and not just frames, need to get root window
+        self._create_widgets()
+        self.window.transient(parent)
+        self.window.grab_set()
+        
+    def _apply_window_theme(self):  
+        """Apply theme colors to the dialog window"""
+        theme_name = self.db_manager.get_setting('theme', 'Light')
+        if theme_name in THEMES:
+            theme = THEMES[theme_name]
+            self.window.configure(bg=theme['bg'])
+    
+    def _create_widgets(self):
+        main_frame = ttk.Frame(self.window, padding="20")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        main_frame.grid_columnconfigure(1, weight=1)
+        
+        ttk.Label(main_frame, text=f"Rename Group: {self.old_name}", 
+                 font=("Arial", 10, "bold")).grid(row=0, column=0, columnspan=2, pady=(0, 15))
+        
+        ttk.Label(main_frame, text="New Name:").grid(row=1, column=0, sticky=tk.W, pady=5)
+        self.new_name_var = tk.StringVar(value=self.old_name)
+        name_entry = ttk.Entry(main_frame, textvariable=self.new_name_var, width=25)
+        name_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=5)
+        name_entry.focus()
+        name_entry.select_range(0, tk.END)
+        
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=2, column=0, columnspan=2, pady=(15, 0))
+        
+        ttk.Button(button_frame, text="Rename", command=self._rename).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="Cancel", command=self.window.destroy).pack(side=tk.LEFT)
+        
+        self.window.bind('<Return>', lambda e: self._rename())
+        self.window.bind('<Escape>', lambda e: self.window.destroy())
+    
+    def _rename(self):
+        """Perform the rename"""
+        new_name = self.new_name_var.get().strip()
+        
+        if not new_name:
+            messagebox.showerror("Error", "Group name cannot be empty!")
+            return
+        
+        if new_name.lower() == "all":
+            messagebox.showerror("Error", "'All' is a reserved name!")
+            return
+
+        # Limit character length, see issue #131
+        if len(new_name) > 20:
+            messagebox.showerror("Error", "Group name must be 20 characters or fewer.")
+            return
+        
+        if new_name == self.old_name:
+            self.window.destroy()
+            return
+        
+        if self.db_manager.rename_group(self.old_name, new_name):
+            messagebox.showinfo("Success", f"Group renamed from '{self.old_name}' to '{new_name}'!")
+            self.callback()
+            self.window.destroy()
+
+
+class AutoLockSettingsDialog:
+    """Dialog for configuring auto-lock settings"""
+    
+    def __init__(self, parent, db_manager):
+        self.db_manager = db_manager
+        
+        self.window = tk.Toplevel(parent)
+        self.window.title("Auto-Lock Settings")
+        self.window.geometry("400x180")
+        self.window.resizable(True, True)
+        
+        self.window.update_idletasks()
+        parent_x = parent.winfo_rootx()
+        parent_y = parent.winfo_rooty()
+        x = parent_x + 100
+        y = parent_y + 100
+        self.window.geometry(f"400x180+{x}+{y}")
+        
+        self._apply_window_theme() # Apply theme at top level and not just frames, need to get root window
+        self._create_widgets()
+        self.window.transient(parent)
+        self.window.grab_set()
+    
+    def _apply_window_theme(self):  
+        """Apply theme colors to the dialog window"""
+        theme_name = self.db_manager.get_setting('theme', 'Light')
+        if theme_name in THEMES:
+            theme = THEMES[theme_name]
+            self.window.configure(bg=theme['bg'])
+    
+    def _create_widgets(self):
+        main_frame = ttk.Frame(self.window, padding="20")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        main_frame.grid_columnconfigure(1, weight=1)
+        
+        ttk.Label(main_frame, text="Auto-Lock Configuration", 
+                 font=("Arial", 11, "bold")).grid(row=0, column=0, columnspan=2, pady=(0, 20))
+        
+        self.enabled_var = tk.BooleanVar()
+        enabled_value = self.db_manager.get_setting('auto_lock_enabled', '1')
+        self.enabled_var.set(enabled_value == '1')
+        
+        ttk.Checkbutton(main_frame, text="Enable auto-lock", 
+                       variable=self.enabled_var,
+                       command=self._toggle_enabled).grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=(0, 15))
+        
+        timeout_frame = ttk.Frame(main_frame)
+        timeout_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 20))
+        
+        ttk.Label(timeout_frame, text="Lock after:").pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.minutes_var = tk.StringVar()
+        current_minutes = self.db_manager.get_setting('auto_lock_minutes', '5')
+        self.minutes_var.set(current_minutes)
+        
+        self.minutes_spinbox = ttk.Spinbox(timeout_frame, from_=1, to=60, 
+                                          textvariable=self.minutes_var, 
+                                          width=10,
+                                          state='readonly' if not self.enabled_var.get() else 'normal')
+        self.minutes_spinbox.pack(side=tk.LEFT, padx=(0, 10))
+        
+        ttk.Label(timeout_frame, text="minutes of inactivity").pack(side=tk.LEFT)
+        
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=3, column=0, columnspan=2)
+        
+        ttk.Button(button_frame, text="Save", command=self._save_settings).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="Cancel", command=self.window.destroy).pack(side=tk.LEFT)
+    
+    def _toggle_enabled(self):
+        """Toggle the enabled state of timeout controls"""
+        if self.enabled_var.get():
+            self.minutes_spinbox.config(state='normal')
+        else:
+            self.minutes_spinbox.config(state='readonly')
+    
+    def _save_settings(self):
+        """Save auto-lock settings"""
+        try:
+            enabled = '1' if self.enabled_var.get() else '0'
+            minutes = self.minutes_var.get().strip()
+            
+            try:
+                minutes_int = int(minutes)
+                if minutes_int < 1 or minutes_int > 60:
+                    messagebox.showerror("Invalid Input", "Timeout must be between 1 and 60 minutes.")
+                    return
+            except ValueError:
+                messagebox.showerror("Invalid Input", "Please enter a valid number of minutes.")
+                return
+            
+            self.db_manager.set_setting('auto_lock_enabled', enabled)
+            self.db_manager.set_setting('auto_lock_minutes', minutes)
+            
+            messagebox.showinfo("Success", "Auto-lock settings saved successfully!")
+            self.window.destroy()
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save settings: {str(e)}")
+
+
+class AddEditDialog:
+    """Dialog for adding/editing password records"""
+    
+    def __init__(self, parent, db_manager, callback, record_id=None, site='', username='', password='', 
+                 group=None, initial_password='', default_group=None, date_added=None, date_modified=None):
+        self.db_manager = db_manager
+        self.callback = callback
+        self.record_id = record_id
+        self.date_added = date_added
+        self.date_modified = date_modified
+        
+        if not password and initial_password:
+            password = initial_password
+        
+        if group is None and default_group is not None:
+            group = default_group
+        
+        self.window = tk.Toplevel(parent)
+        self.window.title("Edit Record" if record_id else "Add Record")
+        
+        # Adjust window height if editing (to show dates)
+        window_height = 340 if record_id and (date_added or date_modified) else 250
+        self.window.geometry(f"450x{window_height}")
+        self.window.resizable(True, True)
+        
+        self.window.update_idletasks()
+        parent_x = parent.winfo_rootx()
+        parent_y = parent.winfo_rooty()
+        x = parent_x + 50
+        y = parent_y + 50
+        self.window.geometry(f"450x{window_height}+{x}+{y}")
+        
+        self._apply_window_theme() # Apply theme at top level and not just frames, need to get root window
+        self._create_widgets(site, username, password, group)
+        self.window.transient(parent)
+        self.window.grab_set()
+        
+    def _apply_window_theme(self):  
+        """Apply theme colors to the dialog window"""
+        theme_name = self.db_manager.get_setting('theme', 'Light')
+        if theme_name in THEMES:
+            theme = THEMES[theme_name]
+            self.window.configure(bg=theme['bg'])
+    
+    def _create_widgets(self, site, username, password, group):
+        main_frame = ttk.Frame(self.window, padding="20")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        main_frame.grid_columnconfigure(1, weight=1)
+        
+        current_row = 0
+        
+        ttk.Label(main_frame, text="Site Name:").grid(row=current_row, column=0, sticky=tk.W, pady=5)
+        self.site_var = tk.StringVar(value=site)
+        site_entry = ttk.Entry(main_frame, textvariable=self.site_var)
+        site_entry.grid(row=current_row, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=5)
+        site_entry.focus()
+        current_row += 1
+        
+        ttk.Label(main_frame, text="Username:").grid(row=current_row, column=0, sticky=tk.W, pady=5)
+        self.username_var = tk.StringVar(value=username)
+        username_entry = ttk.Entry(main_frame, textvariable=self.username_var)
+        username_entry.grid(row=current_row, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=5)
+        current_row += 1
+        
+        ttk.Label(main_frame, text="Password:").grid(row=current_row, column=0, sticky=tk.W, pady=5)
+        self.password_var = tk.StringVar(value=password)
+        password_entry = ttk.Entry(main_frame, textvariable=self.password_var)
+        password_entry.grid(row=current_row, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=5)
+        current_row += 1
+        
+        ttk.Label(main_frame, text="Group:").grid(row=current_row, column=0, sticky=tk.W, pady=5)
+        self.group_var = tk.StringVar(value=group if group else "")
+        
+        groups = self.db_manager.get_all_groups()
+        if 'All' in groups:
+            groups.remove('All')
+        
+        self.group_combo = ttk.Combobox(main_frame, textvariable=self.group_var, values=groups)
+        self.group_combo.grid(row=current_row, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=5)
+        self.group_combo['postcommand'] = lambda: self._suppress_empty_group_dropdown(self.group_combo)
+        current_row += 1
+        
+        # Show date fields only when editing
+        if self.record_id and (self.date_added or self.date_modified):
+            # Add separator
+            separator = ttk.Separator(main_frame, orient='horizontal')
+            separator.grid(row=current_row, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=15)
+            current_row += 1
+            
+            # Date Added
+            if self.date_added:
+                ttk.Label(main_frame, text="Date Added:", font=("Arial", 9, "bold")).grid(
+                    row=current_row, column=0, sticky=tk.W, pady=3)
+                self.date_added_label = ttk.Label(main_frame, text=self._format_date(self.date_added), 
+                                             font=("Arial", 9))
+                self.date_added_label.grid(row=current_row, column=1, sticky=tk.W, padx=(10, 0), pady=3)
+                current_row += 1
+            
+            # Date Modified
+            if self.date_modified:
+                ttk.Label(main_frame, text="Last Modified:", font=("Arial", 9, "bold")).grid(
+                    row=current_row, column=0, sticky=tk.W, pady=3)
+                self.date_modified_label = ttk.Label(main_frame, text=self._format_date(self.date_modified), 
+                                                font=("Arial", 9))
+                self.date_modified_label.grid(row=current_row, column=1, sticky=tk.W, padx=(10, 0), pady=3)
+                current_row += 1
+        
+        # Apply theme colors to date labels
+        self._apply_theme_to_dialog()
+        
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=current_row, column=0, columnspan=2, pady=(20, 0))
+        
+        action_text = "Update" if self.record_id else "Add"
+        ttk.Button(button_frame, text=action_text, command=self._save).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="Cancel", command=self._cancel).pack(side=tk.LEFT)
+        
+        self.window.bind('<Return>', lambda e: self._save())
+        self.window.bind('<Escape>', lambda e: self._cancel())
+    
+    def _suppress_empty_group_dropdown(self, combo):
+        """Prevent dropdown list from opening immediately if no group exists"""
+        if not combo['values']:
+            combo.after(1, lambda: combo.tk.call('ttk::combobox::Unpost', combo._w))
+    
+    def _apply_theme_to_dialog(self):
+        """Apply theme colors to date labels in dialog"""
+        try:
+            theme_name = self.db_manager.get_setting('theme', 'Light')
+            if theme_name in THEMES:
+                theme = THEMES[theme_name]
+                
+                # Apply accent color to date labels
+                if hasattr(self, 'date_added_label'):
+                    self.date_added_label.configure(foreground=theme['accent'])
+                if hasattr(self, 'date_modified_label'):
+                    self.date_modified_label.configure(foreground=theme['accent'])
+        except:
+            pass
+    
+    def _format_date(self, date_str):
+        """Format date string for display"""
+        if not date_str:
+            return "N/A"
+        
+        try:
+            # Handle different date formats
+            for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d']:
+                try:
+                    dt = datetime.strptime(date_str, fmt)
+                    return dt.strftime('%B %d, %Y at %I:%M %p')
+                except ValueError:
+                    continue
+            
+            # If parsing fails, return as is
+            return date_str
+        except:
+            return date_str
+    
+    def _save(self):
+        """Save the record"""
+        site = self.site_var.get().strip()
+        username = self.username_var.get().strip()
+        password = self.password_var.get().strip()
+        group = self.group_var.get().strip()
+        
+        if not site:
+            messagebox.showerror("Validation Error", "Site name is required!")
+            return
+        
+        if len(site) > 100:
+            messagebox.showerror("Validation Error", "Site name must be 100 characters or fewer.")
+            return
+        
+        if len(username) > 100:
+            messagebox.showerror("Validation Error", "Username must be 100 characters or fewer.")
+            return
+        
+        if not password:
+            messagebox.showerror("Validation Error", "Password is required!")
+            return
+        
+        if not group:
+            group = None
+        
+        try:
+            if self.record_id:
+                success = self.db_manager.update_record(self.record_id, site, username, password, group)
+                if success:
+                    messagebox.showinfo("Success", "Record updated successfully!")
+                else:
+                    return
+            else:
+                record_id = self.db_manager.add_record(site, username, password, group)
+                if record_id:
+                    messagebox.showinfo("Success", "Record added successfully!")
+                else:
+                    return
+            
+            self.callback()
+            self.window.destroy()
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save record: {str(e)}")
+    
+    def _cancel(self):
+        """Cancel the dialog"""
+        self.window.destroy()
+
+
+class ImportDialog:
+    """Dialog for importing passwords from CSV files"""
+    
+    def __init__(self, parent, db_manager, tasks, callback, current_group=None):
+        self.db_manager = db_manager
+        self.tasks = tasks
+        self.callback = callback
+        self.current_group = current_group
+        self.filename = None
+        self.task = None
+        
+        self.window = tk.Toplevel(parent)
+        self.window.title("Import Passwords")
+        self.window.geometry("350x300")
+        self.window.resizable(True, True)
+        
+        self.window.update_idletasks()
+        parent_x = parent.winfo_rootx()
+        parent_y = parent.winfo_rooty()
+        x = parent_x + 75
+        y = parent_y + 75
+        self.window.geometry(f"350x300+{x}+{y}")
+        
+        self._apply_window_theme() # Apply theme at top level and not just frames, need to get root window
+        self._create_widgets()
+        self.window.transient(parent)
+        self.window.grab_set()
+        self.window.protocol("WM_DELETE_WINDOW", self._cancel)
+        
+    def _apply_window_theme(self):  
+        """Apply theme colors to the dialog window"""
+        theme_name = self.db_manager.get_setting('theme', 'Light')
+        if theme_name in THEMES:
+            theme = THEMES[theme_name]
+            self.window.configure(bg=theme['bg'])
+    
+    def _create_widgets(self):
+        main_frame = ttk.Frame(self.window, padding="20")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        ttk.Label(main_frame, text="Select data source:", font=("Arial", 10, "bold")).grid(
+            row=0, column=0, sticky=tk.W, pady=(0, 10))
+        
+        self.source_var = tk.StringVar(value="Chrome")
+        sources = [("Chrome", "Chrome"), ("Firefox", "Firefox")]
+        
+        for i, (text, value) in enumerate(sources):
+            ttk.Radiobutton(main_frame, text=text, variable=self.source_var, 
+                           value=value).grid(row=i+1, column=0, sticky=tk.W, pady=2)
+        
+        ttk.Label(main_frame, text="Import to group:", font=("Arial", 10)).grid(
+            row=3, column=0, sticky=tk.W, pady=(15, 5))
+        
+        self.group_var = tk.StringVar(value=self.current_group if self.current_group else "")
+        groups = self.db_manager.get_all_groups()
+        if 'All' in groups:
+            groups.remove('All')
+        
+        group_combo = ttk.Combobox(main_frame, textvariable=self.group_var, values=groups, width=25)
+        group_combo.grid(row=4, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
+        group_combo['postcommand'] = lambda: self._suppress_empty_group_dropdown(group_combo)
+        
+        file_frame = ttk.Frame(main_frame)
+        file_frame.grid(row=5, column=0, sticky=(tk.W, tk.E), pady=(10, 10))
+        file_frame.grid_columnconfigure(1, weight=1)
+        
+        ttk.Label(file_frame, text="File:").grid(row=0, column=0, sticky=tk.W)
+        self.file_var = tk.StringVar()
+        file_entry = ttk.Entry(file_frame, textvariable=self.file_var, state='readonly', width=20)
+        file_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(10, 10))
+        ttk.Button(file_frame, text="Browse", command=self._browse_file).grid(row=0, column=2)
+        
+        self.progress_var = tk.StringVar()
+        ttk.Label(main_frame, textvariable=self.progress_var, font=("Arial", 8)).grid(
+            row=6, column=0, sticky=tk.W)
+        
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=7, column=0, pady=(10, 0))
+        
+        self.import_btn = ttk.Button(button_frame, text="Import", command=self._import_passwords, state='disabled')
+        self.import_btn.pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="Cancel", command=self._cancel).pack(side=tk.LEFT)
+    
+    def _suppress_empty_group_dropdown(self, combo):
+        """Prevent dropdown list from opening immediately if no group exists"""
+        if not combo['values']:
+            combo.after(1, lambda: combo.tk.call('ttk::combobox::Unpost', combo._w))
+    
+    def _browse_file(self):
+        """Browse for CSV file"""
+        filename = filedialog.askopenfilename(
+            title="Select CSV File",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        
+        if filename:
+            self.filename = filename
+            self.file_var.set(filename)
+            self.import_btn.config(state='normal')
+    
+    def _import_passwords(self):
+        """Import passwords from CSV file"""
+        if not self.filename:
+            messagebox.showerror("Error", "Please select a file to import.")
+            return
+        
+        filename = self.filename
+        source = self.source_var.get()
+        group = self.group_var.get().strip()
+        
+        if group == "(None)" or group == "":
+            group = None
+        
+        def import_file(task):
+            with open(filename, 'r', newline='', encoding='utf-8') as file:
+                if not file.readline():
+                    return None
+                file.seek(0)
+                
+                return self.db_manager.add_records(iter_import_rows(file, source), group,
+                                                   progress=task.report, cancelled=task.is_cancelled)
+        
+        self.import_btn.config(state='disabled')
+        self.progress_var.set("Importing...")
+        self.task = self.tasks.submit(import_file, on_done=lambda count: self._import_done(count, group),
+                                      on_error=self._import_failed, on_progress=self._show_progress)
+    
+    def _import_done(self, imported_count: Optional[int], group: Optional[str]):
+        """Report the result of an import that finished on the worker"""
+        self.task = None
+        if imported_count:
+            # Refresh the list even if the dialog was closed while the import finished
+            self.callback()
+        
+        if not self.window.winfo_exists():
+            return
+        
+        if imported_count is None:
+            messagebox.showerror("Error", "The selected file appears to be empty.", parent=self.window)
+        elif imported_count > 0:
+            group_msg = f"to group '{group}'" if group else "without a group"
+            messagebox.showinfo("Success", f"Successfully imported {imported_count} password(s) {group_msg}!")
+            self.window.destroy()
+            return
+        else:
+            messagebox.showwarning("No Data", "No valid password records were found in the file.", parent=self.window)
+        
+        self.progress_var.set("")
+        self.import_btn.config(state='normal')
+    
+    def _import_failed(self, error: Exception):
+        self.task = None
+        if isinstance(error, OperationCancelled) or not self.window.winfo_exists():
+            return
+        
+        messagebox.showerror("Import Error", f"Failed to import passwords: {str(error)}", parent=self.window)
+        self.progress_var.set("")
+        self.import_btn.config(state='normal')
+    
+    def _show_progress(self, count: int):
+        """Show how many records have been imported so far"""
+        if self.window.winfo_exists():
+            self.progress_var.set(f"Imported {count} password(s)...")
+    
+    def _cancel(self):
+        """Close the dialog, stopping an import in progress. Nothing is saved from a cancelled import"""
+        if self.task:
+            self.task.cancel()
+        self.window.destroy()
+
+
+class ExportDialog:
+    """Dialog for exporting passwords to a CSV file"""
+    def __init__(self, parent, db_manager, tasks, current_group="All"):
+        self.db_manager = db_manager
+        self.tasks = tasks
+        self.current_group = current_group if current_group else "All"
+        self.filename = None
+        self.task = None
+        
+        self.window = tk.Toplevel(parent)
+        self.window.title("Export Passwords")
+        self.window.geometry("400x325")
+        self.window.resizable(True, True)
+        
+        self.window.update_idletasks()
+        parent_x = parent.winfo_rootx()
+        parent_y = parent.winfo_rooty()
+        x = parent_x + 75
+        y = parent_y + 75
+        self.window.geometry(f"400x325+{x}+{y}")
+        
+        self._apply_window_theme()
+        self._create_widgets()
+        self.window.transient(parent)
+        self.window.grab_set()
+        self.window.protocol("WM_DELETE_WINDOW", self._cancel)
+    
+    def _apply_window_theme(self):  
+        """Apply theme colors to the dialog window"""
+        theme_name = self.db_manager.get_setting('theme', 'Light')
+        if theme_name in THEMES:
+            theme = THEMES[theme_name]
+            self.window.configure(bg=theme['bg'])
+    
+    def _create_widgets(self):
+        main_frame = ttk.Frame(self.window, padding="20")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        main_frame.grid_columnconfigure(0, weight=1)
+        
+        ttk.Label(main_frame, text="Export passwords from group:", font=("Arial", 10, "bold")).grid(
+            row=0, column=0, sticky=tk.W, pady=(0, 5))
+        
+        groups = self.db_manager.get_all_groups()
+        self.group_var = tk.StringVar(value=self.current_group if self.current_group in groups else "All")
+        group_combo = ttk.Combobox(main_frame, textvariable=self.group_var, values=groups,
+                                    state='readonly', width=25)
+        group_combo.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 15))
+        
+        file_frame = ttk.Frame(main_frame)
+        file_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
+        file_frame.grid_columnconfigure(1, weight=1)
+        
+        ttk.Label(file_frame, text="Save to:").grid(row=0, column=0, sticky=tk.W)
+        self.file_var = tk.StringVar()
+        file_entry = ttk.Entry(file_frame, textvariable=self.file_var, state='readonly', width=20)
+        file_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(10, 10))
+        ttk.Button(file_frame, text="Browse", command=self._browse_file).grid(row=0, column=2)
+        
+        warning_label = ttk.Label(
+            main_frame,
+            text=("Warning: the exported file stores passwords in\n"
+                  "plain text, not encrypted. Store it securely and\n"
+                  "delete it when you're done."),
+            font=("Arial", 8), foreground="#B91C1C", justify=tk.LEFT)
+        warning_label.grid(row=3, column=0, sticky=tk.W, pady=(10, 5))
+        
+        self.progress_var = tk.StringVar()
+        ttk.Label(main_frame, textvariable=self.progress_var, font=("Arial", 8)).grid(
+            row=4, column=0, sticky=tk.W, pady=(0, 10))
+        
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=5, column=0)
+        
+        self.export_btn = ttk.Button(button_frame, text="Export", command=self._export_passwords, state='disabled')
+        self.export_btn.pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="Cancel", command=self._cancel).pack(side=tk.LEFT)
+    
+    def _browse_file(self):
+        """Browse for CSV save location"""
+        filename = filedialog.asksaveasfilename(
+            title="Save CSV File",
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        
+        if filename:
+            self.filename = filename
+            self.file_var.set(filename)
+            self.export_btn.config(state='normal')
+    
+    def _export_passwords(self):
+        """Decrypt and write records to a CSV file"""
+        if not self.filename:
+            messagebox.showerror("Error", "Please choose a file to save to.")
+            return
+        
+        if not messagebox.askyesno(
+            "Confirm Export",
+            "This will write your passwords to a plain text CSV file.\n"
+            "Anyone with access to that file will be able to read them.\n\n"
+            "Continue?"):
+            return
+        
+        filename = self.filename
+        group_filter = self.group_var.get()
+        
+        self.export_btn.config(state='disabled')
+        self.task = self.tasks.submit(
+            lambda task: export_records_csv(self.db_manager, filename, group_filter, progress=task.report,
+                                            cancelled=task.is_cancelled),
+            on_done=self._export_done, on_error=self._export_failed, on_progress=self._show_progress)
+    
+    def _export_done(self, exported_count: int):
+        self.task = None
+        if not self.window.winfo_exists():
+            return
+        
+        if exported_count > 0:
+            messagebox.showinfo("Success", f"Successfully exported {exported_count} password(s)!")
+            self.window.destroy()
+            return
+        
+        messagebox.showwarning("No Data", "No records were found to export.", parent=self.window)
+        self.progress_var.set("")
+        self.export_btn.config(state='normal')
+    
+    def _export_failed(self, error: Exception):
+        self.task = None
+        if isinstance(error, OperationCancelled) or not self.window.winfo_exists():
+            return
+        
+        messagebox.showerror("Export Error", f"Failed to export passwords: {str(error)}", parent=self.window)
+        self.progress_var.set("")
+        self.export_btn.config(state='normal')
+    
+    def _show_progress(self, count: int):
+        """Show how many records have been exported so far"""
+        if self.window.winfo_exists():
+            self.progress_var.set(f"Exported {count} password(s)...")
+    
+    def _cancel(self):
+        """Close the dialog, stopping an export in progress. A cancelled export leaves no file behind"""
+        if self.task:
+            self.task.cancel()
+        self.window.destroy()
+
+
+class ChangeMasterPasswordDialog:
+    """Dialog for changing master password"""
+    
+    def __init__(self, parent, db_manager, tasks):
+        self.db_manager = db_manager
+        self.tasks = tasks
+        self.task = None
+        
+        self.window = tk.Toplevel(parent)
+        self.window.title("Change Master Password")
+        self.window.geometry("400x150")
+        self.window.resizable(True, True)
+        
+        self.window.update_idletasks()
+        parent_x = parent.winfo_rootx()
+        parent_y = parent.winfo_rooty()
+        x = parent_x + 100
+        y = parent_y + 100
+        self.window.geometry(f"400x150+{x}+{y}")
+        
+        self._apply_window_theme() # Apply theme at top level and not just frames, need to get root window
+        self._create_widgets()
+        self.window.transient(parent)
+        self.window.grab_set()
+        
+    def _apply_window_theme(self):  
+        """Apply theme colors to the dialog window"""
+        theme_name = self.db_manager.get_setting('theme', 'Light')
+        if theme_name in THEMES:
+            theme = THEMES[theme_name]
+            self.window.configure(bg=theme['bg'])
+    
+    def _create_widgets(self):
+        main_frame = ttk.Frame(self.window, padding="20")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        main_frame.grid_columnconfigure(1, weight=1)
+        
+        ttk.Label(main_frame, text="Enter new master password:", 
+                 font=("Arial", 10, "bold")).grid(row=0, column=0, columnspan=2, pady=(0, 20))
+        
+        ttk.Label(main_frame, text="New Password:").grid(row=1, column=0, sticky=tk.W, pady=5)
+        self.password_var = tk.StringVar()
+        password_entry = ttk.Entry(main_frame, textvariable=self.password_var, show='*')
+        password_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=5)
+        password_entry.focus()
+        
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=2, column=0, columnspan=2, pady=(20, 0))
+        
+        self.change_btn = ttk.Button(button_frame, text="Change Password", command=self._change_password)
+        self.change_btn.pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="Cancel", command=self.window.destroy).pack(side=tk.LEFT)
+        
+        self.window.bind('<Return>', lambda e: self._change_password())
+    
+    def _change_password(self):
+        """Change the master password on a background task, hashing it takes a moment"""
+        if self.task:
+            return
+        
+        new_password = self.password_var.get().strip()
+        
+        if not new_password:
+            messagebox.showerror("Error", "Password cannot be empty!")
+            return
+        
+        if len(new_password) < 4:
+            messagebox.showerror("Error", "Password must be at least 4 characters long!")
+            return
+        
+        if not messagebox.askyesno("Confirm", "Are you sure you want to change your master password?"):
+            return
+        
+        self.change_btn.config(state='disabled')
+        self.task = self.tasks.submit(lambda task: self.db_manager.change_master_password(new_password),
+                                      on_done=self._change_done, on_error=self._change_failed)
+    
+    def _change_done(self, changed: bool):
+        self.task = None
+        messagebox.showinfo("Success", "Master password changed successfully!")
+        if self.window.winfo_exists():
+            self.window.destroy()
+    
+    def _change_failed(self, error: Exception):
+        self.task = None
+        messagebox.showerror("Error", str(error))
+        if self.window.winfo_exists():
+            self.change_btn.config(state='normal')
+
+
+class DiagnosticsDialog:
+    """Shows the timings recorded by vault.instrument, and turns recording on and off"""
+    
+    COLUMNS = (('name', "Name", 260), ('calls', "Calls", 60), ('total_ms', "Total ms", 80),
+               ('mean_ms', "Mean ms", 70), ('p50_ms', "p50 ms", 70), ('p95_ms', "p95 ms", 70),
+               ('max_ms', "Max ms", 70), ('rows', "Rows", 70))
+    
+    def __init__(self, parent, db_manager):
+        self.db_manager = db_manager
+        self.timings: Dict[str, dict] = {}
+        
+        self.window = tk.Toplevel(parent)
+        self.window.title("Diagnostics")
+        self.window.geometry("800x450")
+        self.window.resizable(True, True)
+        
+        self.window.update_idletasks()
+        parent_x = parent.winfo_rootx()
+        parent_y = parent.winfo_rooty()
+        x = parent_x + 50
+        y = parent_y + 50
+        self.window.geometry(f"800x450+{x}+{y}")
+        
+        self._apply_window_theme()
+        self._create_widgets()
+        self._refresh()
+        self.window.transient(parent)
+    
+    def _apply_window_theme(self):
+        """Apply theme colors to the dialog window"""
+        theme_name = self.db_manager.get_setting('theme', 'Light')
+        if theme_name in THEMES:
+            theme = THEMES[theme_name]
+            self.window.configure(bg=theme['bg'])
+    
+    def _create_widgets(self):
+        self.window.grid_rowconfigure(0, weight=1)
+        self.window.grid_columnconfigure(0, weight=1)
+        main_frame = ttk.Frame(self.window, padding="20")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        main_frame.grid_rowconfigure(2, weight=1)
+        main_frame.grid_columnconfigure(0, weight=1)
+        
+        self.enabled_var = tk.BooleanVar(value=instrument.is_enabled())
+        ttk.Checkbutton(main_frame, text="Record timings", variable=self.enabled_var,
+                        command=self._toggle_enabled).grid(row=0, column=0, sticky=tk.W)
+        ttk.Label(main_frame, text=("Times include the calls nested in them, so a MainFrame refresh includes "
+                                    "its DatabaseManager calls,\nwhich include their Fernet calls."),
+                  font=("Arial", 8), justify=tk.LEFT).grid(row=1, column=0, sticky=tk.W, pady=(5, 10))
+        
+        tree_frame = ttk.Frame(main_frame)
+        tree_frame.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        tree_frame.grid_rowconfigure(0, weight=1)
+        tree_frame.grid_columnconfigure(0, weight=1)
+        
+        self.tree = ttk.Treeview(tree_frame, columns=[key for key, _, _ in self.COLUMNS], show='headings')
+        for key, heading, width in self.COLUMNS:
+            self.tree.heading(key, text=heading)
+            self.tree.column(key, width=width, minwidth=50, anchor=tk.W if key == 'name' else tk.E)
+        self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.bind('<<TreeviewSelect>>', lambda e: self._show_histogram())
+        
+        self.histogram_var = tk.StringVar()
+        ttk.Label(main_frame, textvariable=self.histogram_var, font=("Arial", 8), justify=tk.LEFT).grid(
+            row=3, column=0, sticky=tk.W, pady=(10, 10))
+        
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=4, column=0)
+        
+        ttk.Button(button_frame, text="Refresh", command=self._refresh).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="Reset", command=self._reset).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="Save JSON...", command=self._save_json).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="Close", command=self.window.destroy).pack(side=tk.LEFT)
+    
+    def _toggle_enabled(self):
+        """Start or stop recording"""
+        if self.enabled_var.get():
+            instrument.enable()
+        else:
+            instrument.disable()
+        self._refresh()
+    
+    def _refresh(self):
+        """Show the latest timings, slowest total first"""
+        selected = self.tree.selection()
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+        
+        self.timings = {timing['name']: timing for timing in instrument.snapshot()}
+        for name, timing in self.timings.items():
+            self.tree.insert('', 'end', iid=name, values=[timing[key] for key, _, _ in self.COLUMNS])
+        
+        selected = [name for name in selected if name in self.timings]
+        if selected:
+            self.tree.selection_set(selected)
+        self._show_histogram()
+    
+    def _show_histogram(self):
+        """Show how the selected timing's calls spread over the histogram buckets"""
+        selected = self.tree.selection()
+        if not selected:
+            self.histogram_var.set("Select a row to see its latency histogram." if self.timings
+                                   else "Nothing recorded yet. Tick Record timings, then use the app.")
+            return
+        
+        histogram = self.timings[selected[0]]['histogram_ms']
+        buckets = [f"{bucket} ms: {count}" for bucket, count in histogram.items() if count]
+        self.histogram_var.set(f"{selected[0]}\n" + "   ".join(buckets))
+    
+    def _reset(self):
+        """Forget the recorded timings"""
+        instrument.reset()
+        self._refresh()
+    
+    def _save_json(self):
+        """Write the recorded timings to a JSON file"""
+        filename = filedialog.asksaveasfilename(
+            parent=self.window,
+            title="Save Diagnostics",
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+        
+        try:
+            instrument.dump_json(filename)
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to save diagnostics: {e}", parent=self.window)
+
+
+class StartupTrace:
+    """Startup timings for --startup-trace, printed once the first window has been drawn"""
+    
+    def __init__(self, started: float):
+        self.started = started
+        self._last = started
+        self.stages: List[Tuple[str, float]] = []
+    
+    def mark(self, stage: str, **parts: float):
+        """Record the time since the previous mark as stage. parts are timed within it and listed separately"""
+        now = time.perf_counter()
+        self.stages.append((stage, now - self._last - sum(parts.values())))
+        self.stages.extend(parts.items())
+        self._last = now
+    
+    def report(self):
+        """Print each stage and the total in milliseconds"""
+        print("Startup trace (ms):")
+        for stage, seconds in self.stages:
+            print(f"  {stage:<14}{seconds * 1000:8.1f}")
+        print(f"  {'total':<14}{(self._last - self.started) * 1000:8.1f}")
+
+
+class PasswordManagerApp:
+    """Main application class"""
+    
+    def __init__(self, trace: Optional[StartupTrace] = None):
+        self.trace = trace
+        self.root = tk.Tk()
+        self.root.title("RandPyPwGen v2.0.3")
+        self.root.geometry("900x700")
+        
+        self.root.update_idletasks()
+        x = (self.root.winfo_screenwidth() // 2) - (900 // 2)
+        y = (self.root.winfo_screenheight() // 2) - (700 // 2)
+        self.root.geometry(f"900x700+{x}+{y}")
+        
+        self.root.grid_rowconfigure(0, weight=1)
+        self.root.grid_columnconfigure(0, weight=1)
+        if trace:
+            trace.mark("window")
+        
+        self.db_manager = TkDatabaseManager()
+        self.tasks = TaskRunner(self.root)
+        if trace:
+            trace.mark("db open", migrations=self.db_manager.migration_seconds)
+        
+        self.current_frame = None
+        self._show_login()
+        if trace:
+            trace.mark("login frame")
+    
+    def _show_login(self):
+        """Show login frame"""
+        if self.current_frame:
+            self.current_frame.destroy()
+        
+        self.db_manager.lock()
+        
+        self.current_frame = LoginFrame(self.root, self.db_manager, self._show_main, self.tasks)
+        self.current_frame.grid(row=0, column=0)
+        
+        self.root.geometry("400x230")
+        self.root.title("RandPyPwGen - Login")
+    
+    def _show_main(self):
+        """Show main application frame"""
+        if self.current_frame:
+            self.current_frame.destroy()
+        
+        self.root.geometry("900x700")
+        self.root.title("RandPyPwGen v2.0.3")
+        
+        self.current_frame = MainFrame(self.root, self.db_manager, self._show_login, self.tasks)
+        self.current_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+    
+    def run(self):
+        """Run the application"""
+        self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
+        if self.trace:
+            # Idle callbacks run in order, so this comes after Tk has drawn the login frame
+            self.root.after_idle(self._report_startup)
+        self.root.mainloop()
+    
+    def _report_startup(self):
+        """Finish and print the --startup-trace timings"""
+        self.trace.mark("first draw")
+        self.trace.report()
+    
+    def _on_closing(self):
+        """Handle application closing"""
+        self.tasks.shutdown()
+        self.db_manager.close()
+        self.root.quit()
+
+
+def main(trace: Optional[StartupTrace] = None):
+    """Main executable"""
+    try:
+        app = PasswordManagerApp(trace)
+        app.run()
+    except KeyboardInterrupt:
+        print("\nApplication interrupted by user.")
+        sys.exit(0)
+    except VaultNotFound:
+        # Setup was cancelled
+        sys.exit(1)
+    except Exception as e:
+        messagebox.showerror("Fatal Error", f"An unexpected error occurred: {str(e)}")
+        sys.exit(1)
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""Benchmarks for the vault, printed as JSON so results can be compared between releases.
+
+    python benchmark.py --records 1000 100000 --groups 8 --repeat 5 --output results.json
+
+For each size a synthetic vault is generated through DatabaseManager, then listing, searching,
+adding, importing, exporting, changing the master password and filling the password list are
+timed. Writes run against a copy of the vault, so a vault kept with --vault-dir can be reused
+by later runs. Filling the password list needs Tk and a display; without DISPLAY on Linux an
+Xvfb virtual display is started if Xvfb is installed, otherwise that benchmark is skipped.
+
+Progress goes to stderr and the JSON to stdout, or to the --output file.
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from vault import DatabaseManager, export_records_csv, iter_import_rows
+
+
+PASSWORD = 'benchmark-master-password'
+WORDS = ('mail', 'bank', 'shop', 'cloud', 'news', 'social', 'games', 'music',
+         'travel', 'forum', 'photo', 'video', 'code', 'docs', 'chat')
+TLDS = ('com', 'org', 'net', 'io', 'dev')
+
+
+class _NewVault(DatabaseManager):
+    """DatabaseManager that sets up a missing vault with PASSWORD instead of declining"""
+    
+    INTERACTIVE_SETUP = True
+    
+    def _setup_master_password(self) -> bool:
+        self._create_master_password(PASSWORD)
+        return True
+
+
+def _log(message: str):
+    print(message, file=sys.stderr, flush=True)
+
+
+def synthetic_rows(count: int, groups: int, seed: int = 1) -> Iterator[Tuple[str, str, str, str]]:
+    """(site, username, password, group) rows. Record i has site WORDS[i % len(WORDS)] + str(i)
+    and about one in five records has no group"""
+    rng = random.Random(seed)
+    alphabet = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!#$%&*+-=?@^_'
+    for i in range(1, count + 1):
+        site = f"{WORDS[i % len(WORDS)]}{i}.{TLDS[i % len(TLDS)]}"
+        username = f"user{rng.randrange(1000)}@example.com"
+        password = ''.join(rng.choice(alphabet) for _ in range(rng.randint(12, 24)))
+        group = f"Group {rng.randrange(groups) + 1}" if groups and rng.random() > 0.2 else ''
+        yield site, username, password, group
+
+
+def generate_vault(path: Path, records: int, groups: int) -> float:
+    """Create a vault of synthetic records at path, returning how long it took in seconds"""
+    start = time.perf_counter()
+    db_manager = _NewVault(str(path))
+    try:
+        db_manager.unlock(PASSWORD)
+        db_manager.add_records(synthetic_rows(records, groups), chunk_size=5000)
+    finally:
+        db_manager.close()
+    return time.perf_counter() - start
+
+
+def _timings(runs: List[float], rows: Optional[int] = None) -> dict:
+    result = {
+        'runs_ms': [round(seconds * 1000, 3) for seconds in runs],
+        'min_ms': round(min(runs) * 1000, 3),
+        'median_ms': round(statistics.median(runs) * 1000, 3),
+        'mean_ms': round(statistics.fmean(runs) * 1000, 3),
+    }
+    if rows is not None:
+        result['rows'] = rows
+    return result
+
+
+def _time(call: Callable, repeat: int, before: Optional[Callable] = None) -> Tuple[List[float], object]:
+    """Run call repeat times, calling before (untimed) ahead of each run"""
+    runs = []
+    result = None
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        result = call()
+        runs.append(time.perf_counter() - start)
+    return runs, result
+
+
+def bench_reads(db_manager: DatabaseManager, records: int, repeat: int) -> Dict[str, dict]:
+    """Listing and searching, with the query cache cleared before each run"""
+    results = {}
+    clear = db_manager.clear_query_cache
+    rare = records // 2 or 1
+    
+    runs, rows = _time(lambda: db_manager.get_all_records(), repeat, clear)
+    results['get_all_records'] = _timings(runs, len(rows))
+    runs, rows = _time(lambda: db_manager.get_all_records("Group 1"), repeat, clear)
+    results['get_all_records_group'] = _timings(runs, len(rows))
+    
+    searches = {
+        'search_records_common': WORDS[0],
+        'search_records_rare': f"{WORDS[rare % len(WORDS)]}{rare}",
+        'search_records_short': WORDS[1][:2],
+    }
+    for name, term in searches.items():
+        runs, rows = _time(lambda: db_manager.search_records(term), repeat, clear)
+        results[name] = _timings(runs, len(rows))
+    
+    runs, _ = _time(lambda: db_manager.get_search_index(), 1)
+    results['load_search_index'] = _timings(runs)
+    runs, rows = _time(lambda: db_manager.search_records('travle', fuzzy=True), repeat, clear)
+    results['search_records_fuzzy'] = _timings(runs, len(rows))
+    return results
+
+
+def bench_writes(db_manager: DatabaseManager, repeat: int, adds: int, import_rows: int,
+                 work_dir: Path) -> Dict[str, dict]:
+    """Exporting, adding, importing and changing the master password"""
+    results = {}
+    
+    export_path = work_dir / 'export.csv'
+    runs, count = _time(lambda: export_records_csv(db_manager, str(export_path)), repeat)
+    results['export'] = _timings(runs, count)
+    
+    counter = iter(range(10 ** 9))
+    runs, _ = _time(lambda: [db_manager.add_record(f"added{next(counter)}.com", 'bench', 'pw', 'Group 1')
+                             for _ in range(adds)], repeat)
+    results['add_record'] = _timings([seconds / adds for seconds in runs])
+    results['add_record']['batch'] = adds
+    
+    # A Chrome export: name, url, username, password
+    csv_path = work_dir / 'import.csv'
+    with open(csv_path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(['name', 'url', 'username', 'password'])
+        writer.writerows((site, f"https://{site}", username, password)
+                         for site, username, password, _ in synthetic_rows(import_rows, 0, seed=2))
+    
+    def import_csv():
+        with open(csv_path, 'r', newline='', encoding='utf-8') as file:
+            return db_manager.add_records(iter_import_rows(file, 'Chrome'), 'Imported')
+    runs, count = _time(import_csv, repeat)
+    results['import'] = _timings(runs, count)
+    
+    passwords = iter([PASSWORD + '-changed', PASSWORD] * repeat)
+    runs, _ = _time(lambda: db_manager.change_master_password(next(passwords)), repeat)
+    results['change_master_password'] = _timings(runs)
+    return results
+
+
+class _VirtualDisplay:
+    """Starts Xvfb when Tk has no display to use, and stops it again"""
+    
+    def __init__(self):
+        self.process = None
+    
+    def __enter__(self):
+        if sys.platform.startswith('linux') and not os.environ.get('DISPLAY') and shutil.which('Xvfb'):
+            display = ':%d' % (90 + os.getpid() % 100)
+            self.process = subprocess.Popen(['Xvfb', display, '-nolisten', 'tcp'],
+                                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            os.environ['DISPLAY'] = display
+            time.sleep(0.5)
+        return self
+    
+    def __exit__(self, *exc):
+        if self.process:
+            self.process.terminate()
+            self.process.wait()
+            del os.environ['DISPLAY']
+
+
+def bench_treeview(db_path: Path, repeat: int) -> dict:
+    """Fill the main window's password list with its first page, as on login or switching groups"""
+    try:
+        import tkinter as tk
+        import app
+    except ImportError as e:
+        return {'skipped': f"Tk is not available: {e}"}
+    
+    with _VirtualDisplay():
+        try:
+            root = tk.Tk()
+        except tk.TclError as e:
+            return {'skipped': f"no display: {e}"}
+        
+        root.withdraw()
+        db_manager = app.TkDatabaseManager(str(db_path))
+        tasks = app.TaskRunner(root)
+        try:
+            db_manager.unlock(PASSWORD)
+            frame = app.MainFrame(root, db_manager, lambda: None, tasks)
+            
+            def populate():
+                frame._populate_treeview()
+                root.update_idletasks()
+                return len(frame.tree.get_children())
+            runs, rows = _time(populate, repeat, db_manager.clear_query_cache)
+            return _timings(runs, rows)
+        finally:
+            tasks.shutdown()
+            db_manager.close()
+            root.destroy()
+
+
+def run(args) -> dict:
+    report = {
+        'version': Path(__file__).with_name('VERSION').read_text().strip(),
+        'started': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'platform': platform.platform(),
+        'config': {'groups': args.groups, 'repeat': args.repeat, 'adds': args.adds,
+                   'import_rows': args.import_rows},
+        'vaults': [],
+    }
+    
+    base_dir = Path(args.vault_dir) if args.vault_dir else Path(tempfile.mkdtemp(prefix='randpypwgen-bench-'))
+    base_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        for records in args.records:
+            vault_path = base_dir / f"vault-{records}-{args.groups}"
+            entry = {'records': records, 'groups': args.groups, 'results': {}}
+            
+            if (vault_path / 'data.db').exists():
+                _log(f"Reusing {records} record vault in {vault_path}")
+            else:
+                _log(f"Generating {records} record vault in {vault_path}")
+                entry['generate_s'] = round(generate_vault(vault_path, records, args.groups), 3)
+            
+            db_manager = DatabaseManager(str(vault_path))
+            try:
+                runs, _ = _time(lambda: db_manager.unlock(PASSWORD), 1)
+                entry['results']['unlock'] = _timings(runs)
+                _log("Timing reads")
+                entry['results'].update(bench_reads(db_manager, records, args.repeat))
+            finally:
+                db_manager.close()
+            
+            _log("Timing the password list")
+            entry['results']['populate_treeview'] = bench_treeview(vault_path, args.repeat)
+            
+            with tempfile.TemporaryDirectory(prefix='randpypwgen-bench-') as work_dir:
+                copy_path = Path(work_dir) / 'vault'
+                shutil.copytree(vault_path, copy_path)
+                db_manager = DatabaseManager(str(copy_path))
+                try:
+                    db_manager.unlock(PASSWORD)
+                    _log("Timing writes")
+                    entry['results'].update(bench_writes(db_manager, args.repeat, args.adds,
+                                                         args.import_rows, Path(work_dir)))
+                finally:
+                    db_manager.close()
+            
+            report['vaults'].append(entry)
+    finally:
+        if not args.vault_dir:
+            shutil.rmtree(base_dir, ignore_errors=True)
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Time vault operations on synthetic vaults and print JSON.")
+    parser.add_argument('--records', type=int, nargs='+', default=[1000, 10000],
+                        help="vault sizes to benchmark (default: 1000 10000)")
+    parser.add_argument('--groups', type=int, default=8, help="number of groups (default: 8)")
+    parser.add_argument('--repeat', type=int, default=3, help="runs of each benchmark (default: 3)")
+    parser.add_argument('--adds', type=int, default=100, help="records added per add_record run (default: 100)")
+    parser.add_argument('--import-rows', type=int, default=1000, help="rows in the imported CSV (default: 1000)")
+    parser.add_argument('--vault-dir', help="keep generated vaults here and reuse them on later runs")
+    parser.add_argument('--output', help="write the JSON here instead of stdout")
+    args = parser.parse_args(argv)
+    
+    if args.repeat < 1 or args.adds < 1 or args.import_rows < 1 or min(args.records) < 1:
+        parser.error("--records, --repeat, --adds and --import-rows must be at least 1")
+    
+    report = run(args)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + '\n')
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
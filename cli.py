@@ -0,0 +1,181 @@
+"""Command line interface for scripted lookups, without Tk.
+
+    python main.py get github.com
+    python main.py list --group Work
+    python main.py search mail --fuzzy
+    python main.py add github.com alice --group Work
+    python main.py import passwords.csv --source Chrome
+    python main.py export backup.csv
+    python main.py rekey
+
+The master password is read from the RANDPYPWGEN_MASTER_PASSWORD environment variable if it
+is set, otherwise it is asked for on the terminal. Passwords go to stdout and everything else
+to stderr, so output can be piped.
+"""
+
+import argparse
+import getpass
+import os
+import sys
+from typing import List, Optional
+
+from vault import (DatabaseManager, PasswordGenerator, Record, VaultNotFound, export_records_csv,
+                   iter_import_rows)
+
+
+COMMANDS = ('get', 'list', 'search', 'add', 'import', 'export', 'rekey')
+PASSWORD_ENV = 'RANDPYPWGEN_MASTER_PASSWORD'
+
+
+class CommandError(Exception):
+    """Raised for a command that can't be carried out, with the message to print"""
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='main.py', description="RandPyPwGen from the command line. "
+                                     "Run without a command to start the app.")
+    commands = parser.add_subparsers(dest='command', required=True, metavar='command')
+    
+    # Options every command takes. They come after the command, which is how main.py spots CLI use
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--db', default='./db', help="vault directory (default: ./db)")
+    
+    get = commands.add_parser('get', parents=[common], help="print the password for a site")
+    get.add_argument('site', nargs='?', help="site, matched exactly but ignoring case")
+    get.add_argument('--id', type=int, help="record id, instead of a site")
+    get.add_argument('-u', '--username', help="only match this username")
+    get.add_argument('-g', '--group', default='All', help="only match records in this group")
+    
+    list_ = commands.add_parser('list', parents=[common], help="list records, without passwords")
+    list_.add_argument('-g', '--group', default='All', help="only list this group")
+    
+    search = commands.add_parser('search', parents=[common], help="search records on site or username")
+    search.add_argument('term')
+    search.add_argument('-g', '--group', default='All', help="only search this group")
+    search.add_argument('--fuzzy', action='store_true', help="include close matches, best first")
+    
+    add = commands.add_parser('add', parents=[common], help="add a record, generating its password unless one is piped in")
+    add.add_argument('site')
+    add.add_argument('username', nargs='?', default='')
+    add.add_argument('-g', '--group', help="group for the record")
+    add.add_argument('--password-stdin', action='store_true', help="read the password from stdin")
+    add.add_argument('--length', type=int, default=16, help="length of a generated password (default: 16)")
+    add.add_argument('--no-special', action='store_true', help="leave punctuation out of a generated password")
+    
+    import_ = commands.add_parser('import', parents=[common], help="import a Chrome or Firefox CSV export")
+    import_.add_argument('file')
+    import_.add_argument('--source', choices=('Chrome', 'Firefox'), default='Chrome')
+    import_.add_argument('-g', '--group', help="group for the imported records")
+    
+    export = commands.add_parser('export', parents=[common], help="export records to CSV, passwords decrypted")
+    export.add_argument('file')
+    export.add_argument('-g', '--group', default='All', help="only export this group")
+    
+    commands.add_parser('rekey', parents=[common], help="re-encrypt every record under a new encryption key")
+    return parser
+
+
+def _open_vault(db_path: str) -> DatabaseManager:
+    """Open and unlock the vault, asking for the master password if it isn't in the environment"""
+    try:
+        db_manager = DatabaseManager(db_path)
+    except VaultNotFound as e:
+        if any(os.path.exists(os.path.join(db_path, name)) for name in ('data.db', 'unlock.db')):
+            raise CommandError(str(e))
+        raise CommandError(f"no vault in {db_path}; start the app once to set one up")
+    
+    password = os.environ.get(PASSWORD_ENV)
+    if password is None:
+        password = getpass.getpass("Master password: ")
+    
+    if not db_manager.unlock(password):
+        db_manager.close()
+        raise CommandError("wrong master password")
+    return db_manager
+
+
+def _print_records(records: List[Record], file=None):
+    for record in records:
+        print(f"{record.id}\t{record.site}\t{record.username}\t{record.group_name or ''}", file=file)
+
+
+def _find_record(db_manager: DatabaseManager, args) -> int:
+    """Id of the single record that get's arguments pick out"""
+    if args.id is not None:
+        if db_manager.get_record_by_id(args.id) is None:
+            raise CommandError(f"no record with id {args.id}")
+        return args.id
+    if not args.site:
+        raise CommandError("give a site or --id")
+    
+    site = args.site.lower()
+    matches = [record for record in db_manager.search_records(args.site, args.group)
+               if record.site.lower() == site
+               and (args.username is None or record.username == args.username)]
+    
+    if not matches:
+        raise CommandError(f"no record for {args.site}")
+    if len(matches) > 1:
+        _print_records(matches, sys.stderr)
+        raise CommandError(f"{len(matches)} records for {args.site}; pick one with --username or --id")
+    return matches[0].id
+
+
+def _run(db_manager: DatabaseManager, args):
+    if args.command == 'get':
+        print(db_manager.get_password(_find_record(db_manager, args)))
+    
+    elif args.command == 'list':
+        _print_records(db_manager.get_all_records(args.group))
+    
+    elif args.command == 'search':
+        _print_records(db_manager.search_records(args.term, args.group, fuzzy=args.fuzzy))
+    
+    elif args.command == 'add':
+        if args.password_stdin:
+            password = sys.stdin.readline().rstrip('\n')
+            if not password:
+                raise CommandError("no password on stdin")
+        else:
+            try:
+                password = PasswordGenerator().generate(args.length, not args.no_special)
+            except ValueError as e:
+                raise CommandError(str(e))
+            print(password)
+        record_id = db_manager.add_record(args.site, args.username, password, args.group)
+        print(f"Added record {record_id}", file=sys.stderr)
+    
+    elif args.command == 'import':
+        with open(args.file, 'r', newline='', encoding='utf-8') as file:
+            count = db_manager.add_records(iter_import_rows(file, args.source), args.group)
+        print(f"Imported {count} records", file=sys.stderr)
+    
+    elif args.command == 'export':
+        count = export_records_csv(db_manager, args.file, args.group)
+        print(f"Exported {count} records", file=sys.stderr)
+    
+    elif args.command == 'rekey':
+        db_manager.rotate_encryption_key()
+        print("Encryption key rotated", file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run one command and return the exit status"""
+    args = _build_parser().parse_args(argv)
+    db_manager = None
+    try:
+        db_manager = _open_vault(args.db)
+        _run(db_manager, args)
+        return 0
+    except KeyboardInterrupt:
+        return 130
+    except Exception as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if db_manager is not None:
+            db_manager.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
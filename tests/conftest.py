@@ -0,0 +1,53 @@
+"""Fixtures for the vault tests. Run with python -m pytest from the repository root"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from vault import DatabaseManager  # noqa: E402
+
+
+PASSWORD = 'correct horse battery'
+
+
+class FastVault(DatabaseManager):
+    """DatabaseManager that sets up a missing vault with PASSWORD, at a low bcrypt cost and few
+    KDF iterations so tests don't spend their time hashing"""
+    
+    INTERACTIVE_SETUP = True
+    KDF_ITERATIONS = 1000
+    
+    def _bcrypt_rounds(self) -> int:
+        return 4
+    
+    def _setup_master_password(self) -> bool:
+        self._create_master_password(PASSWORD)
+        return True
+
+
+def open_vault(path: Path) -> FastVault:
+    """Open, creating if needed, and unlock the vault at path"""
+    db_manager = FastVault(str(path))
+    assert db_manager.unlock(PASSWORD)
+    return db_manager
+
+
+def add_sites(db_manager: DatabaseManager, count: int, group: str = None) -> dict:
+    """Add count records and return their passwords by id"""
+    db_manager.add_records([(f"site{i}.com", f"user{i}", f"password-{i}") for i in range(count)], group)
+    return {record.id: f"password-{i}" for i, record in enumerate(db_manager.get_all_records())}
+
+
+@pytest.fixture
+def vault_path(tmp_path) -> Path:
+    return tmp_path / 'db'
+
+
+@pytest.fixture
+def vault(vault_path):
+    db_manager = open_vault(vault_path)
+    yield db_manager
+    db_manager.close()
@@ -0,0 +1,69 @@
+"""Calibrating the master password's bcrypt cost, and rehashing it"""
+
+import cli
+from vault import calibrate_bcrypt_rounds, storage
+from vault.crypto import MIN_BCRYPT_ROUNDS, bcrypt_cost
+
+from conftest import FastVault, PASSWORD, add_sites, open_vault
+
+
+class CostVault(FastVault):
+    """FastVault whose calibrated cost tests can set"""
+    
+    rounds = 5
+    
+    def _bcrypt_rounds(self) -> int:
+        return self.rounds
+
+
+def stored_cost(db_manager) -> int:
+    return bcrypt_cost(db_manager.connections.get(db_manager.unlock_db).execute("SELECT key FROM master").fetchone()[0])
+
+
+def test_calibration_never_goes_below_the_default_cost():
+    assert calibrate_bcrypt_rounds(0.0001) == MIN_BCRYPT_ROUNDS == 12
+    assert calibrate_bcrypt_rounds(1000, maximum=13) == 13
+
+
+def test_hash_is_only_ever_rehashed_upwards(vault_path, monkeypatch):
+    CostVault(str(vault_path)).close()
+    
+    monkeypatch.setattr(CostVault, 'rounds', 4)
+    db_manager = CostVault(str(vault_path))
+    try:
+        assert db_manager.unlock(PASSWORD)
+        assert stored_cost(db_manager) == 5
+    finally:
+        db_manager.close()
+    
+    monkeypatch.setattr(CostVault, 'rounds', 6)
+    db_manager = CostVault(str(vault_path))
+    try:
+        assert db_manager.unlock(PASSWORD)
+        assert stored_cost(db_manager) == 6
+    finally:
+        db_manager.close()
+
+
+def test_low_stored_cost_is_recalibrated(vault):
+    vault.settings.set('bcrypt_rounds', '10')
+    vault.settings.set('bcrypt_rounds_target_ms', str(vault.BCRYPT_TARGET_MS))
+    
+    assert super(FastVault, vault)._bcrypt_rounds() >= MIN_BCRYPT_ROUNDS
+
+
+def test_failed_rehash_is_logged_not_printed(vault_path, monkeypatch, capsys, caplog):
+    db_manager = open_vault(vault_path)
+    add_sites(db_manager, 2)
+    db_manager.close()
+    
+    def fail(password, rounds):
+        raise ValueError("no entropy")
+    monkeypatch.setattr(storage, 'hash_master_password', fail)
+    monkeypatch.setattr(CostVault, 'rounds', 6)
+    monkeypatch.setattr(cli, 'DatabaseManager', CostVault)
+    monkeypatch.setenv(cli.PASSWORD_ENV, PASSWORD)
+    
+    assert cli.main(['list', '--db', str(vault_path)]) == 0
+    assert [line.split('\t')[1] for line in capsys.readouterr().out.splitlines()] == ['site0.com', 'site1.com']
+    assert "Could not rehash master password: no entropy" in caplog.text
@@ -0,0 +1,28 @@
+"""Envelope encryption: the encryption key is only ever stored wrapped by the master password"""
+
+from conftest import FastVault, PASSWORD, add_sites, open_vault
+
+
+def test_legacy_key_is_wrapped_and_wiped_from_the_file(vault_path):
+    db_manager = open_vault(vault_path)
+    expected = add_sites(db_manager, 3)
+    enc_key = db_manager._enc_key
+    db_manager.close()
+    
+    # Vaults from before 2.1 kept the key itself in master.enc_key
+    db_manager = FastVault(str(vault_path))
+    with db_manager.connections.transaction(db_manager.unlock_db) as conn:
+        conn.execute("UPDATE master SET enc_key=?, wrapped_key=NULL, kdf_salt=NULL, kdf_iterations=NULL", (enc_key,))
+    assert enc_key in db_manager.unlock_db.read_bytes()
+    # Some SQLite builds wipe deleted content by default; the vault mustn't depend on it
+    db_manager.connections.get(db_manager.unlock_db).execute("PRAGMA secure_delete = OFF")
+    
+    assert db_manager.unlock(PASSWORD)
+    try:
+        row = db_manager.connections.get(db_manager.unlock_db).execute(
+            "SELECT enc_key, wrapped_key FROM master").fetchone()
+        assert row[0] is None and row[1]
+        assert {record.id: db_manager.get_password(record.id) for record in db_manager.get_all_records()} == expected
+        assert enc_key[8:] not in db_manager.unlock_db.read_bytes()
+    finally:
+        db_manager.close()
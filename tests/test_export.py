@@ -0,0 +1,68 @@
+"""CSV export: a finished export replaces the file, an interrupted one leaves no trace"""
+
+import csv
+
+import pytest
+
+from vault import CryptoError, OperationCancelled, export_records_csv
+
+from conftest import add_sites
+
+
+def leftovers(directory) -> list:
+    return sorted(path.name for path in directory.iterdir())
+
+
+def test_export_writes_every_record(vault, tmp_path):
+    expected = add_sites(vault, 25, 'Work')
+    target = tmp_path / 'export.csv'
+    reported = []
+    
+    assert export_records_csv(vault, str(target), progress=reported.append, batch_size=10) == 25
+    
+    with open(target, newline='', encoding='utf-8') as file:
+        rows = list(csv.DictReader(file))
+    assert sorted(row['password'] for row in rows) == sorted(expected.values())
+    assert {row['group'] for row in rows} == {'Work'}
+    assert reported == [10, 20, 25]
+    assert leftovers(tmp_path) == ['db', 'export.csv']
+
+
+def test_cancelled_export_leaves_the_target_untouched(vault, tmp_path):
+    add_sites(vault, 25)
+    target = tmp_path / 'export.csv'
+    target.write_text('previous export')
+    checks = []
+    
+    def cancelled() -> bool:
+        checks.append(True)
+        return len(checks) > 3
+    
+    with pytest.raises(OperationCancelled):
+        export_records_csv(vault, str(target), batch_size=10, cancelled=cancelled)
+    # Checked before every record, not only between batches
+    assert len(checks) == 4
+    assert target.read_text() == 'previous export'
+    assert leftovers(tmp_path) == ['db', 'export.csv']
+
+
+def test_locking_during_an_export_fails_it(vault, tmp_path):
+    add_sites(vault, 25)
+    target = tmp_path / 'export.csv'
+    
+    def lock_after_first_batch(count: int):
+        vault.lock()
+    
+    with pytest.raises(CryptoError):
+        export_records_csv(vault, str(target), progress=lock_after_first_batch, batch_size=10)
+    assert leftovers(tmp_path) == ['db']
+
+
+def test_undecryptable_record_fails_the_export(vault, tmp_path):
+    add_sites(vault, 5)
+    with vault.connections.transaction(vault.data_db) as conn:
+        conn.execute("UPDATE data SET password=? WHERE id=(SELECT MAX(id) FROM data)", (b'not a token',))
+    
+    with pytest.raises(CryptoError):
+        export_records_csv(vault, str(tmp_path / 'export.csv'))
+    assert leftovers(tmp_path) == ['db']
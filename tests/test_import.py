@@ -0,0 +1,80 @@
+"""Bulk imports with add_records: committed a chunk at a time, undone when cancelled or failed"""
+
+import threading
+
+import pytest
+
+from vault import CryptoError, OperationCancelled
+
+from conftest import PASSWORD, add_sites
+
+
+def import_rows(count: int, group: str = None) -> list:
+    return [(f"import{i}.com", f"user{i}", f"imported-{i}", group) for i in range(count)]
+
+
+def count_from_another_thread(vault) -> int:
+    counts = []
+    reader = threading.Thread(target=lambda: counts.append(len(vault.get_records_page(limit=1000))))
+    reader.start()
+    reader.join()
+    return counts[0]
+
+
+def test_chunks_are_readable_while_importing(vault):
+    add_sites(vault, 5)
+    seen = []
+    
+    def progress(count: int):
+        vault.clear_query_cache()
+        seen.append(count_from_another_thread(vault))
+    
+    assert vault.add_records(import_rows(25, 'Imported'), chunk_size=10, progress=progress) == 25
+    assert seen == [15, 25, 30]
+    assert len(vault.get_all_records('Imported')) == 25
+    assert vault.search_records('import24') != []
+
+
+def test_cancelled_import_deletes_what_it_added(vault):
+    expected = add_sites(vault, 5, 'Work')
+    checks = []
+    
+    def cancelled() -> bool:
+        checks.append(True)
+        return len(checks) > 2
+    
+    with pytest.raises(OperationCancelled):
+        vault.add_records(import_rows(50, 'Imported'), chunk_size=10, cancelled=cancelled)
+    
+    assert {record.id for record in vault.get_all_records()} == set(expected)
+    assert vault.get_all_groups() == ['All', 'Work']
+    assert vault.search_records('import') == []
+    assert [record.id for record in vault.get_records_page()] == sorted(expected)
+
+
+def test_failed_import_deletes_what_it_added(vault):
+    expected = add_sites(vault, 5, 'Work')
+    rows = import_rows(25, 'Work') + [("broken.com", "user", None)]
+    
+    with pytest.raises(AttributeError):
+        vault.add_records(rows, chunk_size=10)
+    
+    assert {record.id for record in vault.get_all_records()} == set(expected)
+    # Existing groups are kept
+    assert vault.get_all_groups() == ['All', 'Work']
+
+
+def test_importing_into_a_locked_vault_fails(vault):
+    vault.lock()
+    
+    with pytest.raises(CryptoError, match="locked"):
+        vault.add_records(import_rows(5))
+    
+    assert vault.unlock(PASSWORD)
+    
+    def lock_after_first_chunk(count: int):
+        vault.lock()
+    with pytest.raises(CryptoError, match="locked"):
+        vault.add_records(import_rows(25), chunk_size=10, progress=lock_after_first_chunk)
+    assert vault.unlock(PASSWORD)
+    assert vault.get_all_records() == []
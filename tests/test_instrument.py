@@ -0,0 +1,111 @@
+"""Opt-in timing of vault operations"""
+
+import json
+
+import pytest
+from cryptography.fernet import Fernet
+
+from vault import DatabaseManager, instrument
+
+from conftest import FastVault, add_sites
+
+
+@pytest.fixture
+def clean_timings():
+    instrument.reset()
+    yield
+    instrument.disable()
+    instrument.reset()
+    instrument._registered.clear()
+
+
+def by_name() -> dict:
+    return {timing['name']: timing for timing in instrument.snapshot()}
+
+
+def test_enable_wraps_and_disable_restores_the_originals(clean_timings):
+    originals = {(cls, name): vars(cls)[name] for cls, name in (
+        (DatabaseManager, 'get_all_records'), (DatabaseManager, 'add_records'),
+        (FastVault, '_bcrypt_rounds'), (Fernet, 'encrypt'), (Fernet, 'decrypt'))}
+    
+    instrument.enable()
+    assert instrument.is_enabled()
+    assert vars(DatabaseManager)['get_all_records'] is not originals[DatabaseManager, 'get_all_records']
+    assert vars(Fernet)['decrypt'] is not originals[Fernet, 'decrypt']
+    # Private methods are left alone
+    assert vars(FastVault)['_bcrypt_rounds'] is originals[FastVault, '_bcrypt_rounds']
+    
+    # Enabling twice doesn't wrap the wrappers
+    instrument.enable()
+    instrument.disable()
+    assert not instrument.is_enabled()
+    assert {key: vars(key[0])[key[1]] for key in originals} == originals
+
+
+def test_calls_and_rows_are_recorded(clean_timings, vault):
+    instrument.enable()
+    add_sites(vault, 12)
+    records = vault.get_all_records()
+    vault.get_password(records[0].id)
+    
+    timings = by_name()
+    assert timings['DatabaseManager.add_records']['rows'] == 12
+    assert timings['DatabaseManager.get_all_records']['calls'] == 2
+    assert timings['DatabaseManager.get_all_records']['rows'] == 24
+    assert timings['DatabaseManager.get_password']['calls'] == 1
+    assert timings['Fernet.encrypt']['calls'] == 12
+    assert timings['Fernet.decrypt']['calls'] == 1
+    assert sum(timings['DatabaseManager.add_records']['histogram_ms'].values()) == 1
+
+
+def test_generators_count_items_and_only_their_own_time(clean_timings, vault):
+    add_sites(vault, 7)
+    instrument.enable()
+    
+    for record in vault.iter_records(batch_size=3):
+        pass
+    
+    timing = by_name()['DatabaseManager.iter_records']
+    assert timing['calls'] == 1 and timing['rows'] == 7
+
+
+def test_timed_sections_only_count_while_enabled(clean_timings):
+    with instrument.timed('MainFrame.refresh', rows=5):
+        pass
+    assert instrument.snapshot() == []
+    
+    instrument.enable()
+    with instrument.timed('MainFrame.refresh', rows=5):
+        pass
+    assert by_name()['MainFrame.refresh']['rows'] == 5
+
+
+def test_registered_methods_are_timed_and_restored(clean_timings):
+    class Widget:
+        def refresh(self):
+            return [1, 2, 3]
+    original = Widget.refresh
+    
+    instrument.register(Widget, 'refresh')
+    assert Widget.refresh is original
+    instrument.enable()
+    assert Widget().refresh() == [1, 2, 3]
+    instrument.disable()
+    
+    assert Widget.refresh is original
+    assert by_name()['Widget.refresh']['rows'] == 3
+
+
+def test_reset_and_dump_json(clean_timings, tmp_path):
+    instrument.enable()
+    instrument.record('Sample.call', 0.002, 4)
+    path = tmp_path / 'timings.json'
+    
+    instrument.dump_json(str(path))
+    report = json.loads(path.read_text(encoding='utf-8'))
+    assert report['enabled'] and report['enabled_since']
+    assert report['histogram_buckets_ms'] == list(instrument.BUCKETS_MS)
+    assert [(timing['name'], timing['calls'], timing['rows']) for timing in report['timings']] == [('Sample.call', 1, 4)]
+    
+    instrument.reset()
+    assert instrument.snapshot() == []
@@ -0,0 +1,112 @@
+"""Schema migrations, tracked in PRAGMA user_version"""
+
+import sqlite3
+
+import bcrypt
+from cryptography.fernet import Fernet
+
+from vault import DatabaseManager
+
+from conftest import FastVault, PASSWORD
+
+
+UNLOCK_VERSION = 3
+DATA_VERSION = 5
+
+
+def user_version(path) -> int:
+    conn = sqlite3.connect(str(path))
+    try:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def columns(conn, table: str) -> list:
+    return [column[1] for column in conn.execute(f"PRAGMA table_info({table})").fetchall()]
+
+
+def make_old_vault(path, passwords) -> bytes:
+    """Vault as saved by 1.x: no groups, dates or wrapped key, and user_version 0"""
+    path.mkdir()
+    enc_key = Fernet.generate_key()
+    fernet = Fernet(enc_key)
+    
+    conn = sqlite3.connect(str(path / 'data.db'))
+    conn.execute("CREATE TABLE data(id INTEGER PRIMARY KEY, site varchar(100) NOT NULL, "
+                 "username varchar(100) NOT NULL, password varchar(100) NOT NULL)")
+    conn.executemany("INSERT INTO data (site, username, password) VALUES (?, ?, ?)",
+                     [(f"site{i}.com", f"user{i}", fernet.encrypt(password.encode())) for i, password in enumerate(passwords)])
+    conn.commit()
+    conn.close()
+    
+    conn = sqlite3.connect(str(path / 'unlock.db'))
+    conn.execute("CREATE TABLE master(key varchar(255), enc_key varchar(255))")
+    conn.execute("CREATE TABLE settings(key varchar(100) PRIMARY KEY, value varchar(255))")
+    conn.execute("INSERT INTO master VALUES (?, ?)", (bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(4)), enc_key))
+    conn.commit()
+    conn.close()
+    return enc_key
+
+
+def test_new_vault_is_at_the_latest_version(vault):
+    assert user_version(vault.unlock_db) == UNLOCK_VERSION
+    assert user_version(vault.data_db) == DATA_VERSION
+
+
+def test_old_vault_is_migrated(vault_path):
+    make_old_vault(vault_path, ['first', 'second-password'])
+    
+    db_manager = FastVault(str(vault_path))
+    try:
+        assert user_version(vault_path / 'unlock.db') == UNLOCK_VERSION
+        assert user_version(vault_path / 'data.db') == DATA_VERSION
+        conn = db_manager.connections.get(db_manager.data_db)
+        assert {'group_name', 'date_added', 'date_modified', 'password_length'} <= set(columns(conn, 'data'))
+        assert 'wrapped_key' in columns(db_manager.connections.get(db_manager.unlock_db), 'master')
+        
+        assert db_manager.unlock(PASSWORD)
+        records = db_manager.get_all_records()
+        assert [record.password_length for record in records] == [5, 15]
+        assert [db_manager.get_password(record.id) for record in records] == ['first', 'second-password']
+        assert [record.site for record in db_manager.search_records('site1')] == ['site1.com']
+    finally:
+        db_manager.close()
+
+
+def test_up_to_date_vault_skips_every_step(vault_path, monkeypatch):
+    FastVault(str(vault_path)).close()
+    
+    def fail(self, conn):
+        raise AssertionError("migration step ran again")
+    for name in dir(DatabaseManager):
+        if name.startswith('_migrate_') and name != '_migrate_databases':
+            monkeypatch.setattr(DatabaseManager, name, fail)
+    
+    FastVault(str(vault_path)).close()
+
+
+def test_failed_step_is_retried_and_later_steps_wait(vault_path, monkeypatch):
+    make_old_vault(vault_path, ['password'])
+    
+    def fail(self, conn):
+        conn.execute("CREATE TABLE half_done(x)")
+        raise sqlite3.OperationalError("disk I/O error")
+    monkeypatch.setattr(DatabaseManager, '_migrate_data_v2', fail)
+    
+    FastVault(str(vault_path)).close()
+    assert user_version(vault_path / 'data.db') == 1
+    conn = sqlite3.connect(str(vault_path / 'data.db'))
+    # The failed step's changes were rolled back along with it
+    assert conn.execute("SELECT name FROM sqlite_master WHERE name='half_done'").fetchone() is None
+    assert 'password_length' not in columns(conn, 'data')
+    conn.close()
+    
+    monkeypatch.undo()
+    db_manager = FastVault(str(vault_path))
+    try:
+        assert user_version(vault_path / 'data.db') == DATA_VERSION
+        assert db_manager.unlock(PASSWORD)
+        assert db_manager.get_password(db_manager.get_all_records()[0].id) == 'password'
+    finally:
+        db_manager.close()
@@ -0,0 +1,95 @@
+"""Caching of record listings"""
+
+import threading
+
+from vault import Record
+from vault.storage import QueryCache
+
+
+def records(count: int, group: str = None) -> list:
+    return [Record(i, f"site{i}.com", f"user{i}", group) for i in range(count)]
+
+
+def test_least_recently_used_listing_is_evicted():
+    cache = QueryCache(capacity=2)
+    cache.put(("All", "", None), records(1))
+    cache.put(("All", "a", None), records(1))
+    cache.get(("All", "", None))
+    cache.put(("All", "b", None), records(1))
+    
+    assert cache.get(("All", "a", None)) is None
+    assert cache.get(("All", "", None)) is not None
+    assert cache.get(("All", "b", None)) is not None
+
+
+def test_listings_over_max_rows_are_not_cached():
+    cache = QueryCache(max_rows=10)
+    cache.put(("All", "", None), records(5))
+    cache.put(("All", "site", None), records(11))
+    
+    assert cache.get(("All", "site", None)) is None
+    assert cache.get(("All", "", None)) is not None
+    assert cache._rows == 5
+    
+    # Replacing a cached listing with one too big drops it
+    cache.put(("All", "", None), records(11))
+    assert cache.get(("All", "", None)) is None
+    assert cache._rows == 0
+
+
+def test_oldest_listings_make_room_for_rows():
+    cache = QueryCache(max_rows=10)
+    cache.put(("All", "a", None), records(4))
+    cache.put(("All", "b", None), records(4))
+    cache.put(("All", "c", None), records(4))
+    
+    assert cache.get(("All", "a", None)) is None
+    assert cache.get(("All", "b", None)) is not None
+    assert cache._rows == 8
+
+
+def test_get_returns_a_copy():
+    cache = QueryCache()
+    cache.put(("All", "", None), records(3))
+    cache.get(("All", "", None)).clear()
+    
+    assert len(cache.get(("All", "", None))) == 3
+
+
+def test_writes_invalidate_only_affected_listings():
+    cache = QueryCache()
+    cache.put(("All", "site1", None), records(2))
+    cache.put(("All", "other", None), records(2))
+    cache.put(("Work", "", None), records(2, 'Work'))
+    cache.put(("Home", "", None), records(2, 'Home'))
+    
+    cache.invalidate_record(("site1.com", "me", "Home"))
+    assert cache.get(("All", "site1", None)) is None
+    assert cache.get(("All", "other", None)) is not None
+    assert cache.get(("Home", "", None)) is None
+    assert cache.get(("Work", "", None)) is not None
+    
+    cache.invalidate_group('Work')
+    assert cache.get(("Work", "", None)) is None
+    assert cache.get(("All", "other", None)) is not None
+
+
+def test_concurrent_puts_keep_the_row_count():
+    cache = QueryCache(capacity=8, max_rows=100)
+    rows = records(40)
+    
+    def fill(worker: int):
+        for i in range(500):
+            cache.put(("All", f"{worker}-{i % 12}", None), rows[:i % 40])
+            cache.get(("All", f"{worker}-{(i + 5) % 12}", None))
+            if i % 50 == 0:
+                cache.invalidate_record(("site1.com", "user1", None))
+    
+    threads = [threading.Thread(target=fill, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert cache._rows == sum(len(cached) for cached in cache._entries.values())
+    assert cache._rows <= 100 and len(cache._entries) <= 8
@@ -0,0 +1,108 @@
+"""Record listings without ciphertexts, revealing passwords, paging and transactions"""
+
+import pytest
+
+from conftest import add_sites, open_vault
+
+
+def null_lengths(vault, count: int):
+    with vault.connections.transaction(vault.data_db) as conn:
+        conn.execute("UPDATE data SET password_length=NULL WHERE id IN (SELECT id FROM data ORDER BY id LIMIT ?)",
+                     (count,))
+
+
+def test_listings_leave_out_the_ciphertext(vault):
+    expected = add_sites(vault, 5, 'Work')
+    
+    for records in (vault.get_all_records(), vault.get_records_page(), vault.get_records_by_ids(list(expected))):
+        assert [record.id for record in records] == sorted(expected)
+        assert all(record.encrypted_password is None for record in records)
+        assert [record.password_length for record in records] == [len(expected[record.id]) for record in records]
+    
+    record = vault.get_record_by_id(min(expected))
+    assert vault.decrypt_password(record.encrypted_password) == expected[record.id]
+
+
+def test_passwords_are_revealed_on_request(vault):
+    expected = add_sites(vault, 5)
+    
+    assert {record_id: vault.get_password(record_id) for record_id in expected} == expected
+    tokens = vault.get_encrypted_passwords(list(expected)[:2])
+    assert {record_id: vault.decrypt_password(token) for record_id, token in tokens.items()} == \
+        {record_id: expected[record_id] for record_id in list(expected)[:2]}
+    assert vault.get_password(max(expected) + 1) is None
+
+
+def test_pages_follow_after_id(vault):
+    expected = add_sites(vault, 25, 'Work')
+    add_sites(vault, 5)
+    
+    ids, after_id = [], 0
+    while True:
+        page = vault.get_records_page('Work', after_id=after_id, limit=10)
+        if not page:
+            break
+        assert len(page) <= 10
+        ids += [record.id for record in page]
+        after_id = page[-1].id
+    assert ids == sorted(expected)
+    
+    assert [record.site for record in vault.get_records_page(search_term='site2', limit=3)] == \
+        ['site2.com', 'site20.com', 'site21.com']
+
+
+def test_missing_lengths_are_filled_in_at_unlock(vault_path):
+    db_manager = open_vault(vault_path)
+    expected = add_sites(db_manager, 25)
+    null_lengths(db_manager, 25)
+    plan = db_manager.connections.get(db_manager.data_db).execute(
+        "EXPLAIN QUERY PLAN SELECT id, password FROM data WHERE password_length IS NULL LIMIT 10").fetchall()
+    assert 'idx_data_missing_length' in str(plan)
+    db_manager.close()
+    
+    db_manager = open_vault(vault_path)
+    try:
+        assert [record.password_length for record in db_manager.get_all_records()] == \
+            [len(password) for password in expected.values()]
+    finally:
+        db_manager.close()
+
+
+def test_backfill_works_in_chunks(vault):
+    expected = add_sites(vault, 25)
+    null_lengths(vault, 12)
+    vault.clear_query_cache()
+    
+    assert vault._backfill_password_lengths(chunk_size=5) == 12
+    assert vault._backfill_password_lengths() == 0
+    vault.clear_query_cache()
+    assert [record.password_length for record in vault.get_all_records()] == \
+        [len(password) for password in expected.values()]
+
+
+def test_backfill_of_a_locked_vault_changes_nothing(vault):
+    add_sites(vault, 5)
+    null_lengths(vault, 5)
+    vault.lock()
+    
+    assert vault._backfill_password_lengths() == 0
+    count = vault.connections.get(vault.data_db).execute(
+        "SELECT COUNT(*) FROM data WHERE password_length IS NULL").fetchone()[0]
+    assert count == 5
+
+
+def test_failed_transaction_is_rolled_back(vault):
+    expected = add_sites(vault, 3)
+    
+    with pytest.raises(RuntimeError):
+        with vault.connections.transaction(vault.data_db) as conn:
+            conn.execute("DELETE FROM data")
+            # Nested blocks join the outer transaction, and go with it
+            with vault.connections.transaction(vault.data_db) as nested:
+                nested.execute("INSERT INTO groups (name) VALUES ('Lost')")
+            raise RuntimeError("interrupted")
+    
+    conn = vault.connections.get(vault.data_db)
+    assert not conn.in_transaction
+    assert [row[0] for row in conn.execute("SELECT id FROM data ORDER BY id")] == sorted(expected)
+    assert vault.get_all_groups() == ['All']
@@ -0,0 +1,153 @@
+"""Encryption key rotation and recovery from an interrupted rotation"""
+
+import pytest
+
+from vault import storage
+from vault import VaultError
+from vault.crypto import new_encryption_key, reencrypt_chunk
+
+from conftest import PASSWORD, FastVault, add_sites, open_vault
+
+
+def passwords(db_manager) -> dict:
+    return {record.id: db_manager.get_password(record.id) for record in db_manager.get_all_records()}
+
+
+def journal(db_manager) -> list:
+    return db_manager.connections.get(db_manager.unlock_db).execute("SELECT * FROM rekey_journal").fetchall()
+
+
+def staged(db_manager) -> int:
+    return db_manager.connections.get(db_manager.data_db).execute("SELECT COUNT(*) FROM rekey_staging").fetchone()[0]
+
+
+def test_rotate_reencrypts_every_record(vault):
+    expected = add_sites(vault, 30)
+    old_key = vault._enc_key
+    
+    assert vault.rotate_encryption_key()
+    
+    assert vault._enc_key != old_key
+    assert passwords(vault) == expected
+    assert journal(vault) == [] and staged(vault) == 0
+
+
+def test_interrupted_rotation_finishes_on_next_unlock(vault_path):
+    db_manager = open_vault(vault_path)
+    expected = add_sites(db_manager, 30)
+    old_key = db_manager._enc_key
+    new_key = new_encryption_key()
+    
+    # Crash after journaling the key and staging part of the records
+    db_manager._begin_rekey(db_manager._key_wrapper.encrypt(new_key))
+    conn = db_manager.connections.get(db_manager.data_db)
+    rows = conn.execute("SELECT id, password FROM data ORDER BY id LIMIT 10").fetchall()
+    with db_manager.connections.transaction(db_manager.data_db) as staging:
+        staging.executemany("INSERT INTO rekey_staging (id, old_password, password) VALUES (?, ?, ?)",
+                            reencrypt_chunk(old_key, new_key, rows))
+    db_manager.close()
+    
+    db_manager = open_vault(vault_path)
+    try:
+        assert db_manager._enc_key == new_key
+        assert passwords(db_manager) == expected
+        assert journal(db_manager) == [] and staged(db_manager) == 0
+    finally:
+        db_manager.close()
+
+
+def test_records_written_after_staging_are_picked_up(vault):
+    add_sites(vault, 10)
+    new_key = new_encryption_key()
+    vault._begin_rekey(vault._key_wrapper.encrypt(new_key))
+    vault._stage_reencrypted_records(vault._enc_key, new_key)
+    
+    # Edited and added while the rotation was staged, under the old key
+    first = vault.get_all_records()[0].id
+    vault.update_record(first, 'edited.com', 'user', 'edited-password')
+    added = vault.add_record('added.com', 'user', 'added-password')
+    vault._finish_rekey()
+    
+    assert vault._enc_key == new_key
+    assert vault.get_password(first) == 'edited-password'
+    assert vault.get_password(added) == 'added-password'
+
+
+def test_failed_rotation_keeps_the_old_key(vault_path, monkeypatch):
+    db_manager = open_vault(vault_path)
+    expected = add_sites(db_manager, 10)
+    old_key = db_manager._enc_key
+    
+    def fail(*args):
+        raise RuntimeError("worker died")
+    monkeypatch.setattr(storage, 'reencrypt_chunk', fail)
+    
+    with pytest.raises(VaultError):
+        db_manager.rotate_encryption_key()
+    assert db_manager._enc_key == old_key
+    assert passwords(db_manager) == expected
+    assert len(journal(db_manager)) == 1
+    db_manager.close()
+    
+    monkeypatch.undo()
+    db_manager = open_vault(vault_path)
+    try:
+        assert db_manager._enc_key != old_key
+        assert passwords(db_manager) == expected
+        assert journal(db_manager) == []
+    finally:
+        db_manager.close()
+
+
+def test_changing_the_master_password_keeps_a_pending_rotation(vault_path):
+    db_manager = open_vault(vault_path)
+    expected = add_sites(db_manager, 30)
+    old_key = db_manager._enc_key
+    new_key = new_encryption_key()
+    
+    # Interrupted after journaling the key and staging part of the records
+    db_manager._begin_rekey(db_manager._key_wrapper.encrypt(new_key))
+    conn = db_manager.connections.get(db_manager.data_db)
+    rows = conn.execute("SELECT id, password FROM data ORDER BY id LIMIT 10").fetchall()
+    with db_manager.connections.transaction(db_manager.data_db) as staging:
+        staging.executemany("INSERT INTO rekey_staging (id, old_password, password) VALUES (?, ?, ?)",
+                            reencrypt_chunk(old_key, new_key, rows))
+    
+    assert db_manager.change_master_password('new password')
+    assert len(journal(db_manager)) == 1 and staged(db_manager) == 10
+    db_manager.close()
+    
+    db_manager = FastVault(str(vault_path))
+    try:
+        assert not db_manager.unlock(PASSWORD)
+        assert db_manager.unlock('new password')
+        assert db_manager._enc_key == new_key
+        assert passwords(db_manager) == expected
+        assert journal(db_manager) == [] and staged(db_manager) == 0
+    finally:
+        db_manager.close()
+
+
+def test_locking_during_a_rotation_leaves_the_vault_locked(vault_path, monkeypatch):
+    db_manager = open_vault(vault_path)
+    expected = add_sites(db_manager, 10)
+    stage = FastVault._stage_reencrypted_records
+    
+    def stage_then_lock(self, old_key, new_key):
+        stage(self, old_key, new_key)
+        self.lock()
+    monkeypatch.setattr(FastVault, '_stage_reencrypted_records', stage_then_lock)
+    
+    assert db_manager.rotate_encryption_key()
+    assert db_manager.fernet is None and db_manager._enc_key is None
+    with pytest.raises(VaultError):
+        db_manager.change_master_password('new password')
+    db_manager.close()
+    
+    monkeypatch.undo()
+    db_manager = open_vault(vault_path)
+    try:
+        assert passwords(db_manager) == expected
+        assert journal(db_manager) == []
+    finally:
+        db_manager.close()
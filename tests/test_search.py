@@ -0,0 +1,50 @@
+"""Searching through the FTS5 trigram index, and without it"""
+
+from vault import DatabaseManager
+
+from conftest import FastVault, PASSWORD, add_sites
+
+
+def drop_search_index(db_manager):
+    """Leave the vault as a SQLite build without FTS5 migrates it"""
+    with db_manager.connections.transaction(db_manager.data_db) as conn:
+        for trigger in ('data_fts_insert', 'data_fts_delete', 'data_fts_update'):
+            conn.execute(f"DROP TRIGGER {trigger}")
+        conn.execute("DROP TABLE data_fts")
+
+
+def test_search_index_is_created_once_sqlite_supports_it(vault_path, vault):
+    add_sites(vault, 20)
+    drop_search_index(vault)
+    vault.close()
+    
+    db_manager = FastVault(str(vault_path))
+    try:
+        assert db_manager._fts_enabled
+        assert db_manager._has_search_index()
+        assert [record.site for record in db_manager.search_records('site12')] == ['site12.com']
+        
+        # And the triggers keep it up to date
+        assert db_manager.unlock(PASSWORD)
+        record_id = db_manager.add_record('example.org', 'someone', 'pw')
+        assert [record.id for record in db_manager.search_records('example')] == [record_id]
+    finally:
+        db_manager.close()
+
+
+def test_search_falls_back_to_like_without_fts5(vault_path, vault, monkeypatch):
+    add_sites(vault, 20)
+    drop_search_index(vault)
+    vault.close()
+    
+    def no_fts5(self, conn):
+        conn.execute("CREATE VIRTUAL TABLE data_fts USING no_such_module(site)")
+    monkeypatch.setattr(DatabaseManager, '_create_search_index', no_fts5)
+    
+    db_manager = FastVault(str(vault_path))
+    try:
+        assert not db_manager._fts_enabled
+        assert [record.site for record in db_manager.search_records('site12')] == ['site12.com']
+        assert len(db_manager.search_records('SITE1')) == 11
+    finally:
+        db_manager.close()
@@ -0,0 +1,108 @@
+"""Fuzzy search ranking in the in-memory SearchIndex"""
+
+import sys
+import threading
+
+from vault import SearchIndex
+
+from conftest import add_sites
+
+
+def make_index(*rows) -> SearchIndex:
+    index = SearchIndex()
+    index.build([(record_id, site, username, group) for record_id, (site, username, group) in enumerate(rows, 1)])
+    return index
+
+
+def test_most_similar_typo_ranks_first(vault):
+    add_sites(vault, 20)
+    
+    records = vault.search_records('sitw11', fuzzy=True)
+    assert records[0].site == 'site11.com'
+
+
+def test_substring_and_prefix_matches_rank_above_typos():
+    index = make_index(('mygithub.io', 'me', None), ('github.com', 'me', None), ('gihtub.net', 'me', None),
+                       ('example.org', 'github', None))
+    
+    # Prefixes of site or username, then other substrings, then the typo
+    assert index.fuzzy_search('github') == [2, 4, 1, 3]
+
+
+def test_typos_are_ranked_by_similarity():
+    index = make_index(('gitlab.com', 'me', None), ('github.com', 'me', None), ('news.com', 'me', None))
+    
+    assert index.fuzzy_search('githbu') == [2, 1]
+    assert index.fuzzy_search('muisc') == []
+    assert index.fuzzy_search('nesw') == [3]
+
+
+def test_unrelated_records_are_left_out():
+    index = make_index(*[(f"site{i}.com", f"user{i}", None) for i in range(10)])
+    
+    assert index.fuzzy_search('zzzz') == []
+    assert index.fuzzy_search('bank') == []
+
+
+def test_group_filter_and_updates():
+    index = make_index(('github.com', 'me', 'Work'), ('gitlab.com', 'me', 'Home'))
+    
+    assert index.fuzzy_search('githbu', 'Home') == [2]
+    index.put(2, 'bitbucket.org', 'me', 'Home')
+    assert index.fuzzy_search('githbu', 'Home') == []
+    index.remove(1)
+    assert index.fuzzy_search('githbu') == []
+
+
+def test_writes_from_another_thread_during_searches():
+    index = make_index(*[(f"site{i}.com", f"user{i}", None) for i in range(2000)])
+    errors = []
+    
+    def write():
+        for i in range(2000, 6000):
+            index.put(i, f"site{i}.com", f"user{i}", None)
+            index.remove(i - 2000)
+    
+    def read():
+        try:
+            for _ in range(50):
+                index.search('site1')
+                index.fuzzy_search('sitw12')
+        except Exception as e:
+            errors.append(e)
+    
+    # Switch threads often enough that writes land in the middle of searches
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=write), threading.Thread(target=read)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    
+    assert errors == []
+    assert index.search('site5999') == [5999]
+
+
+def test_group_changes_update_a_loaded_index(vault):
+    add_sites(vault, 5, 'Work')
+    index = vault.get_search_index()
+    
+    vault.rename_group('Work', 'Office')
+    assert vault.get_search_index() is index and index.search('site', 'Office') == index.search('site')
+    assert index.search('site', 'Work') == []
+    
+    vault.delete_group('Office')
+    assert index.search('site', 'Office') == []
+    assert len(vault.search_records('site')) == 5
+
+
+def test_group_changes_and_imports_dont_load_the_index(vault):
+    add_sites(vault, 5, 'Work')
+    vault.rename_group('Work', 'Office')
+    vault.delete_group('Office')
+    
+    assert not vault._search_index.loaded
@@ -0,0 +1,40 @@
+"""Settings subscribers see every change to what the setting names"""
+
+from conftest import open_vault
+
+COLORS = {'bg': '#000000', 'fg': '#FFFFFF', 'accent': '#3366FF', 'button_bg': '#222222',
+          'button_fg': '#FFFFFF', 'entry_bg': '#111111', 'entry_fg': '#FFFFFF'}
+
+
+def test_subscribers_are_only_called_for_changes(vault):
+    applied = []
+    vault.settings.subscribe('theme', applied.append)
+    
+    vault.set_setting('theme', 'Dark')
+    vault.set_setting('theme', 'Dark')
+    vault.set_setting('theme', 'Dark', force=True)
+    vault.settings.unsubscribe('theme', applied.append)
+    vault.set_setting('theme', 'Light')
+    
+    assert applied == ['Dark', 'Dark']
+
+
+def test_editing_the_active_custom_theme_notifies_subscribers(vault):
+    vault.save_custom_theme('Mine', COLORS)
+    vault.save_custom_theme('Other', COLORS)
+    vault.set_setting('theme', 'Mine')
+    applied = []
+    vault.settings.subscribe('theme', applied.append)
+    
+    vault.save_custom_theme('Mine', dict(COLORS, bg='#101010'))
+    vault.save_custom_theme('Other', dict(COLORS, bg='#202020'))
+    
+    assert applied == ['Mine']
+    assert vault.get_custom_themes()['Mine']['bg'] == '#101010'
+
+
+def test_settings_are_saved(vault, vault_path):
+    vault.set_setting('theme', 'Dark')
+    vault.close()
+    
+    assert open_vault(vault_path).get_setting('theme') == 'Dark'
@@ -0,0 +1,60 @@
+"""Opening a missing or incomplete vault never deletes anything that was already there"""
+
+import pytest
+
+import cli
+from vault import DatabaseManager, VaultNotFound
+
+from conftest import FastVault, add_sites, open_vault
+
+
+def make_incomplete_vault(path):
+    """Vault whose unlock.db was lost"""
+    db_manager = open_vault(path)
+    add_sites(db_manager, 3)
+    db_manager.close()
+    (path / 'unlock.db').unlink()
+
+
+class DecliningVault(FastVault):
+    """The app's setup window, closed without setting a password"""
+    
+    def _setup_master_password(self) -> bool:
+        return False
+
+
+def test_cli_leaves_an_incomplete_vault_alone(vault_path, capsys):
+    make_incomplete_vault(vault_path)
+    data = (vault_path / 'data.db').read_bytes()
+    
+    assert cli.main(['list', '--db', str(vault_path)]) == 1
+    assert "unlock.db is missing" in capsys.readouterr().err
+    assert (vault_path / 'data.db').read_bytes() == data
+    assert not (vault_path / 'unlock.db').exists()
+
+
+def test_cli_creates_nothing_without_a_vault(vault_path, capsys):
+    assert cli.main(['list', '--db', str(vault_path)]) == 1
+    assert "start the app once" in capsys.readouterr().err
+    assert not vault_path.exists()
+    
+    with pytest.raises(VaultNotFound):
+        DatabaseManager(str(vault_path))
+    assert not vault_path.exists()
+
+
+def test_declined_setup_only_removes_what_it_created(vault_path):
+    make_incomplete_vault(vault_path)
+    (vault_path / 'notes.txt').write_text('mine')
+    data = (vault_path / 'data.db').read_bytes()
+    
+    with pytest.raises(VaultNotFound):
+        DecliningVault(str(vault_path))
+    assert (vault_path / 'data.db').read_bytes() == data
+    assert sorted(path.name for path in vault_path.iterdir()) == ['data.db', 'notes.txt']
+
+
+def test_declined_setup_of_a_new_vault_leaves_no_directory(vault_path):
+    with pytest.raises(VaultNotFound):
+        DecliningVault(str(vault_path))
+    assert not vault_path.exists()
@@ -0,0 +1,735 @@
+"""Stock color themes. Custom themes are stored in the vault"""
+
+THEMES = {
+    'Light': {
+        'bg': '#FFFFFF',
+        'fg': '#1F2937',
+        'accent': '#2563EB',
+        'button_bg': '#F3F4F6',
+        'button_fg': '#1F2937',
+        'entry_bg': '#FFFFFF',
+        'entry_fg': '#1F2937',
+        'active_bg': '#E5E7EB',
+        'active_fg': '#111827',
+        'tree_bg': '#FFFFFF',
+        'tree_fg': '#111827',
+        'tree_sel_bg': '#2563EB',
+        'tree_sel_fg': '#FFFFFF',
+        'menu_bg': '#FFFFFF',
+        'menu_fg': '#111827',
+    },
+    'Dark': {
+        'bg': '#1E1E1E',
+        'fg': '#E5E5E5',
+        'accent': '#569CD6',
+        'button_bg': '#2D2D2D',
+        'button_fg': '#E5E5E5',
+        'entry_bg': '#252526',
+        'entry_fg': '#E5E5E5',
+        'active_bg': '#3A3A3A',
+        'active_fg': '#FFFFFF',
+        'tree_bg': '#1E1E1E',
+        'tree_fg': '#E5E5E5',
+        'tree_sel_bg': '#094771',
+        'tree_sel_fg': '#FFFFFF',
+        'menu_bg': '#2D2D2D',
+        'menu_fg': '#E5E5E5',
+    },
+    'Nord': {
+        'bg': '#2E3440',
+        'fg': '#D8DEE9',
+        'accent': '#88C0D0',
+        'button_bg': '#3B4252',
+        'button_fg': '#ECEFF4',
+        'entry_bg': '#3B4252',
+        'entry_fg': '#ECEFF4',
+        'active_bg': '#4C566A',
+        'active_fg': '#ECEFF4',
+        'tree_bg': '#2E3440',
+        'tree_fg': '#D8DEE9',
+        'tree_sel_bg': '#5E81AC',
+        'tree_sel_fg': '#ECEFF4',
+        'menu_bg': '#3B4252',
+        'menu_fg': '#ECEFF4',
+    },
+    'Dracula': {
+        'bg': '#282A36',
+        'fg': '#F8F8F2',
+        'accent': '#BD93F9',
+        'button_bg': '#44475A',
+        'button_fg': '#F8F8F2',
+        'entry_bg': '#44475A',
+        'entry_fg': '#F8F8F2',
+        'active_bg': '#6272A4',
+        'active_fg': '#F8F8F2',
+        'tree_bg': '#282A36',
+        'tree_fg': '#F8F8F2',
+        'tree_sel_bg': '#6272A4',
+        'tree_sel_fg': '#F8F8F2',
+        'menu_bg': '#44475A',
+        'menu_fg': '#F8F8F2',
+    },
+    'Solarized Dark': {
+        'bg': '#002B36',
+        'fg': '#EEE8D5',
+        'accent': '#268BD2',
+        'button_bg': '#073642',
+        'button_fg': '#EEE8D5',
+        'entry_bg': '#073642',
+        'entry_fg': '#EEE8D5',
+        'active_bg': '#094352',
+        'active_fg': '#FDF6E3',
+        'tree_bg': '#002B36',
+        'tree_fg': '#EEE8D5',
+        'tree_sel_bg': '#268BD2',
+        'tree_sel_fg': '#FDF6E3',
+        'menu_bg': '#073642',
+        'menu_fg': '#EEE8D5',
+    },
+    'Solarized Light': {
+        'bg': '#FDF6E3',
+        'fg': '#073642',
+        'accent': '#268BD2',
+        'button_bg': '#EEE8D5',
+        'button_fg': '#073642',
+        'entry_bg': '#FFFFFF',
+        'entry_fg': '#073642',
+        'active_bg': '#E1DBC9',
+        'active_fg': '#002B36',
+        'tree_bg': '#FDF6E3',
+        'tree_fg': '#073642',
+        'tree_sel_bg': '#268BD2',
+        'tree_sel_fg': '#FDF6E3',
+        'menu_bg': '#EEE8D5',
+        'menu_fg': '#073642',
+    },
+    'Gruvbox Dark': {
+        'bg': '#282828',
+        'fg': '#EBDBB2',
+        'accent': '#83A598',
+        'button_bg': '#3C3836',
+        'button_fg': '#EBDBB2',
+        'entry_bg': '#3C3836',
+        'entry_fg': '#EBDBB2',
+        'active_bg': '#504945',
+        'active_fg': '#FBF1C7',
+        'tree_bg': '#282828',
+        'tree_fg': '#EBDBB2',
+        'tree_sel_bg': '#83A598',
+        'tree_sel_fg': '#1D2021',
+        'menu_bg': '#3C3836',
+        'menu_fg': '#EBDBB2',
+    },
+    'Monokai': {
+        'bg': '#272822',
+        'fg': '#F8F8F2',
+        'accent': '#A6E22E',
+        'button_bg': '#3E3D32',
+        'button_fg': '#F8F8F2',
+        'entry_bg': '#3E3D32',
+        'entry_fg': '#F8F8F2',
+        'active_bg': '#75715E',
+        'active_fg': '#F8F8F2',
+        'tree_bg': '#272822',
+        'tree_fg': '#F8F8F2',
+        'tree_sel_bg': '#A6E22E',
+        'tree_sel_fg': '#272822',
+        'menu_bg': '#3E3D32',
+        'menu_fg': '#F8F8F2',
+    },
+    'Tokyo Night': {
+        'bg': '#1a1b26',
+        'fg': '#c0caf5',
+        'accent': '#7aa2f7',
+        'button_bg': '#24283b',
+        'button_fg': '#c0caf5',
+        'entry_bg': '#24283b',
+        'entry_fg': '#c0caf5',
+        'active_bg': '#414868',
+        'active_fg': '#c0caf5',
+        'tree_bg': '#1a1b26',
+        'tree_fg': '#c0caf5',
+        'tree_sel_bg': '#7aa2f7',
+        'tree_sel_fg': '#1a1b26',
+        'menu_bg': '#24283b',
+        'menu_fg': '#c0caf5',
+    },
+    'Catppuccin Mocha': {
+        'bg': '#1e1e2e',
+        'fg': '#cdd6f4',
+        'accent': '#89b4fa',
+        'button_bg': '#313244',
+        'button_fg': '#cdd6f4',
+        'entry_bg': '#313244',
+        'entry_fg': '#cdd6f4',
+        'active_bg': '#45475a',
+        'active_fg': '#cdd6f4',
+        'tree_bg': '#1e1e2e',
+        'tree_fg': '#cdd6f4',
+        'tree_sel_bg': '#89b4fa',
+        'tree_sel_fg': '#1E1E2E',
+        'menu_bg': '#313244',
+        'menu_fg': '#cdd6f4',
+    },
+    'Catppuccin Latte': {
+        'bg': '#eff1f5',
+        'fg': '#4c4f69',
+        'accent': '#1e66f5',
+        'button_bg': '#e6e9ef',
+        'button_fg': '#4c4f69',
+        'entry_bg': '#ffffff',
+        'entry_fg': '#4c4f69',
+        'active_bg': '#dce0e8',
+        'active_fg': '#1e1e2e',
+        'tree_bg': '#eff1f5',
+        'tree_fg': '#4c4f69',
+        'tree_sel_bg': '#1e66f5',
+        'tree_sel_fg': '#eff1f5',
+        'menu_bg': '#e6e9ef',
+        'menu_fg': '#4c4f69',
+    },
+    'One Dark': {
+        'bg': '#282c34',
+        'fg': '#abb2bf',
+        'accent': '#61afef',
+        'button_bg': '#3a3f4b',
+        'button_fg': '#abb2bf',
+        'entry_bg': '#3a3f4b',
+        'entry_fg': '#abb2bf',
+        'active_bg': '#4b5263',
+        'active_fg': '#ffffff',
+        'tree_bg': '#282c34',
+        'tree_fg': '#abb2bf',
+        'tree_sel_bg': '#61afef',
+        'tree_sel_fg': '#1e222a',
+        'menu_bg': '#3a3f4b',
+        'menu_fg': '#abb2bf',
+    },
+    'Everforest Dark': {
+        'bg': '#2b3339',
+        'fg': '#d3c6aa',
+        'accent': '#a7c080',
+        'button_bg': '#323c41',
+        'button_fg': '#d3c6aa',
+        'entry_bg': '#323c41',
+        'entry_fg': '#d3c6aa',
+        'active_bg': '#3c474d',
+        'active_fg': '#d3c6aa',
+        'tree_bg': '#2b3339',
+        'tree_fg': '#d3c6aa',
+        'tree_sel_bg': '#a7c080',
+        'tree_sel_fg': '#2b3339',
+        'menu_bg': '#323c41',
+        'menu_fg': '#d3c6aa',
+    },
+    'Kanagawa': {
+        'bg': '#1f1f28',
+        'fg': '#dcd7ba',
+        'accent': '#7e9cd8',
+        'button_bg': '#2a2a37',
+        'button_fg': '#dcd7ba',
+        'entry_bg': '#2a2a37',
+        'entry_fg': '#dcd7ba',
+        'active_bg': '#363646',
+        'active_fg': '#dcd7ba',
+        'tree_bg': '#1f1f28',
+        'tree_fg': '#dcd7ba',
+        'tree_sel_bg': '#7e9cd8',
+        'tree_sel_fg': '#1f1f28',
+        'menu_bg': '#2a2a37',
+        'menu_fg': '#dcd7ba',
+    },
+    'Night Owl': {
+        'bg': '#011627',
+        'fg': '#d6deeb',
+        'accent': '#82aaff',
+        'button_bg': '#02233c',
+        'button_fg': '#d6deeb',
+        'entry_bg': '#02233c',
+        'entry_fg': '#d6deeb',
+        'active_bg': '#073042',
+        'active_fg': '#d6deeb',
+        'tree_bg': '#011627',
+        'tree_fg': '#d6deeb',
+        'tree_sel_bg': '#82aaff',
+        'tree_sel_fg': '#011627',
+        'menu_bg': '#02233c',
+        'menu_fg': '#d6deeb',
+    },
+    'Rose Pine': {
+        'bg': '#191724',
+        'fg': '#e0def4',
+        'accent': '#9ccfd8',
+        'button_bg': '#26233a',
+        'button_fg': '#e0def4',
+        'entry_bg': '#26233a',
+        'entry_fg': '#e0def4',
+        'active_bg': '#403d52',
+        'active_fg': '#e0def4',
+        'tree_bg': '#191724',
+        'tree_fg': '#e0def4',
+        'tree_sel_bg': '#9ccfd8',
+        'tree_sel_fg': '#191724',
+        'menu_bg': '#26233a',
+        'menu_fg': '#e0def4',
+    },
+    'GitHub Dark': {
+        'bg': '#0d1117',
+        'fg': '#c9d1d9',
+        'accent': '#58a6ff',
+        'button_bg': '#21262d',
+        'button_fg': '#c9d1d9',
+        'entry_bg': '#21262d',
+        'entry_fg': '#c9d1d9',
+        'active_bg': '#30363d',
+        'active_fg': '#ffffff',
+        'tree_bg': '#0d1117',
+        'tree_fg': '#c9d1d9',
+        'tree_sel_bg': '#58a6ff',
+        'tree_sel_fg': '#0d1117',
+        'menu_bg': '#21262d',
+        'menu_fg': '#c9d1d9',
+    },
+    'GitHub Light': {
+        'bg': '#ffffff',
+        'fg': '#24292f',
+        'accent': '#0969da',
+        'button_bg': '#f6f8fa',
+        'button_fg': '#24292f',
+        'entry_bg': '#ffffff',
+        'entry_fg': '#24292f',
+        'active_bg': '#eaeef2',
+        'active_fg': '#24292f',
+        'tree_bg': '#ffffff',
+        'tree_fg': '#24292f',
+        'tree_sel_bg': '#0969da',
+        'tree_sel_fg': '#ffffff',
+        'menu_bg': '#f6f8fa',
+        'menu_fg': '#24292f',
+    },
+    'Ayu Dark': {
+        'bg': '#0A0E14',
+        'fg': '#B3B1AD',
+        'accent': '#39BAE6',
+        'button_bg': '#1F2430',
+        'button_fg': '#B3B1AD',
+        'entry_bg': '#1F2430',
+        'entry_fg': '#B3B1AD',
+        'active_bg': '#27303B',
+        'active_fg': '#FFFFFF',
+        'tree_bg': '#0A0E14',
+        'tree_fg': '#B3B1AD',
+        'tree_sel_bg': '#39BAE6',
+        'tree_sel_fg': '#0A0E14',
+        'menu_bg': '#1F2430',
+        'menu_fg': '#B3B1AD',
+    },
+    'Ayu Mirage': {
+        'bg': '#1F2430',
+        'fg': '#CBCCC6',
+        'accent': '#36A3D9',
+        'button_bg': '#242B38',
+        'button_fg': '#CBCCC6',
+        'entry_bg': '#242B38',
+        'entry_fg': '#CBCCC6',
+        'active_bg': '#3A4352',
+        'active_fg': '#FFFFFF',
+        'tree_bg': '#1F2430',
+        'tree_fg': '#CBCCC6',
+        'tree_sel_bg': '#36A3D9',
+        'tree_sel_fg': '#1F2430',
+        'menu_bg': '#242B38',
+        'menu_fg': '#CBCCC6',
+    },
+    'Ayu Light': {
+        'bg': '#FAFAFA',
+        'fg': '#5C6166',
+        'accent': '#55B4D4',
+        'button_bg': '#E7E8E9',
+        'button_fg': '#5C6166',
+        'entry_bg': '#FFFFFF',
+        'entry_fg': '#5C6166',
+        'active_bg': '#DDE1E3',
+        'active_fg': '#2C2F31',
+        'tree_bg': '#FAFAFA',
+        'tree_fg': '#5C6166',
+        'tree_sel_bg': '#55B4D4',
+        'tree_sel_fg': '#FFFFFF',
+        'menu_bg': '#E7E8E9',
+        'menu_fg': '#5C6166',
+    },
+    'Horizon': {
+        'bg': '#1C1E26',
+        'fg': '#D5D8DA',
+        'accent': '#E27878',
+        'button_bg': '#232530',
+        'button_fg': '#D5D8DA',
+        'entry_bg': '#232530',
+        'entry_fg': '#D5D8DA',
+        'active_bg': '#2E3038',
+        'active_fg': '#FFFFFF',
+        'tree_bg': '#1C1E26',
+        'tree_fg': '#D5D8DA',
+        'tree_sel_bg': '#E27878',
+        'tree_sel_fg': '#1C1E26',
+        'menu_bg': '#232530',
+        'menu_fg': '#D5D8DA',
+    },
+    'Everforest Light': {
+        'bg': '#F3EAD3',
+        'fg': '#5C6A72',
+        'accent': '#A7C080',
+        'button_bg': '#E8DFC4',
+        'button_fg': '#5C6A72',
+        'entry_bg': '#FFFFFF',
+        'entry_fg': '#5C6A72',
+        'active_bg': '#D9D2B9',
+        'active_fg': '#2E383C',
+        'tree_bg': '#F3EAD3',
+        'tree_fg': '#5C6A72',
+        'tree_sel_bg': '#A7C080',
+        'tree_sel_fg': '#F3EAD3',
+        'menu_bg': '#E8DFC4',
+        'menu_fg': '#5C6A72',
+    },
+    'Oceanic Next': {
+        'bg': '#1B2B34',
+        'fg': '#D8DEE9',
+        'accent': '#6699CC',
+        'button_bg': '#2E3C43',
+        'button_fg': '#D8DEE9',
+        'entry_bg': '#2E3C43',
+        'entry_fg': '#D8DEE9',
+        'active_bg': '#34444C',
+        'active_fg': '#FFFFFF',
+        'tree_bg': '#1B2B34',
+        'tree_fg': '#D8DEE9',
+        'tree_sel_bg': '#6699CC',
+        'tree_sel_fg': '#1B2B34',
+        'menu_bg': '#2E3C43',
+        'menu_fg': '#D8DEE9',
+    },
+    'Cyberpunk': {
+        'bg': '#0A0A12',
+        'fg': '#F5F5F5',
+        'accent': '#FF007C',
+        'button_bg': '#1B1B2B',
+        'button_fg': '#F5F5F5',
+        'entry_bg': '#1B1B2B',
+        'entry_fg': '#F5F5F5',
+        'active_bg': '#2D2D44',
+        'active_fg': '#FFFFFF',
+        'tree_bg': '#0A0A12',
+        'tree_fg': '#F5F5F5',
+        'tree_sel_bg': '#FF007C',
+        'tree_sel_fg': '#0A0A12',
+        'menu_bg': '#1B1B2B',
+        'menu_fg': '#F5F5F5',
+    },
+    'Synthwave': {
+        'bg': '#1A0B2E',
+        'fg': '#E0E0FF',
+        'accent': '#FF6BFF',
+        'button_bg': '#2B1450',
+        'button_fg': '#E0E0FF',
+        'entry_bg': '#2B1450',
+        'entry_fg': '#E0E0FF',
+        'active_bg': '#40256B',
+        'active_fg': '#FFFFFF',
+        'tree_bg': '#1A0B2E',
+        'tree_fg': '#E0E0FF',
+        'tree_sel_bg': '#FF6BFF',
+        'tree_sel_fg': '#1A0B2E',
+        'menu_bg': '#2B1450',
+        'menu_fg': '#E0E0FF',
+    },
+    'Terminal Green': {
+        'bg': '#000000',
+        'fg': '#00FF00',
+        'accent': '#00AA00',
+        'button_bg': '#002200',
+        'button_fg': '#00FF00',
+        'entry_bg': '#002200',
+        'entry_fg': '#00FF00',
+        'active_bg': '#004400',
+        'active_fg': '#00FF00',
+        'tree_bg': '#000000',
+        'tree_fg': '#00FF00',
+        'tree_sel_bg': '#00AA00',
+        'tree_sel_fg': '#000000',
+        'menu_bg': '#002200',
+        'menu_fg': '#00FF00',
+    },
+    'Amber CRT': {
+        'bg': '#000000',
+        'fg': '#FFB000',
+        'accent': '#FF8C00',
+        'button_bg': '#331A00',
+        'button_fg': '#FFB000',
+        'entry_bg': '#331A00',
+        'entry_fg': '#FFB000',
+        'active_bg': '#553300',
+        'active_fg': '#FFFFFF',
+        'tree_bg': '#000000',
+        'tree_fg': '#FFB000',
+        'tree_sel_bg': '#FF8C00',
+        'tree_sel_fg': '#000000',
+        'menu_bg': '#331A00',
+        'menu_fg': '#FFB000',
+    },
+    'Catppuccin Frappé': {
+        'bg': '#303446',
+        'fg': '#c6d0f5',
+        'accent': '#8caaee',
+        'button_bg': '#414559',
+        'button_fg': '#c6d0f5',
+        'entry_bg': '#414559',
+        'entry_fg': '#c6d0f5',
+        'active_bg': '#51576d',
+        'active_fg': '#ffffff',
+        'tree_bg': '#303446',
+        'tree_fg': '#c6d0f5',
+        'tree_sel_bg': '#8caaee',
+        'tree_sel_fg': '#303446',
+        'menu_bg': '#414559',
+        'menu_fg': '#c6d0f5',
+    },
+    'Catppuccin Macchiato': {
+        'bg': '#24273a',
+        'fg': '#cad3f5',
+        'accent': '#8aadf4',
+        'button_bg': '#363a4f',
+        'button_fg': '#cad3f5',
+        'entry_bg': '#363a4f',
+        'entry_fg': '#cad3f5',
+        'active_bg': '#494d64',
+        'active_fg': '#ffffff',
+        'tree_bg': '#24273a',
+        'tree_fg': '#cad3f5',
+        'tree_sel_bg': '#8aadf4',
+        'tree_sel_fg': '#24273a',
+        'menu_bg': '#363a4f',
+        'menu_fg': '#cad3f5',
+    },
+    'Glacier': {
+        'bg': '#eaf4f4',
+        'fg': '#00332e',
+        'accent': '#4e8098',
+        'button_bg': '#d8eaea',
+        'button_fg': '#00332e',
+        'entry_bg': '#ffffff',
+        'entry_fg': '#00332e',
+        'active_bg': '#cddfde',
+        'active_fg': '#002522',
+        'tree_bg': '#eaf4f4',
+        'tree_fg': '#00332e',
+        'tree_sel_bg': '#4e8098',
+        'tree_sel_fg': '#ffffff',
+        'menu_bg': '#d8eaea',
+        'menu_fg': '#00332e',
+    },
+    'Forest Dew': {
+        'bg': '#e7f0e4',
+        'fg': '#2a3b1f',
+        'accent': '#84a98c',
+        'button_bg': '#d7e7d4',
+        'button_fg': '#2a3b1f',
+        'entry_bg': '#ffffff',
+        'entry_fg': '#2a3b1f',
+        'active_bg': '#c6d8c2',
+        'active_fg': '#1e2c16',
+        'tree_bg': '#e7f0e4',
+        'tree_fg': '#2a3b1f',
+        'tree_sel_bg': '#84a98c',
+        'tree_sel_fg': '#ffffff',
+        'menu_bg': '#d7e7d4',
+        'menu_fg': '#2a3b1f',
+    },
+    'Sakura': {
+        'bg': '#fff0f6',
+        'fg': '#3a2e3c',
+        'accent': '#ff77a8',
+        'button_bg': '#f8dce9',
+        'button_fg': '#3a2e3c',
+        'entry_bg': '#ffffff',
+        'entry_fg': '#3a2e3c',
+        'active_bg': '#f1c8d9',
+        'active_fg': '#3a2e3c',
+        'tree_bg': '#fff0f6',
+        'tree_fg': '#3a2e3c',
+        'tree_sel_bg': '#ff77a8',
+        'tree_sel_fg': '#fff0f6',
+        'menu_bg': '#f8dce9',
+        'menu_fg': '#3a2e3c',
+    },
+    'Lavender Mist': {
+        'bg': '#f4f0ff',
+        'fg': '#362b44',
+        'accent': '#a882dd',
+        'button_bg': '#e7ddff',
+        'button_fg': '#362b44',
+        'entry_bg': '#ffffff',
+        'entry_fg': '#362b44',
+        'active_bg': '#d8caff',
+        'active_fg': '#2a2235',
+        'tree_bg': '#f4f0ff',
+        'tree_fg': '#362b44',
+        'tree_sel_bg': '#a882dd',
+        'tree_sel_fg': '#ffffff',
+        'menu_bg': '#e7ddff',
+        'menu_fg': '#362b44',
+    },
+    'Vaporwave': {
+        'bg': '#2b1d47',
+        'fg': '#ffb7ff',
+        'accent': '#7df9ff',
+        'button_bg': '#3a2963',
+        'button_fg': '#ffb7ff',
+        'entry_bg': '#3a2963',
+        'entry_fg': '#ffb7ff',
+        'active_bg': '#4f3b82',
+        'active_fg': '#ffffff',
+        'tree_bg': '#2b1d47',
+        'tree_fg': '#ffb7ff',
+        'tree_sel_bg': '#7df9ff',
+        'tree_sel_fg': '#2b1d47',
+        'menu_bg': '#3a2963',
+        'menu_fg': '#ffb7ff',
+    },
+    'DOS Blue': {
+        'bg': '#0000AA',
+        'fg': '#FFFFFF',
+        'accent': '#FFFF55',
+        'button_bg': '#000088',
+        'button_fg': '#FFFFFF',
+        'entry_bg': '#000088',
+        'entry_fg': '#FFFFFF',
+        'active_bg': '#000066',
+        'active_fg': '#FFFF55',
+        'tree_bg': '#0000AA',
+        'tree_fg': '#FFFFFF',
+        'tree_sel_bg': '#FFFF55',
+        'tree_sel_fg': '#000000',
+        'menu_bg': '#000088',
+        'menu_fg': '#FFFFFF',
+    },
+    'High Contrast Dark': {
+        'bg': '#000000',
+        'fg': '#FFFFFF',
+        'accent': '#00FFFF',
+        'button_bg': '#1a1a1a',
+        'button_fg': '#FFFFFF',
+        'entry_bg': '#1a1a1a',
+        'entry_fg': '#FFFFFF',
+        'active_bg': '#333333',
+        'active_fg': '#FFFFFF',
+        'tree_bg': '#000000',
+        'tree_fg': '#FFFFFF',
+        'tree_sel_bg': '#00FFFF',
+        'tree_sel_fg': '#000000',
+        'menu_bg': '#1a1a1a',
+        'menu_fg': '#FFFFFF',
+    },
+    'High Contrast Light': {
+        'bg': '#FFFFFF',
+        'fg': '#000000',
+        'accent': '#0000FF',
+        'button_bg': '#EEEEEE',
+        'button_fg': '#000000',
+        'entry_bg': '#FFFFFF',
+        'entry_fg': '#000000',
+        'active_bg': '#DDDDDD',
+        'active_fg': '#000000',
+        'tree_bg': '#FFFFFF',
+        'tree_fg': '#000000',
+        'tree_sel_bg': '#0000FF',
+        'tree_sel_fg': '#FFFFFF',
+        'menu_bg': '#EEEEEE',
+        'menu_fg': '#000000',
+    },
+    'Material Blue': {
+        'bg': '#0D1B2A',
+        'fg': '#E0E5EB',
+        'accent': '#3D8DFF',
+        'button_bg': '#1B263B',
+        'button_fg': '#E0E5EB',
+        'entry_bg': '#1B263B',
+        'entry_fg': '#E0E5EB',
+        'active_bg': '#415A77',
+        'active_fg': '#FFFFFF',
+        'tree_bg': '#0D1B2A',
+        'tree_fg': '#E0E5EB',
+        'tree_sel_bg': '#3D8DFF',
+        'tree_sel_fg': '#0D1B2A',
+        'menu_bg': '#1B263B',
+        'menu_fg': '#E0E5EB',
+    },
+    'Material Teal': {
+        'bg': '#0C2524',
+        'fg': '#D8F3DC',
+        'accent': '#52B69A',
+        'button_bg': '#143433',
+        'button_fg': '#D8F3DC',
+        'entry_bg': '#143433',
+        'entry_fg': '#D8F3DC',
+        'active_bg': '#2D6A4F',
+        'active_fg': '#FFFFFF',
+        'tree_bg': '#0C2524',
+        'tree_fg': '#D8F3DC',
+        'tree_sel_bg': '#52B69A',
+        'tree_sel_fg': '#0C2524',
+        'menu_bg': '#143433',
+        'menu_fg': '#D8F3DC',
+    },
+    'Material Purple': {
+        'bg': '#1A102A',
+        'fg': '#ECE0FF',
+        'accent': '#A066FF',
+        'button_bg': '#26163B',
+        'button_fg': '#ECE0FF',
+        'entry_bg': '#26163B',
+        'entry_fg': '#ECE0FF',
+        'active_bg': '#3B2670',
+        'active_fg': '#FFFFFF',
+        'tree_bg': '#1A102A',
+        'tree_fg': '#ECE0FF',
+        'tree_sel_bg': '#A066FF',
+        'tree_sel_fg': '#1A102A',
+        'menu_bg': '#26163B',
+        'menu_fg': '#ECE0FF',
+    },
+    'Sepia': {
+        'bg': '#FAF0E6',
+        'fg': '#4D3C2F',
+        'accent': '#A0522D',
+        'button_bg': '#EADFCF',
+        'button_fg': '#4D3C2F',
+        'entry_bg': '#FFFFFF',
+        'entry_fg': '#4D3C2F',
+        'active_bg': '#DCD4C4',
+        'active_fg': '#3C2C1F',
+        'tree_bg': '#FAF0E6',
+        'tree_fg': '#4D3C2F',
+        'tree_sel_bg': '#A0522D',
+        'tree_sel_fg': '#FAF0E6',
+        'menu_bg': '#EADFCF',
+        'menu_fg': '#4D3C2F',
+    },
+    'Tango': {
+        'bg': '#2E3436',
+        'fg': '#EEEEEC',
+        'accent': '#F57900',
+        'button_bg': '#343D41',
+        'button_fg': '#EEEEEC',
+        'entry_bg': '#3D4448',
+        'entry_fg': '#EEEEEC',
+        'active_bg': '#4A5358',
+        'active_fg': '#FCE94F',
+        'tree_bg': '#2E3436',
+        'tree_fg': '#EEEEEC',
+        'tree_sel_bg': '#F57900',
+        'tree_sel_fg': '#2E3436',
+        'menu_bg': '#343D41',
+        'menu_fg': '#EEEEEC',
+    },
+}
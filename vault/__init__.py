@@ -0,0 +1,21 @@
+"""Password vault storage, encryption and generation, with no user interface.
+
+Used by both the Tk app (app.py) and the command line (cli.py), and importable on its own
+for scripts and background work. Failures are raised as the exceptions in vault.errors,
+never shown, and nothing here imports tkinter.
+"""
+
+from .errors import (CryptoError, GroupExistsError, OperationCancelled, StorageError, VaultError,
+                     VaultNotFound)
+from .crypto import calibrate_bcrypt_rounds
+from .generator import PasswordGenerator
+from .storage import (ConnectionManager, DatabaseManager, Record, RecordChanges, SearchIndex, Settings,
+                      export_records_csv, iter_import_rows)
+
+__all__ = [
+    'CryptoError', 'GroupExistsError', 'OperationCancelled', 'StorageError', 'VaultError', 'VaultNotFound',
+    'calibrate_bcrypt_rounds',
+    'PasswordGenerator',
+    'ConnectionManager', 'DatabaseManager', 'Record', 'RecordChanges', 'SearchIndex', 'Settings',
+    'export_records_csv', 'iter_import_rows',
+]
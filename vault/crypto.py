@@ -0,0 +1,77 @@
+"""Key derivation, master password hashing and bulk re-encryption.
+
+bcrypt and cryptography are imported by the functions that use them, so the app can show its
+first window while they load on the thread that checks the master password.
+"""
+
+import base64
+import math
+import time
+from typing import TYPE_CHECKING, List, Tuple
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
+
+# bcrypt's default cost, which master passwords were hashed at before calibration
+MIN_BCRYPT_ROUNDS = 12
+
+
+def new_encryption_key() -> bytes:
+    """A new random key for make_cipher()"""
+    from cryptography.fernet import Fernet
+    return Fernet.generate_key()
+
+
+def make_cipher(key: bytes) -> 'Fernet':
+    """Cipher that encrypts and decrypts with key"""
+    from cryptography.fernet import Fernet
+    return Fernet(key)
+
+
+def derive_key_wrapper(password: str, salt: bytes, iterations: int) -> 'Fernet':
+    """Derive the key that wraps the encryption key from the master password"""
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+    kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=salt, iterations=iterations)
+    return make_cipher(base64.urlsafe_b64encode(kdf.derive(password.encode('utf-8'))))
+
+
+def hash_master_password(password: str, rounds: int) -> bytes:
+    """bcrypt hash of the master password at the given cost"""
+    import bcrypt
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds))
+
+
+def check_master_password(password: str, hashed: bytes) -> bool:
+    """Whether password matches a hash from hash_master_password()"""
+    import bcrypt
+    return bcrypt.checkpw(password.encode('utf-8'), hashed)
+
+
+def calibrate_bcrypt_rounds(target_seconds: float, minimum: int = MIN_BCRYPT_ROUNDS, maximum: int = 16) -> int:
+    """Return the bcrypt cost between minimum and maximum whose hash time on this machine is
+    closest to target_seconds.
+    
+    Each extra round doubles the work, so one quick hash is timed and scaled.
+    """
+    import bcrypt
+    timed = min(minimum, 10)
+    start = time.perf_counter()
+    bcrypt.hashpw(b'calibration', bcrypt.gensalt(timed))
+    elapsed = max(time.perf_counter() - start, 1e-6)
+    
+    rounds = timed + round(math.log2(target_seconds / elapsed))
+    return max(minimum, min(maximum, rounds))
+
+
+def bcrypt_cost(hashed: bytes) -> int:
+    """Cost factor of a bcrypt hash such as b'$2b$12$...'"""
+    return int(hashed.split(b'$')[2])
+
+
+def reencrypt_chunk(old_key: bytes, new_key: bytes, rows) -> List[Tuple[int, bytes, bytes]]:
+    """Return (id, old_password, new_password) for (id, old_password) rows. Runs in worker processes"""
+    old_fernet = make_cipher(old_key)
+    new_fernet = make_cipher(new_key)
+    return [(record_id, token, new_fernet.encrypt(old_fernet.decrypt(token))) for record_id, token in rows]
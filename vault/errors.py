@@ -0,0 +1,25 @@
+"""Exceptions raised by the vault"""
+
+
+class VaultError(Exception):
+    """Raised when a vault operation fails"""
+
+
+class VaultNotFound(VaultError):
+    """Raised when there is no vault at the path and none was set up"""
+
+
+class StorageError(VaultError):
+    """Raised when reading or writing the vault databases fails"""
+
+
+class GroupExistsError(VaultError):
+    """Raised when renaming a group to the name of another group"""
+
+
+class CryptoError(VaultError):
+    """Raised when a password or key can't be encrypted or decrypted"""
+
+
+class OperationCancelled(Exception):
+    """Raised by a long operation that was asked to stop"""
@@ -0,0 +1,24 @@
+"""Random password generation"""
+
+import string
+import secrets
+
+
+class PasswordGenerator:
+    """Handles password generation"""
+    
+    def __init__(self):
+        self.alphabet = string.ascii_lowercase + string.ascii_uppercase + string.digits + string.punctuation
+    
+    def generate(self, length: int, use_special: bool = True) -> str:
+        """Generate a random password of desired length"""
+        if length <= 0 or length > 100:
+            raise ValueError("Password length must be between 1 and 100")
+
+        if use_special:
+            # self.alphabet = string.punctuation
+            self.alphabet = string.ascii_lowercase + string.ascii_uppercase + string.digits + string.punctuation
+        else:
+            self.alphabet = string.ascii_lowercase + string.ascii_uppercase + string.digits
+        
+        return ''.join(secrets.choice(self.alphabet) for _ in range(length))
@@ -0,0 +1,245 @@
+"""Opt-in timing of vault operations and of the app code that calls them.
+
+Nothing is timed until enable() is called. It wraps every public DatabaseManager method, in
+subclasses too, Fernet.encrypt and Fernet.decrypt, and the methods added with register().
+disable() puts the originals back, so nothing is slowed down while it is off. Code can also
+time a section of itself with timed(), which does nothing while disabled.
+
+Each name gets a call count, total, min and max time, a latency histogram and the rows its
+calls returned. Times include the timed calls nested inside them, so the time spent in
+DatabaseManager.get_password includes its Fernet.decrypt.
+
+The app imports this module on startup, so what only enable() and dump_json() need is
+imported by them.
+"""
+
+import bisect
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .storage import DatabaseManager, Record
+
+
+# Upper bounds of the histogram buckets in milliseconds. Slower calls go in a last, open bucket
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+# Methods whose int result is a number of rows rather than an id
+COUNT_RESULTS = frozenset({'add_records'})
+
+_lock = threading.Lock()
+_local = threading.local()
+_timings: Dict[str, 'Timing'] = {}
+_registered: List[Tuple[type, Tuple[str, ...]]] = []
+_originals: List[Tuple[type, str, Callable]] = []
+_enabled_since: Optional[datetime] = None
+
+
+class Timing:
+    """Calls, times and rows recorded under one name"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+        self.rows = 0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+    
+    def add(self, seconds: float, rows: Optional[int] = None):
+        self.calls += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        if rows:
+            self.rows += rows
+        self.buckets[bisect.bisect_left(BUCKETS_MS, seconds * 1000)] += 1
+    
+    def percentile(self, fraction: float) -> float:
+        """Milliseconds within which fraction of the calls finished, rounded up to a bucket bound"""
+        target = fraction * self.calls
+        seen = 0
+        for bound, count in zip(BUCKETS_MS, self.buckets):
+            seen += count
+            if seen >= target:
+                return min(bound, self.max * 1000)
+        return self.max * 1000
+    
+    def as_dict(self) -> dict:
+        histogram = {f"<={bound}": count for bound, count in zip(BUCKETS_MS, self.buckets)}
+        histogram[f">{BUCKETS_MS[-1]}"] = self.buckets[-1]
+        return {
+            'name': self.name,
+            'calls': self.calls,
+            'total_ms': round(self.total * 1000, 3),
+            'mean_ms': round(self.total * 1000 / self.calls, 3),
+            'min_ms': round(self.min * 1000, 3),
+            'p50_ms': round(self.percentile(0.5), 3),
+            'p95_ms': round(self.percentile(0.95), 3),
+            'max_ms': round(self.max * 1000, 3),
+            'rows': self.rows,
+            'histogram_ms': histogram,
+        }
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def record(name: str, seconds: float, rows: Optional[int] = None):
+    """Add one call of name that took seconds. Safe to call from any thread"""
+    with _lock:
+        timing = _timings.get(name)
+        if timing is None:
+            timing = _timings[name] = Timing(name)
+        timing.add(seconds, rows)
+
+
+@contextmanager
+def timed(name: str, rows: Optional[int] = None):
+    """Record the time the with block takes under name, while enabled"""
+    if not _originals:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start, rows)
+
+
+def _rows(method_name: str, result) -> Optional[int]:
+    """Rows a call touched, judged by what it returned"""
+    if isinstance(result, (list, tuple, dict, set)):
+        return len(result)
+    if isinstance(result, Record):
+        return 1
+    if method_name in COUNT_RESULTS and isinstance(result, int) and not isinstance(result, bool):
+        return result
+    return None
+
+
+def _timed(name: str, function: Callable) -> Callable:
+    """Wrap function to record its calls under name. A call made while name is already being
+    timed on the same thread, such as an override calling its base method, is only counted once"""
+    import inspect
+    method_name = name.rpartition('.')[2]
+    
+    if inspect.isgeneratorfunction(function):
+        # Only the time spent producing items counts, not the caller's work between them
+        @functools.wraps(function)
+        def generator_wrapper(*args, **kwargs):
+            iterator = function(*args, **kwargs)
+            elapsed = 0.0
+            rows = 0
+            try:
+                while True:
+                    start = time.perf_counter()
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        return
+                    finally:
+                        elapsed += time.perf_counter() - start
+                    rows += 1
+                    yield item
+            finally:
+                iterator.close()
+                record(name, elapsed, rows)
+        return generator_wrapper
+    
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        active = _local.__dict__.setdefault('names', set())
+        if name in active:
+            return function(*args, **kwargs)
+        
+        active.add(name)
+        start = time.perf_counter()
+        result = None
+        try:
+            result = function(*args, **kwargs)
+            return result
+        finally:
+            active.discard(name)
+            record(name, time.perf_counter() - start, _rows(method_name, result))
+    return wrapper
+
+
+def _wrap(cls: type, names: Sequence[str], prefix: str):
+    for name in names:
+        original = vars(cls)[name]
+        _originals.append((cls, name, original))
+        setattr(cls, name, _timed(f"{prefix}.{name}", original))
+
+
+def _subclasses(cls: type) -> List[type]:
+    classes = [cls]
+    for subclass in cls.__subclasses__():
+        classes.extend(_subclasses(subclass))
+    return classes
+
+
+def register(cls: type, *names: str):
+    """Time the named methods of cls while enabled, recorded as ClassName.method"""
+    _registered.append((cls, names))
+    if _originals:
+        _wrap(cls, names, cls.__name__)
+
+
+def enable():
+    """Start timing. Does nothing if already enabled"""
+    global _enabled_since
+    if _originals:
+        return
+    import inspect
+    from cryptography.fernet import Fernet
+    
+    # Overrides in subclasses are recorded under DatabaseManager too, so each method has one entry
+    for cls in _subclasses(DatabaseManager):
+        _wrap(cls, [name for name, value in vars(cls).items()
+                    if not name.startswith('_') and inspect.isfunction(value)], DatabaseManager.__name__)
+    _wrap(Fernet, ('encrypt', 'decrypt'), 'Fernet')
+    for cls, names in _registered:
+        _wrap(cls, names, cls.__name__)
+    _enabled_since = datetime.now()
+
+
+def disable():
+    """Stop timing and restore the original methods. What was recorded is kept"""
+    global _enabled_since
+    for cls, name, original in reversed(_originals):
+        setattr(cls, name, original)
+    _originals.clear()
+    _enabled_since = None
+
+
+def reset():
+    """Forget everything recorded so far"""
+    with _lock:
+        _timings.clear()
+
+
+def snapshot() -> List[dict]:
+    """Everything recorded, slowest total first"""
+    with _lock:
+        timings = [timing.as_dict() for timing in _timings.values()]
+    return sorted(timings, key=lambda timing: timing['total_ms'], reverse=True)
+
+
+def dump_json(path: str):
+    """Write the recorded timings to path as JSON"""
+    import json
+    report = {
+        'enabled': is_enabled(),
+        'enabled_since': _enabled_since.isoformat(timespec='seconds') if _enabled_since else None,
+        'written': datetime.now().isoformat(timespec='seconds'),
+        'histogram_buckets_ms': list(BUCKETS_MS),
+        'timings': snapshot(),
+    }
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+        file.write('\n')
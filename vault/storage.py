@@ -0,0 +1,1645 @@
+"""SQLite storage for records, groups, settings and custom themes, with caching and search"""
+
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+import json
+import heapq
+from collections import deque, OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Optional, List, Tuple, Dict, Any, Iterable, Iterator, Sequence, Callable
+
+from .crypto import (MIN_BCRYPT_ROUNDS, bcrypt_cost, calibrate_bcrypt_rounds, check_master_password,
+                     derive_key_wrapper, hash_master_password, make_cipher, new_encryption_key, reencrypt_chunk)
+from .errors import CryptoError, GroupExistsError, OperationCancelled, StorageError, VaultError, VaultNotFound
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
+
+def _warn(message: str, *args):
+    """Log a problem the vault recovered from as a warning. Unless logging is configured it goes
+    to stderr, so stdout stays clean for the command line interface"""
+    # Imported here so it isn't loaded on every start
+    import logging
+    logging.getLogger(__name__).warning(message, *args)
+
+
+class ConnectionManager:
+    """Keeps long-lived SQLite connections so each operation doesn't pay for connect/close.
+
+    One connection is kept per database file and per thread. Connections are opened in
+    autocommit mode and transactions are started explicitly with transaction(), which also
+    lets sqlite3's statement cache reuse prepared statements across calls.
+    """
+    
+    def __init__(self, cached_statements: int = 256):
+        self.cached_statements = cached_statements
+        self._connections: Dict[Tuple[int, str], sqlite3.Connection] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, db_file) -> sqlite3.Connection:
+        """Return the open connection to db_file for the calling thread"""
+        key = (threading.get_ident(), str(db_file))
+        conn = self._connections.get(key)
+        if conn is None:
+            conn = sqlite3.connect(str(db_file), isolation_level=None, check_same_thread=False,
+                                   cached_statements=self.cached_statements)
+            with self._lock:
+                self._connections[key] = conn
+        return conn
+    
+    @contextmanager
+    def transaction(self, db_file):
+        """Run the block in one transaction. Nested calls join the outer transaction"""
+        conn = self.get(db_file)
+        if conn.in_transaction:
+            yield conn
+            return
+        
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+    
+    def close(self, db_file=None):
+        """Close connections to db_file, or every connection if db_file is None"""
+        with self._lock:
+            for key in list(self._connections):
+                if db_file is None or key[1] == str(db_file):
+                    try:
+                        self._connections.pop(key).close()
+                    except Exception:
+                        pass
+
+
+class Record:
+    """One password record. Fields the query didn't select are None"""
+    
+    __slots__ = ('id', 'site', 'username', 'group_name', 'password_length',
+                 'encrypted_password', 'date_added', 'date_modified')
+    
+    def __init__(self, id: int, site: str, username: str, group_name: Optional[str] = None,
+                 password_length: Optional[int] = None, encrypted_password: Optional[bytes] = None,
+                 date_added: Optional[str] = None, date_modified: Optional[str] = None):
+        self.id = id
+        self.site = site
+        self.username = username
+        self.group_name = group_name
+        self.password_length = password_length
+        self.encrypted_password = encrypted_password
+        self.date_added = date_added
+        self.date_modified = date_modified
+    
+    def __repr__(self):
+        return f"Record(id={self.id!r}, site={self.site!r}, username={self.username!r}, group_name={self.group_name!r})"
+
+
+def _record_factory(cursor: sqlite3.Cursor, row: tuple) -> Record:
+    """Row factory for queries selecting DatabaseManager.LISTING_COLUMNS or RECORD_COLUMNS"""
+    return Record(*row)
+
+
+class RecordChanges:
+    """Ids of records written since the changes were last taken"""
+    
+    __slots__ = ('added', 'updated', 'deleted', 'reset')
+    
+    def __init__(self):
+        self.added = set()
+        self.updated = set()
+        self.deleted = set()
+        # Set by bulk writes (imports, group renames) where listing every id isn't worth it
+        self.reset = False
+
+
+class QueryCache:
+    """Least recently used cache of record listings keyed by (group_filter, search_term, limit).
+    
+    limit is None for complete results. Writes invalidate only the entries they can affect:
+    a record change drops the listings its old or new values belong to, and a group change
+    drops listings of that group and any other listing showing a record in it. Listings of
+    more than max_rows records aren't cached. Safe to use from several threads.
+    """
+    
+    def __init__(self, capacity: int = 32, max_rows: int = 200000):
+        self.capacity = capacity
+        self.max_rows = max_rows
+        self._entries: OrderedDict = OrderedDict()
+        self._rows = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key: Tuple) -> Optional[List[Record]]:
+        with self._lock:
+            rows = self._entries.get(key)
+            if rows is None:
+                return None
+            self._entries.move_to_end(key)
+            return list(rows)
+    
+    def put(self, key: Tuple, rows: List[Record]):
+        rows = list(rows)
+        with self._lock:
+            self._discard(key)
+            if len(rows) > self.max_rows:
+                return
+            self._entries[key] = rows
+            self._rows += len(rows)
+            
+            while len(self._entries) > self.capacity or self._rows > self.max_rows:
+                self._discard(next(iter(self._entries)))
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._rows = 0
+    
+    def invalidate_record(self, *versions: Optional[Tuple[str, str, Optional[str]]]):
+        """Drop listings that include or would include a record, given its
+        (site, username, group_name) before and/or after a write"""
+        versions = [version for version in versions if version is not None]
+        
+        with self._lock:
+            for key in list(self._entries):
+                group_filter, search_term = key[0], key[1]
+                for site, username, group_name in versions:
+                    if group_filter != "All" and group_name != group_filter:
+                        continue
+                    if search_term and not self._may_match(search_term, site, username):
+                        continue
+                    self._discard(key)
+                    break
+    
+    def invalidate_group(self, group_name: str):
+        """Drop listings of a group, and listings showing any record in it"""
+        with self._lock:
+            for key, rows in list(self._entries.items()):
+                if key[0] == group_name or any(record.group_name == group_name for record in rows):
+                    self._discard(key)
+    
+    @staticmethod
+    def _may_match(search_term: str, site: str, username: str) -> bool:
+        # LIKE treats % and _ as wildcards, so don't try to second-guess those searches
+        if '%' in search_term or '_' in search_term:
+            return True
+        term = search_term.lower()
+        return term in site.lower() or term in username.lower()
+    
+    def _discard(self, key: Tuple):
+        rows = self._entries.pop(key, None)
+        if rows is not None:
+            self._rows -= len(rows)
+
+
+_WORD = re.compile(r'[^\W_]+')
+
+
+def _trigrams(text: str) -> set:
+    """Trigrams of each word in text, padded with spaces as PostgreSQL's pg_trgm does so the
+    start and end of a word count too. Punctuation, and the separator in search index keys,
+    split words"""
+    grams = set()
+    for word in _WORD.findall(text):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _similarity(query_grams: set, text: str, min_shared: int) -> float:
+    """Trigrams text shares with the query over the trigrams of both, or 0 if fewer than
+    min_shared are shared"""
+    # Words padded as _trigrams pads them; the spaces between words only make trigrams with
+    # two trailing spaces, which no query has, so a substring test finds exactly the shared ones
+    padded = f"  {'   '.join(_WORD.findall(text))} "
+    shared = sum(1 for gram in query_grams if gram in padded)
+    if shared < min_shared:
+        return 0.0
+    return shared / (len(query_grams) + len(_trigrams(text)) - shared)
+
+
+class SearchIndex:
+    """Lower-cased site and username of every record, kept in memory for search-as-you-type.
+    
+    Entries stay in id order, since new records always get the highest id and updates keep
+    their place, so results come back in the same order as the list. A trigram index over
+    the same text finds candidates for fuzzy searches. It is built by the first fuzzy search,
+    so unlocking doesn't pay for it, and kept up to date from then on. Safe to use from
+    several threads.
+    """
+    
+    __slots__ = ('_entries', '_postings', 'loaded', '_lock')
+    
+    # Share of the query's trigrams a fuzzy match must have. Two letters swapped in a 5 letter
+    # word leave it 2 of its 6
+    FUZZY_MIN_OVERLAP = 0.3
+    
+    def __init__(self):
+        self.loaded = False
+        self._entries: Dict[int, Tuple[str, Optional[str]]] = {}
+        # Ids whose text contains each trigram. Ids aren't removed when a record changes or is
+        # deleted; fuzzy_search checks candidates against the current text instead
+        self._postings: Optional[Dict[str, List[int]]] = None
+        self._lock = threading.RLock()
+    
+    def build(self, rows: Iterable[Tuple[int, str, str, Optional[str]]]):
+        """Replace the index with (id, site, username, group_name) rows, given in id order"""
+        entries = {record_id: (f"{site}\0{username}".lower(), group_name)
+                   for record_id, site, username, group_name in rows}
+        with self._lock:
+            self._entries = entries
+            self._postings = None
+            self.loaded = True
+    
+    def clear(self):
+        with self._lock:
+            self._entries = {}
+            self._postings = None
+            self.loaded = False
+    
+    def put(self, record_id: int, site: str, username: str, group_name: Optional[str]):
+        """Add or update one record"""
+        key = f"{site}\0{username}".lower()
+        with self._lock:
+            old = self._entries.get(record_id)
+            self._entries[record_id] = (key, group_name)
+            
+            if self._postings is not None:
+                grams = _trigrams(key)
+                if old is not None:
+                    grams -= _trigrams(old[0])
+                self._add_postings(record_id, grams)
+    
+    def _add_postings(self, record_id: int, grams: Iterable[str]):
+        postings = self._postings
+        for gram in grams:
+            if gram in postings:
+                postings[gram].append(record_id)
+            else:
+                postings[gram] = [record_id]
+    
+    def _build_postings(self):
+        self._postings = {}
+        for record_id, (key, _) in self._entries.items():
+            self._add_postings(record_id, _trigrams(key))
+    
+    def remove(self, record_id: int):
+        with self._lock:
+            self._entries.pop(record_id, None)
+    
+    def rename_group(self, old_name: str, new_name: Optional[str]):
+        """Move every record in group old_name to new_name, None for no group. The text and
+        trigrams don't change, so the postings are kept"""
+        with self._lock:
+            for record_id, (key, group_name) in self._entries.items():
+                if group_name == old_name:
+                    self._entries[record_id] = (key, new_name)
+    
+    def search(self, term: str, group_filter: str = "All", within: Optional[Sequence[int]] = None) -> List[int]:
+        """Return ids of records with term in site or username, in id order.
+        
+        within narrows an earlier result instead of scanning every record, which is only
+        correct when term extends the term that produced it, with the same group_filter.
+        """
+        with self._lock:
+            term = term.lower()
+            entries = self._entries
+            
+            # Rechecking most of the records one lookup at a time is slower than a full scan
+            if within is not None and len(within) < len(entries) // 2:
+                return [record_id for record_id in within
+                        if record_id in entries and term in entries[record_id][0]]
+            
+            if group_filter == "All":
+                return [record_id for record_id, (key, _) in entries.items() if term in key]
+            return [record_id for record_id, (key, group_name) in entries.items()
+                    if group_name == group_filter and term in key]
+    
+    def fuzzy_search(self, term: str, group_filter: str = "All", limit: int = 200) -> List[int]:
+        """Return ids of up to limit records that roughly match term, best match first.
+        
+        Substring matches rank first, with prefixes of site or username above the rest. If
+        there aren't enough of those, records found through the trigram index follow: those
+        with the letters of term close together in site or username, then the rest sharing at
+        least FUZZY_MIN_OVERLAP of term's trigrams with site or username, most similar first.
+        """
+        with self._lock:
+            term = term.lower()
+            entries = self._entries
+            scored = []
+            
+            matches = self.search(term, group_filter)
+            for record_id in matches:
+                key = entries[record_id][0]
+                position = key.find(term)
+                if position == 0 or key[position - 1] == '\0':
+                    score = 4.0
+                else:
+                    score = 3.0 - position / len(key)
+                scored.append((-score, len(key), record_id))
+            
+            query_grams = _trigrams(term)
+            if len(matches) < limit and query_grams:
+                if self._postings is None:
+                    self._build_postings()
+                
+                min_shared = math.ceil(len(query_grams) * self.FUZZY_MIN_OVERLAP)
+                
+                # A record sharing min_shared of the query trigrams has at least one of the rarest
+                # len - min_shared + 1 of them, so only those posting lists need reading
+                rarest = sorted(query_grams, key=lambda gram: len(self._postings.get(gram, ())))
+                candidates = set()
+                for gram in rarest[:len(query_grams) - min_shared + 1]:
+                    candidates.update(self._postings.get(gram, ()))
+                candidates.difference_update(matches)
+                
+                for record_id in candidates:
+                    entry = entries.get(record_id)
+                    if entry is None or (group_filter != "All" and entry[1] != group_filter):
+                        continue
+                    
+                    key = entry[0]
+                    fields = key.split('\0')
+                    span = min(_subsequence_span(term, field) for field in fields)
+                    if span <= 2 * len(term):
+                        score = 1.0 + len(term) / span
+                    else:
+                        score = max(_similarity(query_grams, field, min_shared) for field in fields)
+                        if not score:
+                            continue
+                    
+                    scored.append((-score, len(key), record_id))
+            
+            return [record_id for _, _, record_id in heapq.nsmallest(limit, scored)]
+
+
+def _subsequence_span(term: str, text: str) -> float:
+    """Length of the shortest stretch of text, starting at a match of term's first letter,
+    that contains the letters of term in order. Infinite if there is none"""
+    best = float('inf')
+    start = text.find(term[0])
+    while start >= 0:
+        position = start
+        for char in term[1:]:
+            position = text.find(char, position + 1)
+            if position < 0:
+                return best
+        best = min(best, position - start + 1)
+        start = text.find(term[0], start + 1)
+    return best
+
+
+class Settings:
+    """In-memory copy of the settings table.
+    
+    Values are read from memory, writes go through to unlock.db, and callbacks subscribed
+    to a key are called with the new value whenever it changes.
+    """
+    
+    def __init__(self, connections: ConnectionManager, db_file: Path):
+        self.connections = connections
+        self.db_file = db_file
+        self._values: Dict[str, str] = {}
+        self._subscribers: Dict[str, List] = {}
+        self._lock = threading.Lock()
+    
+    def load(self):
+        """Read every setting from the database"""
+        try:
+            rows = self.connections.get(self.db_file).execute("SELECT key, value FROM settings").fetchall()
+            self._values = dict(rows)
+        except Exception as e:
+            _warn("Error loading settings: %s", e)
+    
+    def get(self, key: str, default: str = '') -> str:
+        """Get a setting value"""
+        value = self._values.get(key)
+        return default if value is None else value
+    
+    def get_bool(self, key: str, default: bool = False) -> bool:
+        """Get a '1'/'0' setting as a bool"""
+        return self.get(key, '1' if default else '0') == '1'
+    
+    def get_int(self, key: str, default: int = 0) -> int:
+        """Get a setting as an int, falling back to default if it isn't one"""
+        try:
+            return int(self.get(key, str(default)))
+        except ValueError:
+            return default
+    
+    def set(self, key: str, value: str, force: bool = False) -> bool:
+        """Save a setting value and notify subscribers if it changed, or always with force"""
+        try:
+            with self._lock:
+                with self.connections.transaction(self.db_file) as conn:
+                    conn.execute("INSERT OR REPLACE INTO settings VALUES (?, ?)", (key, value))
+                changed = self._values.get(key) != value
+                self._values[key] = value
+        except Exception as e:
+            _warn("Failed to save setting: %s", e)
+            return False
+        
+        if changed or force:
+            self.notify(key)
+        return True
+    
+    def notify(self, key: str):
+        """Call the setting's subscribers with its current value, e.g. when what it names was edited"""
+        value = self._values.get(key)
+        for callback in list(self._subscribers.get(key, ())):
+            callback(value)
+    
+    def subscribe(self, key: str, callback):
+        """Call callback(value) whenever the setting changes"""
+        self._subscribers.setdefault(key, []).append(callback)
+    
+    def unsubscribe(self, key: str, callback):
+        """Stop calling callback for the setting"""
+        if callback in self._subscribers.get(key, ()):
+            self._subscribers[key].remove(callback)
+
+
+class DatabaseManager:
+    """Handles all database operations and encryption"""
+    
+    REKEY_CHUNK_SIZE = 1000
+    REKEY_PARALLEL_THRESHOLD = 5000
+    KDF_ITERATIONS = 600_000
+    # Default for the bcrypt_target_ms setting: how long checking the master password should take
+    BCRYPT_TARGET_MS = 250
+    # Whether _setup_master_password() can ask for a password. Without that a missing vault
+    # is an error, and nothing is created
+    INTERACTIVE_SETUP = False
+    
+    # Columns selected for Records, in Record field order. Listings leave out the password ciphertext
+    LISTING_COLUMNS = "id, site, username, group_name, password_length"
+    RECORD_COLUMNS = LISTING_COLUMNS + ", password, date_added, date_modified"
+    
+    def __init__(self, db_path: str = "./db"):
+        self.db_path = Path(db_path)
+        self.data_db = self.db_path / "data.db"
+        self.unlock_db = self.db_path / "unlock.db"
+        self.fernet: Optional['Fernet'] = None
+        self._enc_key: Optional[bytes] = None
+        self._key_wrapper: Optional['Fernet'] = None
+        self._changes = RecordChanges()
+        # Writes run on the Tk thread and on background tasks, while the list takes the changes
+        self._changes_lock = threading.Lock()
+        self._custom_themes: Optional[dict] = None
+        self._search_index = SearchIndex()
+        self._query_cache = QueryCache()
+        self.connections = ConnectionManager()
+        self.settings = Settings(self.connections, self.unlock_db)
+        self._ensure_db_setup()
+    
+    def _ensure_db_setup(self):
+        """Verify database directory and files exist"""
+        missing = [db_file for db_file in (self.data_db, self.unlock_db) if not db_file.exists()]
+        if missing:
+            if not self.INTERACTIVE_SETUP:
+                if len(missing) == 2:
+                    raise VaultNotFound(f"No vault in {self.db_path}")
+                raise VaultNotFound(f"Incomplete vault in {self.db_path}: {missing[0].name} is missing")
+            if not self._setup_databases():
+                raise VaultNotFound(f"No vault was set up in {self.db_path}")
+        
+        start = time.perf_counter()
+        self._migrate_databases()
+        # Reported by the app's --startup-trace
+        self.migration_seconds = time.perf_counter() - start
+        
+        self.settings.load()
+        self._fts_enabled = self._ensure_search_index()
+    
+    def close(self):
+        """Close all open database connections"""
+        self.lock()
+        self.connections.close()
+    
+    def unlock(self, password: str) -> bool:
+        """Check the master password and load the encryption key it protects.
+        
+        Returns False for a wrong password. Errors reading the vault are raised rather than
+        shown, so this can run on a background thread.
+        """
+        if not self.verify_master_password(password):
+            return False
+        
+        c = self.connections.get(self.unlock_db).execute(
+            "SELECT enc_key, wrapped_key, kdf_salt, kdf_iterations FROM master")
+        enc_key, wrapped_key, kdf_salt, kdf_iterations = c.fetchone()
+        
+        if wrapped_key:
+            key_wrapper = derive_key_wrapper(password, kdf_salt, kdf_iterations)
+            enc_key = key_wrapper.decrypt(wrapped_key)
+        elif enc_key:
+            # Vaults from before 2.1 stored the key itself, wrap it now
+            key_wrapper = self._wrap_encryption_key(password, enc_key)
+            # Rebuild the file so the plaintext key isn't left behind in a free page
+            self.connections.get(self.unlock_db).execute("VACUUM")
+        else:
+            raise CryptoError("No encryption key found")
+        
+        self._enc_key = enc_key
+        self._key_wrapper = key_wrapper
+        self.fernet = make_cipher(enc_key)
+        
+        self._rehash_master_password(password)
+        self._resume_rekey()
+        if self._backfill_password_lengths():
+            self._query_cache.clear()
+        return True
+    
+    def _bcrypt_rounds(self) -> int:
+        """bcrypt cost for master password hashes, calibrated to the bcrypt_target_ms setting.
+        
+        Calibration runs once per target; the result is stored in the bcrypt_rounds setting
+        along with the target it was measured for. It is never below MIN_BCRYPT_ROUNDS.
+        """
+        target_ms = self.settings.get_int('bcrypt_target_ms', self.BCRYPT_TARGET_MS)
+        rounds = self.settings.get_int('bcrypt_rounds', 0)
+        
+        # Costs stored by earlier versions could be lower
+        if rounds < MIN_BCRYPT_ROUNDS or self.settings.get_int('bcrypt_rounds_target_ms', 0) != target_ms:
+            rounds = calibrate_bcrypt_rounds(target_ms / 1000)
+            self.settings.set('bcrypt_rounds', str(rounds))
+            self.settings.set('bcrypt_rounds_target_ms', str(target_ms))
+        return rounds
+    
+    def _rehash_master_password(self, password: str):
+        """Rehash the (just verified) master password if its cost is below the calibrated one.
+        A hash is never weakened, even if calibration on a slower machine comes out lower"""
+        try:
+            stored_hash = self.connections.get(self.unlock_db).execute("SELECT key FROM master").fetchone()[0]
+            rounds = self._bcrypt_rounds()
+            if bcrypt_cost(stored_hash) >= rounds:
+                return
+            
+            new_hash = hash_master_password(password, rounds)
+            with self.connections.transaction(self.unlock_db) as conn:
+                conn.execute("UPDATE master SET key=?", (new_hash,))
+        except Exception as e:
+            # The old hash still works, so try again next time
+            _warn("Could not rehash master password: %s", e)
+    
+    def warm_up(self):
+        """Load what the main window needs: custom themes, the first page of the list and the
+        search index. Meant for a background thread right after unlock(), before the window shows."""
+        self.get_custom_themes()
+        # This class's methods, which raise, not a subclass's that show errors on screen
+        DatabaseManager.get_records_page(self)
+        self.get_search_index()
+    
+    def get_search_index(self) -> SearchIndex:
+        """The in-memory search index, loaded on first use"""
+        if not self._search_index.loaded:
+            self._load_search_index()
+        return self._search_index
+    
+    def _load_search_index(self):
+        """Read site, username and group of every record into the search index"""
+        try:
+            c = self.connections.get(self.data_db).execute(
+                "SELECT id, site, username, group_name FROM data ORDER BY id")
+            self._search_index.build(c)
+        except Exception as e:
+            _warn("Error loading search index: %s", e)
+            self._search_index.clear()
+    
+    def _backfill_password_lengths(self, chunk_size: int = 1000) -> int:
+        """Fill in password_length for records saved before it existed, returning how many were filled in"""
+        filled = 0
+        try:
+            conn = self.connections.get(self.data_db)
+            while True:
+                rows = conn.execute("SELECT id, password FROM data WHERE password_length IS NULL LIMIT ?",
+                                    (chunk_size,)).fetchall()
+                if not rows:
+                    break
+                with self.connections.transaction(self.data_db):
+                    conn.executemany("UPDATE data SET password_length=? WHERE id=?",
+                                     [(len(self.decrypt_password(token)), record_id) for record_id, token in rows])
+                filled += len(rows)
+        except Exception as e:
+            _warn("Could not fill in password lengths: %s", e)
+        return filled
+    
+    def take_changes(self) -> RecordChanges:
+        """Return the record changes made since the last call, and start tracking afresh"""
+        with self._changes_lock:
+            changes, self._changes = self._changes, RecordChanges()
+        return changes
+    
+    def clear_query_cache(self):
+        """Forget cached listings and search results, so the next calls read the database"""
+        self._query_cache.clear()
+
+    def lock(self):
+        """Forget the encryption key until the vault is unlocked again"""
+        self.fernet = None
+        self._enc_key = None
+        self._key_wrapper = None
+        self._search_index.clear()
+        self._query_cache.clear()
+    
+    def _wrap_encryption_key(self, password: str, enc_key: bytes) -> 'Fernet':
+        """Store enc_key wrapped by a key derived from password, and return that wrapping key"""
+        kdf_salt = os.urandom(16)
+        key_wrapper = derive_key_wrapper(password, kdf_salt, self.KDF_ITERATIONS)
+        
+        with self.connections.transaction(self.unlock_db) as conn:
+            # Overwrite the old key material on disk instead of just marking its space free
+            conn.execute("PRAGMA secure_delete = ON")
+            conn.execute("UPDATE master SET enc_key=NULL, wrapped_key=?, kdf_salt=?, kdf_iterations=?",
+                         (key_wrapper.encrypt(enc_key), kdf_salt, self.KDF_ITERATIONS))
+        
+        return key_wrapper
+    
+    def _create_master_password(self, password: str):
+        """Store the first master password along with a new encryption key"""
+        hash_master = hash_master_password(password, self._bcrypt_rounds())
+        
+        with self.connections.transaction(self.unlock_db) as conn:
+            conn.execute("INSERT INTO master (key) VALUES (?)", (hash_master,))
+            self._wrap_encryption_key(password, new_encryption_key())
+    
+    def _resume_rekey(self):
+        """Finish a key rotation that was interrupted"""
+        try:
+            self._finish_rekey()
+        except Exception as e:
+            # Nothing is swapped until the final commit, so the old key still works
+            _warn("Could not finish interrupted key rotation: %s", e)
+    
+    def _migrate_databases(self):
+        """Bring both databases up to the current schema"""
+        self._run_migrations(self.unlock_db, [
+            self._migrate_unlock_v1,
+            self._migrate_unlock_v2,
+            self._migrate_unlock_v3,
+        ])
+        self._run_migrations(self.data_db, [
+            self._migrate_data_v1,
+            self._migrate_data_v2,
+            self._migrate_data_v3,
+            self._migrate_data_v4,
+            self._migrate_data_v5,
+        ])
+    
+    def _run_migrations(self, db_file: Path, steps: list):
+        """Apply the steps a database hasn't had yet, in order, tracking progress in PRAGMA user_version.
+        
+        Each step runs in its own transaction together with the version bump, so vaults that are
+        already up to date skip straight past and a failed step is retried on the next launch.
+        """
+        version = self.connections.get(db_file).execute("PRAGMA user_version").fetchone()[0]
+        
+        for number, step in enumerate(steps[version:], start=version + 1):
+            try:
+                with self.connections.transaction(db_file) as conn:
+                    step(conn)
+                    conn.execute(f"PRAGMA user_version = {number}")
+            except Exception as e:
+                _warn("Migration of %s to version %d failed: %s", db_file.name, number, e)
+                return
+    
+    def _migrate_unlock_v1(self, conn: sqlite3.Connection):
+        """Wrapped encryption key columns, added in 2.1"""
+        columns = [column[1] for column in conn.execute("PRAGMA table_info(master)").fetchall()]
+        
+        if 'wrapped_key' not in columns:
+            conn.execute("ALTER TABLE master ADD COLUMN wrapped_key varchar(255)")
+            conn.execute("ALTER TABLE master ADD COLUMN kdf_salt varchar(64)")
+            conn.execute("ALTER TABLE master ADD COLUMN kdf_iterations INTEGER")
+    
+    def _migrate_unlock_v2(self, conn: sqlite3.Connection):
+        """Make custom_themes table if it DNE"""
+        conn.execute("""CREATE TABLE IF NOT EXISTS custom_themes(
+            name varchar(100) PRIMARY KEY,
+            colors TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )""")
+    
+    def _migrate_unlock_v3(self, conn: sqlite3.Connection):
+        """Journal for encryption key rotation"""
+        conn.execute("""CREATE TABLE IF NOT EXISTS rekey_journal(
+            wrapped_key varchar(255)
+        )""")
+    
+    def _migrate_data_v1(self, conn: sqlite3.Connection):
+        """Group and date fields, and the groups table, for vaults from before 2.0"""
+        columns = [column[1] for column in conn.execute("PRAGMA table_info(data)").fetchall()]
+        
+        if 'group_name' not in columns:
+            conn.execute("ALTER TABLE data ADD COLUMN group_name varchar(100)")
+        else:
+            conn.execute("UPDATE data SET group_name = NULL WHERE group_name = 'All'")
+        
+        # SQLite can't add a column with a CURRENT_TIMESTAMP default, so fill existing rows instead
+        for column in ('date_added', 'date_modified'):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE data ADD COLUMN {column} TIMESTAMP")
+                conn.execute(f"UPDATE data SET {column} = CURRENT_TIMESTAMP")
+        
+        conn.execute("""CREATE TABLE IF NOT EXISTS groups(
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name varchar(100) UNIQUE NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )""")
+        
+        # Move existing groups from data table to groups table
+        conn.execute("""INSERT OR IGNORE INTO groups (name)
+            SELECT DISTINCT group_name FROM data WHERE group_name IS NOT NULL AND group_name != ''""")
+    
+    def _migrate_data_v2(self, conn: sqlite3.Connection):
+        """Plain text length of the password, so the list can mask it without decrypting"""
+        columns = [column[1] for column in conn.execute("PRAGMA table_info(data)").fetchall()]
+        
+        if 'password_length' not in columns:
+            conn.execute("ALTER TABLE data ADD COLUMN password_length INTEGER")
+        
+        # Lets the backfill at unlock find records without a length without scanning the table
+        conn.execute("""CREATE INDEX IF NOT EXISTS idx_data_missing_length
+            ON data(id) WHERE password_length IS NULL""")
+    
+    def _migrate_data_v3(self, conn: sqlite3.Connection):
+        """Staging table for encryption key rotation"""
+        conn.execute("""CREATE TABLE IF NOT EXISTS rekey_staging(
+            id INTEGER PRIMARY KEY,
+            old_password varchar(100) NOT NULL,
+            password varchar(100) NOT NULL
+        )""")
+    
+    def _migrate_data_v4(self, conn: sqlite3.Connection):
+        """Trigram full-text index over site and username, kept in sync with data by triggers.
+        
+        SQLite builds without FTS5 (or older than 3.34) can't create it. The step still counts as
+        done so later steps aren't held up, searches use LIKE instead, and _ensure_search_index()
+        creates the index on a later launch once SQLite supports it.
+        """
+        try:
+            self._create_search_index(conn)
+        except sqlite3.OperationalError as e:
+            _warn("Search index not available, falling back to LIKE: %s", e)
+    
+    def _create_search_index(self, conn: sqlite3.Connection):
+        """Create the data_fts index and its triggers, and fill it from the data table"""
+        conn.execute("""CREATE VIRTUAL TABLE IF NOT EXISTS data_fts USING fts5(
+            site, username, content='data', content_rowid='id', tokenize='trigram'
+        )""")
+        conn.execute("""CREATE TRIGGER IF NOT EXISTS data_fts_insert AFTER INSERT ON data BEGIN
+            INSERT INTO data_fts(rowid, site, username) VALUES (new.id, new.site, new.username);
+        END""")
+        conn.execute("""CREATE TRIGGER IF NOT EXISTS data_fts_delete AFTER DELETE ON data BEGIN
+            INSERT INTO data_fts(data_fts, rowid, site, username) VALUES ('delete', old.id, old.site, old.username);
+        END""")
+        conn.execute("""CREATE TRIGGER IF NOT EXISTS data_fts_update AFTER UPDATE OF site, username ON data BEGIN
+            INSERT INTO data_fts(data_fts, rowid, site, username) VALUES ('delete', old.id, old.site, old.username);
+            INSERT INTO data_fts(rowid, site, username) VALUES (new.id, new.site, new.username);
+        END""")
+        conn.execute("INSERT INTO data_fts(data_fts) VALUES ('rebuild')")
+    
+    def _migrate_data_v5(self, conn: sqlite3.Connection):
+        """Covering index for listing a group without reading password ciphertexts"""
+        conn.execute("""CREATE INDEX IF NOT EXISTS idx_data_listing
+            ON data(group_name, id, site, username, password_length)""")
+    
+    def _has_search_index(self) -> bool:
+        """Check whether the data_fts index exists and this SQLite build can use it"""
+        try:
+            self.connections.get(self.data_db).execute("SELECT rowid FROM data_fts LIMIT 0").fetchall()
+            return True
+        except sqlite3.Error:
+            return False
+    
+    def _ensure_search_index(self) -> bool:
+        """Check for the data_fts index, creating it if the vault was migrated by a SQLite build
+        without FTS5 and this one has it. Returns whether searches can use it"""
+        if self._has_search_index():
+            return True
+        
+        try:
+            with self.connections.transaction(self.data_db) as conn:
+                self._create_search_index(conn)
+            return True
+        except sqlite3.Error:
+            # Still no FTS5; the migration already said so
+            return False
+    
+    def _search_condition(self, search_term: str) -> Tuple[str, List[Any]]:
+        """SQL condition and parameters matching search_term anywhere in site or username.
+        
+        Uses the trigram index when there is one. Trigrams need at least 3 characters, so
+        shorter terms (and vaults without the index) use LIKE.
+        """
+        if self._fts_enabled and len(search_term) >= 3:
+            # A quoted phrase is matched literally, with quotes inside it doubled
+            phrase = '"' + search_term.replace('"', '""') + '"'
+            return "id IN (SELECT rowid FROM data_fts WHERE data_fts MATCH ?)", [phrase]
+        
+        return "(site LIKE ? OR username LIKE ?)", [f'%{search_term}%', f'%{search_term}%']
+    
+    def _setup_databases(self) -> bool:
+        """Setup databases if they don't exist"""
+        # If setup is declined only what it created is removed, never an existing database
+        created_dir = not self.db_path.exists()
+        created = [db_file for db_file in (self.data_db, self.unlock_db) if not db_file.exists()]
+        try:
+            self.db_path.mkdir(exist_ok=True)
+            
+            with self.connections.transaction(self.data_db) as conn:
+                conn.execute("""CREATE TABLE IF NOT EXISTS data(
+                    id INTEGER PRIMARY KEY,
+                    site varchar(100) NOT NULL,
+                    username varchar(100) NOT NULL,
+                    password varchar(100) NOT NULL,
+                    group_name varchar(100),
+                    date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    date_modified TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    password_length INTEGER
+                )""")
+                
+                # Create groups table
+                conn.execute("""CREATE TABLE IF NOT EXISTS groups(
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name varchar(100) UNIQUE NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )""")
+            
+            with self.connections.transaction(self.unlock_db) as conn:
+                conn.execute("""CREATE TABLE IF NOT EXISTS master(
+                    key varchar(255),
+                    enc_key varchar(255),
+                    wrapped_key varchar(255),
+                    kdf_salt varchar(64),
+                    kdf_iterations INTEGER
+                )""")
+                conn.execute("""CREATE TABLE IF NOT EXISTS settings(
+                    key varchar(100) PRIMARY KEY,
+                    value varchar(255)
+                )""")
+            
+            self._set_default_settings()
+            
+            if not self._has_master_password():
+                setup_success = self._setup_master_password()
+                
+                # Handle if setup fails, like if user cancels before setting password
+                if not setup_success:
+                    self.connections.close()
+                    try:
+                        for db_file in created:
+                            if db_file.exists():
+                                db_file.unlink()
+                        if created_dir and not any(self.db_path.iterdir()):
+                            self.db_path.rmdir()
+                    except Exception as e:
+                        _warn("Failed to clean up database files: %s", e)
+                    
+                    return False
+                
+                return True
+            
+            return True
+        
+        except Exception as e:
+            raise StorageError(f"Failed to setup databases: {e}") from e
+    
+    def _set_default_settings(self):
+        """Set default values for new installs"""
+        try:
+            with self.connections.transaction(self.unlock_db) as conn:
+                c = conn.cursor()
+                
+                c.execute("SELECT COUNT(*) FROM settings")
+                count = c.fetchone()[0]
+                
+                if count == 0:
+                    # New installation - set all defaults
+                    c.execute("INSERT OR IGNORE INTO settings VALUES ('auto_lock_enabled', '1')")
+                    c.execute("INSERT OR IGNORE INTO settings VALUES ('auto_lock_minutes', '5')")
+                    c.execute("INSERT OR IGNORE INTO settings VALUES ('theme', 'Light')")
+                else:
+                    # Existing installation - check for missing settings and add them
+                    # This handles upgrades from older versions
+                    
+                    # Check if theme setting exists
+                    c.execute("SELECT COUNT(*) FROM settings WHERE key='theme'")
+                    if c.fetchone()[0] == 0:
+                        c.execute("INSERT INTO settings VALUES ('theme', 'Light')")
+                    
+                    # Check if auto_lock_enabled exists
+                    c.execute("SELECT COUNT(*) FROM settings WHERE key='auto_lock_enabled'")
+                    if c.fetchone()[0] == 0:
+                        c.execute("INSERT INTO settings VALUES ('auto_lock_enabled', '1')")
+                    
+                    # Check if auto_lock_minutes exists
+                    c.execute("SELECT COUNT(*) FROM settings WHERE key='auto_lock_minutes'")
+                    if c.fetchone()[0] == 0:
+                        c.execute("INSERT INTO settings VALUES ('auto_lock_minutes', '5')")
+        except Exception as e:
+            _warn("Settings initialization failed: %s", e)
+    
+    def get_setting(self, key: str, default: str = '') -> str:
+        """Get a setting value"""
+        return self.settings.get(key, default)
+    
+    def set_setting(self, key: str, value: str, force: bool = False) -> bool:
+        """Set a setting value. With force its subscribers are notified even if it didn't change"""
+        return self.settings.set(key, value, force)
+        
+    def get_custom_themes(self) -> dict:
+        """Return all custom themes as a dict. They are read from the database once and then cached"""
+        if self._custom_themes is not None:
+            return dict(self._custom_themes)
+        
+        result = {}
+        try:
+            c = self.connections.get(self.unlock_db).execute("SELECT name, colors FROM custom_themes ORDER BY name")
+            rows = c.fetchall()
+            for name, colors_json in rows:
+                try:
+                    result[name] = json.loads(colors_json)
+                except Exception:
+                    pass
+            self._custom_themes = result
+        except Exception as e:
+            _warn("Error loading custom themes: %s", e)
+        return dict(result)
+
+    def save_custom_theme(self, name: str, colors: dict) -> bool:
+        """Save custom theme"""
+        try:
+            with self.connections.transaction(self.unlock_db) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO custom_themes (name, colors) VALUES (?, ?)",
+                    (name, json.dumps(colors))
+                )
+            self._custom_themes = None
+        except Exception as e:
+            raise StorageError(f"Failed to save custom theme: {e}") from e
+        # New colours for the active theme have to be applied like a theme change
+        if self.settings.get('theme') == name:
+            self.settings.notify('theme')
+        return True
+
+    def delete_custom_theme(self, name: str) -> bool:
+        """Delete custom theme"""
+        try:
+            with self.connections.transaction(self.unlock_db) as conn:
+                conn.execute("DELETE FROM custom_themes WHERE name=?", (name,))
+            self._custom_themes = None
+            return True
+        except Exception as e:
+            raise StorageError(f"Failed to delete custom theme: {e}") from e
+    
+    def _has_master_password(self) -> bool:
+        """Check if master password is setup"""
+        try:
+            c = self.connections.get(self.unlock_db).execute("SELECT * FROM master")
+            result = c.fetchone()
+            return result is not None
+        except:
+            return False
+    
+    def _setup_master_password(self) -> bool:
+        """Ask for the first master password and create it with _create_master_password().
+        
+        There is no one to ask here, so this declines and VaultNotFound is raised; the app overrides
+        it with a setup window, and sets INTERACTIVE_SETUP.
+        """
+        return False
+    
+    def verify_master_password(self, password: str) -> bool:
+        """Check the master password. Errors reading the vault are raised"""
+        c = self.connections.get(self.unlock_db).execute("SELECT key FROM master")
+        result = c.fetchone()
+        
+        if result:
+            return check_master_password(password, result[0])
+        return False
+    
+    def _query_records(self, query: str, params: Sequence = ()) -> sqlite3.Cursor:
+        """Run a data.db query selecting LISTING_COLUMNS or RECORD_COLUMNS, producing Records"""
+        cursor = self.connections.get(self.data_db).cursor()
+        cursor.row_factory = _record_factory
+        return cursor.execute(query, params)
+    
+    def get_all_records(self, group_filter: str = "All") -> List[Record]:
+        """Return all records, without password ciphertexts"""
+        cache_key = (group_filter, None, None)
+        records = self._query_cache.get(cache_key)
+        if records is not None:
+            return records
+        
+        try:
+            if group_filter == "All":
+                c = self._query_records(f"SELECT {self.LISTING_COLUMNS} FROM data ORDER BY id")
+            else:
+                c = self._query_records(f"SELECT {self.LISTING_COLUMNS} FROM data WHERE group_name=? ORDER BY id",
+                                        (group_filter,))
+            
+            records = c.fetchall()
+            self._query_cache.put(cache_key, records)
+            return records
+        except Exception as e:
+            raise StorageError(f"Failed to retrieve records: {e}") from e
+    
+    def iter_records(self, group_filter: str = "All", batch_size: int = 500) -> Iterator[Record]:
+        """Yield complete records, fetching batch_size rows at a time"""
+        if group_filter == "All":
+            c = self._query_records(f"SELECT {self.RECORD_COLUMNS} FROM data ORDER BY id")
+        else:
+            c = self._query_records(f"SELECT {self.RECORD_COLUMNS} FROM data WHERE group_name=? ORDER BY id",
+                                    (group_filter,))
+        
+        try:
+            while True:
+                batch = c.fetchmany(batch_size)
+                if not batch:
+                    break
+                yield from batch
+        finally:
+            c.close()
+    
+    def get_records_page(self, group_filter: str = "All", search_term: Optional[str] = None,
+                         after_id: int = 0, limit: int = 200) -> List[Record]:
+        """Return up to limit records with an id above after_id, without password ciphertexts, a page at a time.
+        
+        First pages are cached, so going back to a group or search shows it straight away.
+        """
+        cache_key = (group_filter, search_term or None, limit)
+        if after_id == 0:
+            records = self._query_cache.get(cache_key)
+            if records is not None:
+                return records
+        
+        try:
+            query = f"SELECT {self.LISTING_COLUMNS} FROM data WHERE id > ?"
+            params: List[Any] = [after_id]
+            
+            if group_filter != "All":
+                query += " AND group_name=?"
+                params.append(group_filter)
+            
+            if search_term:
+                condition, condition_params = self._search_condition(search_term)
+                query += " AND " + condition
+                params += condition_params
+            
+            query += " ORDER BY id LIMIT ?"
+            params.append(limit)
+            
+            records = self._query_records(query, params).fetchall()
+            if after_id == 0:
+                self._query_cache.put(cache_key, records)
+            return records
+        except Exception as e:
+            raise StorageError(f"Failed to retrieve records: {e}") from e
+    
+    def get_all_groups(self) -> List[str]:
+        """Return all groups from groups table"""
+        try:
+            c = self.connections.get(self.data_db).execute("SELECT name FROM groups ORDER BY name")
+            groups = [row[0] for row in c.fetchall()
+                if row[0] is not None and row[0].strip() != '']
+            
+            # Always add "All" for group at start
+            groups.insert(0, 'All')
+            
+            return groups
+        except Exception as e:
+            _warn("Error getting groups: %s", e)
+            return ['All']
+    
+    def add_group(self, group_name: str) -> bool:
+        """Create new group in the groups table"""
+        try:
+            if not group_name or group_name.strip() == '':
+                return False
+            
+            group_name = group_name.strip()
+            
+            if group_name.lower() == 'all':
+                return False
+            
+            with self.connections.transaction(self.data_db) as conn:
+                conn.execute("INSERT INTO groups (name) VALUES (?)", (group_name,))
+            return True
+        except sqlite3.IntegrityError:
+            # Group already exists
+            return False
+        except Exception as e:
+            raise StorageError(f"Failed to add group: {e}") from e
+    
+    def delete_group(self, group_name: str) -> bool:
+        """Remove a group from the groups table"""
+        try:
+            with self.connections.transaction(self.data_db) as conn:
+                # Delete group from table
+                conn.execute("DELETE FROM groups WHERE name=?", (group_name,))
+                
+                # Set passwords with that group to NULL
+                conn.execute("UPDATE data SET group_name=NULL WHERE group_name=?", (group_name,))
+            
+            with self._changes_lock:
+                self._changes.reset = True
+            self._search_index.rename_group(group_name, None)
+            self._query_cache.invalidate_group(group_name)
+            return True
+        except Exception as e:
+            raise StorageError(f"Failed to delete group: {e}") from e
+    
+    def rename_group(self, old_name: str, new_name: str) -> bool:
+        """Rename a group"""
+        try:
+            if new_name == '':
+                new_name = None
+            
+            with self.connections.transaction(self.data_db) as conn:
+                # Update the groups table with new name
+                if new_name:
+                    conn.execute("UPDATE groups SET name=? WHERE name=?", (new_name, old_name))
+                else:
+                    conn.execute("DELETE FROM groups WHERE name=?", (old_name,))
+                
+                # Update all passwords with this group to new group name
+                conn.execute("UPDATE data SET group_name=? WHERE group_name=?", (new_name, old_name))
+            
+            with self._changes_lock:
+                self._changes.reset = True
+            self._search_index.rename_group(old_name, new_name)
+            self._query_cache.invalidate_group(old_name)
+            if new_name:
+                self._query_cache.invalidate_group(new_name)
+            return True
+        except sqlite3.IntegrityError:
+            raise GroupExistsError(f"Group '{new_name}' already exists!")
+        except Exception as e:
+            raise StorageError(f"Failed to rename group: {e}") from e
+    
+    def search_records(self, search_term: str, group_filter: str = "All", fuzzy: bool = False) -> List[Record]:
+        """Search for records on site or username. Records come without password ciphertexts.
+        
+        With fuzzy, close matches are included as well and the best matches come first.
+        """
+        if fuzzy:
+            record_ids = self.get_search_index().fuzzy_search(search_term, group_filter)
+            records = {record.id: record for record in self.get_records_by_ids(record_ids)}
+            return [records[record_id] for record_id in record_ids if record_id in records]
+        
+        cache_key = (group_filter, search_term, None)
+        records = self._query_cache.get(cache_key)
+        if records is not None:
+            return records
+        
+        try:
+            condition, params = self._search_condition(search_term)
+            query = f"SELECT {self.LISTING_COLUMNS} FROM data WHERE {condition}"
+            
+            if group_filter != "All":
+                query += " AND group_name=?"
+                params.append(group_filter)
+            
+            records = self._query_records(query + " ORDER BY id", params).fetchall()
+            self._query_cache.put(cache_key, records)
+            return records
+        except Exception as e:
+            raise StorageError(f"Failed to search records: {e}") from e
+    
+    def add_record(self, site: str, username: str, password: str, group_name: Optional[str] = None) -> Optional[int]:
+        """Add a new password"""
+        try:
+            encrypted_password = self.fernet.encrypt(password.encode('utf-8'))
+            
+            if group_name == '':
+                group_name = None
+            
+            with self.connections.transaction(self.data_db) as conn:
+                # Add group to groups table if it doesn't exist and is not None
+                if group_name is not None and group_name.strip() != '':
+                    group_name = group_name.strip()
+                    conn.execute("INSERT OR IGNORE INTO groups (name) VALUES (?)", (group_name,))
+                
+                c = conn.execute("""INSERT INTO data (site, username, password, group_name, date_added, date_modified, password_length) 
+                VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (site, username, encrypted_password, group_name, 
+                datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                len(password)))
+                record_id = c.lastrowid
+            
+            with self._changes_lock:
+                self._changes.added.add(record_id)
+            self._search_index.put(record_id, site, username, group_name)
+            self._query_cache.invalidate_record((site, username, group_name))
+            return record_id
+        except Exception as e:
+            raise StorageError(f"Failed to add record: {e}") from e
+
+    def add_records(self, rows: Iterable[Sequence[str]], group_name: Optional[str] = None,
+                    chunk_size: int = 500, progress: Optional[Callable[[int], None]] = None,
+                    cancelled: Optional[Callable[[], bool]] = None) -> int:
+        """Add many passwords and return how many were added.
+        
+        Each row is (site, username, password) or (site, username, password, group_name).
+        Rows are consumed lazily and encrypted/inserted chunk_size at a time, so the
+        whole import never has to be held in memory. Every chunk is committed on its own so
+        readers are never blocked for the whole import. progress(count) is called after each
+        chunk. If cancelled() returns True, or anything fails, the rows added so far are
+        deleted again and the exception is raised, OperationCancelled for a cancel.
+        Errors are raised rather than shown, so this can run on a background thread.
+        """
+        if group_name is not None:
+            group_name = group_name.strip() or None
+        
+        added = 0
+        seen_groups = set()
+        created_groups = []
+        # (after_id, last_id) of every committed chunk
+        inserted = []
+        rows = iter(rows)
+        
+        try:
+            while True:
+                if cancelled and cancelled():
+                    raise OperationCancelled()
+                # Picked up again for every chunk, as the vault may be locked or rekeyed meanwhile
+                fernet = self.fernet
+                if fernet is None:
+                    raise CryptoError("The vault is locked")
+                
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                
+                now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                with self.connections.transaction(self.data_db) as conn:
+                    params = []
+                    for row in chunk:
+                        site, username, password = row[0], row[1], row[2]
+                        row_group = group_name
+                        if len(row) > 3:
+                            row_group = (row[3] or '').strip() or None
+                        
+                        if row_group is not None and row_group not in seen_groups:
+                            if conn.execute("INSERT OR IGNORE INTO groups (name) VALUES (?)", (row_group,)).rowcount:
+                                created_groups.append(row_group)
+                            seen_groups.add(row_group)
+                        
+                        params.append((site, username, fernet.encrypt(password.encode('utf-8')),
+                                       row_group, now, now, len(password)))
+                    
+                    conn.executemany("""INSERT INTO data (site, username, password, group_name, date_added, date_modified, password_length) 
+                    VALUES (?, ?, ?, ?, ?, ?, ?)""", params)
+                    # New rows get the ids after the highest one, and nobody else writes until the commit
+                    last_id = conn.execute("SELECT MAX(id) FROM data").fetchone()[0]
+                inserted.append((last_id - len(params), last_id))
+                added += len(params)
+                
+                if progress:
+                    progress(added)
+        except BaseException:
+            if inserted:
+                with self.connections.transaction(self.data_db) as conn:
+                    conn.executemany("DELETE FROM data WHERE id > ? AND id <= ?", inserted)
+                    conn.executemany("""DELETE FROM groups WHERE name = ?
+                        AND NOT EXISTS (SELECT 1 FROM data WHERE group_name = groups.name)""",
+                                     [(name,) for name in created_groups])
+            raise
+        finally:
+            # Readers may have listed committed chunks meanwhile
+            if inserted:
+                with self._changes_lock:
+                    self._changes.reset = True
+                # An index that isn't loaded yet reads the new rows when it is
+                if self._search_index.loaded:
+                    self._load_search_index()
+                self._query_cache.clear()
+        return added
+
+    def update_record(self, record_id: int, site: str, username: str, password: str, group_name: Optional[str] = None) -> bool:
+        """Update existing password"""
+        try:
+            encrypted_password = self.fernet.encrypt(password.encode('utf-8'))
+            
+            if group_name == '':
+                group_name = None
+            
+            with self.connections.transaction(self.data_db) as conn:
+                # Add group to groups table if it doesn't exist and is not None
+                if group_name is not None and group_name.strip() != '':
+                    group_name = group_name.strip()
+                    conn.execute("INSERT OR IGNORE INTO groups (name) VALUES (?)", (group_name,))
+                
+                previous = conn.execute("SELECT site, username, group_name FROM data WHERE id=?",
+                                        (record_id,)).fetchone()
+                conn.execute("""UPDATE data SET site=?, username=?, password=?, group_name=?, date_modified=?, password_length=? 
+                WHERE id=?""",
+                (site, username, encrypted_password, group_name,
+                datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                len(password),
+                record_id))
+            
+            with self._changes_lock:
+                self._changes.updated.add(record_id)
+            self._search_index.put(record_id, site, username, group_name)
+            self._query_cache.invalidate_record(previous, (site, username, group_name))
+            return True
+        except Exception as e:
+            raise StorageError(f"Failed to update record: {e}") from e
+    
+    def get_record_by_id(self, record_id: int) -> Optional[Record]:
+        """Return one complete record using ID"""
+        try:
+            c = self._query_records(f"SELECT {self.RECORD_COLUMNS} FROM data WHERE id=?", (record_id,))
+            return c.fetchone()
+        except Exception as e:
+            raise StorageError(f"Failed to retrieve record: {e}") from e
+    
+    def get_records_by_ids(self, record_ids: Sequence[int]) -> List[Record]:
+        """Return the records with the given ids, in id order, without password ciphertexts"""
+        if not record_ids:
+            return []
+        try:
+            placeholders = ','.join('?' * len(record_ids))
+            c = self._query_records(
+                f"SELECT {self.LISTING_COLUMNS} FROM data WHERE id IN ({placeholders}) ORDER BY id",
+                list(record_ids))
+            return c.fetchall()
+        except Exception as e:
+            raise StorageError(f"Failed to retrieve records: {e}") from e
+    
+    def get_password(self, record_id: int) -> Optional[str]:
+        """Return the decrypted password of one record"""
+        c = self.connections.get(self.data_db).execute("SELECT password FROM data WHERE id=?", (record_id,))
+        row = c.fetchone()
+        return self.decrypt_password(row[0]) if row else None
+    
+    def get_encrypted_passwords(self, record_ids: Sequence[int]) -> Dict[int, bytes]:
+        """Return the password ciphertexts of several records, by id"""
+        if not record_ids:
+            return {}
+        placeholders = ','.join('?' * len(record_ids))
+        c = self.connections.get(self.data_db).execute(
+            f"SELECT id, password FROM data WHERE id IN ({placeholders})", list(record_ids))
+        return dict(c.fetchall())
+    
+    def delete_record(self, record_id: int) -> bool:
+        """Delete a password"""
+        try:
+            with self.connections.transaction(self.data_db) as conn:
+                previous = conn.execute("SELECT site, username, group_name FROM data WHERE id=?",
+                                        (record_id,)).fetchone()
+                conn.execute("DELETE FROM data WHERE id=?", (record_id,))
+            
+            self._query_cache.invalidate_record(previous)
+            with self._changes_lock:
+                self._changes.added.discard(record_id)
+                self._changes.updated.discard(record_id)
+                self._changes.deleted.add(record_id)
+            self._search_index.remove(record_id)
+            return True
+        except Exception as e:
+            raise StorageError(f"Failed to delete record: {e}") from e
+    
+    def decrypt_password(self, encrypted_password: bytes) -> str:
+        """Decrypt password"""
+        fernet = self.fernet
+        if fernet is None:
+            raise CryptoError("The vault is locked")
+        try:
+            return fernet.decrypt(encrypted_password).decode('utf-8')
+        except Exception as e:
+            raise CryptoError(f"Failed to decrypt password: {e}") from e
+    
+    def change_master_password(self, new_password: str) -> bool:
+        """Update master password. Only the wrapped encryption key is rewritten, not the records.
+        
+        Hashing takes a while, so the app runs this on a background task.
+        """
+        try:
+            enc_key, old_wrapper = self._enc_key, self._key_wrapper
+            if enc_key is None:
+                raise CryptoError("The vault is locked")
+            new_hash = hash_master_password(new_password, self._bcrypt_rounds())
+            
+            with self.connections.transaction(self.unlock_db) as conn:
+                conn.execute("UPDATE master SET key=?", (new_hash,))
+                key_wrapper = self._wrap_encryption_key(new_password, enc_key)
+                # The key of a pending rotation is wrapped with the old password too, so the
+                # rotation can still be finished with the new one
+                pending = conn.execute("SELECT wrapped_key FROM rekey_journal").fetchall()
+                if pending:
+                    conn.execute("UPDATE rekey_journal SET wrapped_key=?",
+                                 (key_wrapper.encrypt(old_wrapper.decrypt(pending[0][0])),))
+            
+            # Unless the vault was locked meanwhile
+            if self._enc_key is enc_key:
+                self._key_wrapper = key_wrapper
+            return True
+        except Exception as e:
+            raise VaultError(f"Failed to change master password: {e}") from e
+    
+    def rotate_encryption_key(self) -> bool:
+        """Re-encrypt all data under a brand new encryption key"""
+        try:
+            key_wrapper = self._key_wrapper
+            if key_wrapper is None:
+                raise CryptoError("The vault is locked")
+            self._begin_rekey(key_wrapper.encrypt(new_encryption_key()))
+            self._finish_rekey()
+            return True
+        except Exception as e:
+            raise VaultError(f"Failed to rotate encryption key: {e}") from e
+    
+    def _begin_rekey(self, new_wrapped_key: bytes):
+        """Journal the new (wrapped) key before any record is touched"""
+        # Staged rows from an abandoned key change are useless with a new key
+        with self.connections.transaction(self.data_db) as conn:
+            conn.execute("DELETE FROM rekey_staging")
+        
+        with self.connections.transaction(self.unlock_db) as conn:
+            conn.execute("DELETE FROM rekey_journal")
+            conn.execute("INSERT INTO rekey_journal VALUES (?)", (new_wrapped_key,))
+    
+    def _finish_rekey(self):
+        """Re-encrypt every record under the journaled key, then swap key and data in one commit.
+        
+        Records are re-encrypted into rekey_staging in committed chunks, so an interrupted key
+        rotation picks up where it left off the next time the vault is unlocked. The final swap
+        attaches unlock.db to the data.db connection so the new ciphertexts and the new key are
+        committed atomically; until then every record is still readable with the old key.
+        """
+        pending = self.connections.get(self.unlock_db).execute("SELECT wrapped_key FROM rekey_journal").fetchall()
+        if not pending:
+            return
+        old_enc_key, key_wrapper = self._enc_key, self._key_wrapper
+        if old_enc_key is None:
+            raise CryptoError("The vault is locked")
+        new_wrapped_key = pending[0][0]
+        new_enc_key = key_wrapper.decrypt(new_wrapped_key)
+        
+        self._stage_reencrypted_records(old_enc_key, new_enc_key)
+        
+        data_conn = self.connections.get(self.data_db)
+        data_conn.execute("ATTACH DATABASE ? AS unlock", (str(self.unlock_db),))
+        try:
+            with self.connections.transaction(self.data_db) as conn:
+                # Pick up rows added or edited after they were staged
+                stale = conn.execute("""SELECT d.id, d.password FROM data d
+                    LEFT JOIN rekey_staging s ON s.id = d.id
+                    WHERE s.id IS NULL OR s.old_password != d.password""").fetchall()
+                if stale:
+                    conn.executemany("INSERT OR REPLACE INTO rekey_staging (id, old_password, password) VALUES (?, ?, ?)",
+                                     reencrypt_chunk(old_enc_key, new_enc_key, stale))
+                
+                conn.execute("""UPDATE data SET password = (SELECT s.password FROM rekey_staging s WHERE s.id = data.id)
+                    WHERE id IN (SELECT id FROM rekey_staging)""")
+                conn.execute("UPDATE unlock.master SET wrapped_key=?", (new_wrapped_key,))
+                conn.execute("DELETE FROM unlock.rekey_journal")
+                conn.execute("DELETE FROM rekey_staging")
+        finally:
+            data_conn.execute("DETACH DATABASE unlock")
+        
+        # A vault locked meanwhile picks the new key up from unlock.db when it's unlocked again
+        if self._enc_key is old_enc_key:
+            self._enc_key = new_enc_key
+            self.fernet = make_cipher(new_enc_key)
+        self._query_cache.clear()
+    
+    def _stage_reencrypted_records(self, old_key: bytes, new_key: bytes):
+        """Re-encrypt records that aren't staged yet, fanning chunks out over a process pool"""
+        conn = self.connections.get(self.data_db)
+        
+        def chunks():
+            last_id = 0
+            while True:
+                rows = conn.execute("""SELECT id, password FROM data
+                    WHERE id > ? AND id NOT IN (SELECT id FROM rekey_staging)
+                    ORDER BY id LIMIT ?""", (last_id, self.REKEY_CHUNK_SIZE)).fetchall()
+                if not rows:
+                    return
+                last_id = rows[-1][0]
+                yield rows
+        
+        def write(staged):
+            with self.connections.transaction(self.data_db) as staging_conn:
+                staging_conn.executemany("INSERT OR REPLACE INTO rekey_staging (id, old_password, password) VALUES (?, ?, ?)",
+                                         staged)
+        
+        remaining = conn.execute("SELECT COUNT(*) FROM data WHERE id NOT IN (SELECT id FROM rekey_staging)").fetchone()[0]
+        workers = os.cpu_count() or 1
+        
+        pool = None
+        if workers > 1 and remaining >= self.REKEY_PARALLEL_THRESHOLD:
+            # Imported here as it's only needed for big vaults, and command line startup time matters
+            from concurrent.futures import ProcessPoolExecutor
+            try:
+                pool = ProcessPoolExecutor(max_workers=workers)
+            except (OSError, NotImplementedError) as e:
+                _warn("Re-encrypting without a process pool: %s", e)
+        
+        if pool is None:
+            for rows in chunks():
+                write(reencrypt_chunk(old_key, new_key, rows))
+            return
+        
+        # Keep a bounded number of chunks in flight and write them back in order
+        with pool:
+            in_flight = deque()
+            for rows in chunks():
+                in_flight.append(pool.submit(reencrypt_chunk, old_key, new_key, rows))
+                if len(in_flight) >= workers * 2:
+                    write(in_flight.popleft().result())
+            while in_flight:
+                write(in_flight.popleft().result())
+
+
+def iter_import_rows(file, source: str) -> Iterator[Tuple[str, str, str]]:
+    """Yield (site, username, password) from a Chrome or Firefox CSV export"""
+    # Only needed for imports, so not loaded at startup
+    import csv
+    
+    csv_reader = csv.reader(file)
+    
+    # Skip the header row, unless the first row already looks like data
+    first_row = next(csv_reader, None)
+    if first_row is None:
+        return
+    if any(field.startswith('http') for field in first_row):
+        csv_reader = chain([first_row], csv_reader)
+    
+    for row in csv_reader:
+        if source == "Chrome":
+            if len(row) < 4:
+                continue
+            site = row[0] or row[1]
+            username = row[2]
+            password = row[3]
+        else:
+            if len(row) < 3:
+                continue
+            site = row[0]
+            username = row[1]
+            password = row[2]
+        
+        if site and password:
+            yield site, username, password
+
+
+def export_records_csv(db_manager, filename: str, group_filter: str = "All",
+                       progress=None, batch_size: int = 500, cancelled=None) -> int:
+    """Decrypt records and write them to a CSV file, returning how many were written.
+    
+    Records are streamed from the database, and the CSV is written to a temporary file
+    that only replaces filename once every row was written. progress(count) is called
+    after each batch. If cancelled() returns True, or a password can't be decrypted (say the
+    vault was locked meanwhile), filename is left untouched and OperationCancelled or
+    CryptoError is raised.
+    """
+    # Only needed for exports, so not loaded at startup
+    import csv
+    import tempfile
+    
+    target = Path(filename)
+    fd, temp_name = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=target.parent)
+    exported_count = 0
+    
+    try:
+        with os.fdopen(fd, 'w', newline='', encoding='utf-8') as file:
+            csv_writer = csv.writer(file)
+            csv_writer.writerow(['site', 'username', 'password', 'group'])
+            
+            for record in db_manager.iter_records(group_filter, batch_size):
+                if cancelled and cancelled():
+                    raise OperationCancelled()
+                
+                password = db_manager.decrypt_password(record.encrypted_password)
+                csv_writer.writerow([record.site, record.username, password, record.group_name or ''])
+                exported_count += 1
+                
+                if progress and exported_count % batch_size == 0:
+                    progress(exported_count)
+        
+        if exported_count == 0:
+            os.unlink(temp_name)
+            return 0
+        
+        os.replace(temp_name, target)
+        if progress:
+            progress(exported_count)
+        return exported_count
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise